@@ -4,7 +4,7 @@ Recherche TOUS les minerais autour d'une position spécifique
 """
 
 from src.modern_region_reader import ModernRegionReader
-import math
+from src.radius_query import RadiusQuery, chunks_in_radius
 from collections import defaultdict
 
 # ============================================================
@@ -59,14 +59,12 @@ print("=" * 70)
 
 reader = ModernRegionReader(WORLD_PATH)
 
-# Calculer la zone de chunks à scanner
-chunk_x_min = (TARGET_X - SEARCH_RADIUS) // 16
-chunk_x_max = (TARGET_X + SEARCH_RADIUS) // 16
-chunk_z_min = (TARGET_Z - SEARCH_RADIUS) // 16
-chunk_z_max = (TARGET_Z + SEARCH_RADIUS) // 16
+query = RadiusQuery(reader)
 
-print(f"\n📦 Chunks à scanner: X {chunk_x_min} à {chunk_x_max}, Z {chunk_z_min} à {chunk_z_max}")
-print(f"   ({(chunk_x_max - chunk_x_min + 1) * (chunk_z_max - chunk_z_min + 1)} chunks)\n")
+# Calculer les chunks qui intersectent le disque de recherche
+chunks = chunks_in_radius(TARGET_X, TARGET_Z, SEARCH_RADIUS)
+
+print(f"\n📦 Chunks à scanner: {len(chunks)} (dans le rayon uniquement)\n")
 
 # Dictionnaire pour stocker tous les minerais par type
 ores_by_type = defaultdict(list)
@@ -79,38 +77,20 @@ for ore_type, ids in ORE_TYPES.items():
         all_ore_ids.append(ore_id)
         ore_id_to_type[ore_id] = ore_type
 
-# Scanner les chunks
-chunks_scanned = 0
+# Scanner uniquement les chunks de la zone (résultats déjà triés par distance)
 print("🔍 Scan en cours...\n")
 
-for nbt_data, chunk_x, chunk_z in reader.iterate_chunks(show_progress=False):
-    # Filtrer par zone
-    if not (chunk_x_min <= chunk_x <= chunk_x_max and chunk_z_min <= chunk_z <= chunk_z_max):
-        continue
-    
-    chunks_scanned += 1
-    
-    # Scanner le chunk pour TOUS les minerais
-    found = reader.scan_chunk_for_blocks(nbt_data, all_ore_ids, y_min=-64, y_max=320)
-    
-    # Organiser par type et calculer la distance
-    for x_local, y, z_local, block_id in found:
-        abs_x = chunk_x * 16 + x_local
-        abs_z = chunk_z * 16 + z_local
-        
-        # Calculer la distance 2D
-        distance = math.sqrt((abs_x - TARGET_X)**2 + (abs_z - TARGET_Z)**2)
-        
-        if distance <= SEARCH_RADIUS:
-            ore_type = ore_id_to_type[block_id]
-            ores_by_type[ore_type].append({
-                'x': abs_x,
-                'y': y,
-                'z': abs_z,
-                'distance': distance,
-                'block_id': block_id
-            })
-
+for hit in query.find(TARGET_X, TARGET_Z, SEARCH_RADIUS, all_ore_ids, y_min=-64, y_max=320):
+    ore_type = ore_id_to_type[hit.block_id]
+    ores_by_type[ore_type].append({
+        'x': hit.x,
+        'y': hit.y,
+        'z': hit.z,
+        'distance': hit.distance,
+        'block_id': hit.block_id
+    })
+
+chunks_scanned = query.chunks_scanned
 print(f"✓ {chunks_scanned} chunks scannés\n")
 
 # Afficher les résultats par type de minerai
@@ -122,9 +102,6 @@ for ore_type in ORE_TYPES.keys():
     ores = ores_by_type.get(ore_type, [])
     
     if ores:
-        # Trier par distance
-        ores.sort(key=lambda o: o['distance'])
-        
         print(f"\n{ore_type}: {len(ores)} trouvé(s)")
         print("-" * 70)
         
@@ -4,7 +4,7 @@ Recherche les diamants autour d'une position spécifique avec positions exactes
 """
 
 from src.modern_region_reader import ModernRegionReader
-import math
+from src.radius_query import RadiusQuery, chunks_in_radius
 
 # Configuration
 WORLD_PATH = "./world"
@@ -23,53 +23,30 @@ print("=" * 70)
 
 reader = ModernRegionReader(WORLD_PATH)
 
-# Calculer la zone de chunks à scanner
-chunk_x_min = (TARGET_X - SEARCH_RADIUS) // 16
-chunk_x_max = (TARGET_X + SEARCH_RADIUS) // 16
-chunk_z_min = (TARGET_Z - SEARCH_RADIUS) // 16
-chunk_z_max = (TARGET_Z + SEARCH_RADIUS) // 16
+query = RadiusQuery(reader)
 
-print(f"\n📦 Chunks à scanner: X {chunk_x_min} à {chunk_x_max}, Z {chunk_z_min} à {chunk_z_max}")
-print(f"   ({(chunk_x_max - chunk_x_min + 1) * (chunk_z_max - chunk_z_min + 1)} chunks)\n")
+# Calculer les chunks qui intersectent le disque de recherche
+chunks = chunks_in_radius(TARGET_X, TARGET_Z, SEARCH_RADIUS)
 
-diamonds = []
+print(f"\n📦 Chunks à scanner: {len(chunks)} (dans le rayon uniquement)\n")
 
-# Scanner les chunks dans la zone
-chunks_scanned = 0
-for nbt_data, chunk_x, chunk_z in reader.iterate_chunks(show_progress=False):
-    # Filtrer par zone
-    if not (chunk_x_min <= chunk_x <= chunk_x_max and chunk_z_min <= chunk_z <= chunk_z_max):
-        continue
-    
-    chunks_scanned += 1
-    
-    # Scanner le chunk pour les diamants
-    found = reader.scan_chunk_for_blocks(nbt_data, DIAMOND_IDS, y_min=-64, y_max=20)
-    
-    # Convertir en coordonnées absolues et calculer la distance
-    for x_local, y, z_local, block_id in found:
-        abs_x = chunk_x * 16 + x_local
-        abs_z = chunk_z * 16 + z_local
-        
-        # Calculer la distance 2D par rapport au point cible
-        distance = math.sqrt((abs_x - TARGET_X)**2 + (abs_z - TARGET_Z)**2)
-        
-        if distance <= SEARCH_RADIUS:
-            diamonds.append({
-                'x': abs_x,
-                'y': y,
-                'z': abs_z,
-                'distance': distance,
-                'type': block_id
-            })
+# Scanner uniquement les chunks de la zone (distances précalculées, triées)
+diamonds = [
+    {
+        'x': hit.x,
+        'y': hit.y,
+        'z': hit.z,
+        'distance': hit.distance,
+        'type': hit.block_id
+    }
+    for hit in query.find(TARGET_X, TARGET_Z, SEARCH_RADIUS, DIAMOND_IDS, y_min=-64, y_max=20)
+]
+chunks_scanned = query.chunks_scanned
 
 print(f"✓ {chunks_scanned} chunks scannés")
 print(f"\n💎 {len(diamonds)} diamant(s) trouvé(s) !\n")
 
 if diamonds:
-    # Trier par distance
-    diamonds.sort(key=lambda d: d['distance'])
-    
     print("=" * 70)
     print("📍 COORDONNÉES DES DIAMANTS (triées par distance)")
     print("=" * 70)
@@ -4,7 +4,11 @@ Génère une page HTML interactive avec tous les minerais trouvés
 """
 
 from src.modern_region_reader import ModernRegionReader
-import math
+from src.radius_query import RadiusQuery, chunks_in_radius
+import os
+import sys
+import base64
+from array import array
 from collections import defaultdict
 import json
 from datetime import datetime
@@ -17,6 +21,7 @@ TARGET_X = -88
 TARGET_Z = 23
 SEARCH_RADIUS = 32
 OUTPUT_HTML = "output/carte_minerais.html"
+PAYLOAD_CHUNK_BYTES = 3 * 16384  # Taille des blocs base64 écrits dans le fichier
 
 # Définition des minerais
 ORE_TYPES = {
@@ -68,15 +73,14 @@ print("=" * 70)
 
 reader = ModernRegionReader(WORLD_PATH)
 
-# Calculer la zone de chunks
-chunk_x_min = (TARGET_X - SEARCH_RADIUS) // 16
-chunk_x_max = (TARGET_X + SEARCH_RADIUS) // 16
-chunk_z_min = (TARGET_Z - SEARCH_RADIUS) // 16
-chunk_z_max = (TARGET_Z + SEARCH_RADIUS) // 16
+query = RadiusQuery(reader)
+
+# Calculer les chunks qui intersectent le disque de recherche
+chunks = chunks_in_radius(TARGET_X, TARGET_Z, SEARCH_RADIUS)
 
 print(f"\n📍 Position centrale: X={TARGET_X}, Z={TARGET_Z}")
 print(f"🔍 Rayon de recherche: {SEARCH_RADIUS} blocs")
-print(f"📦 Chunks: X {chunk_x_min} à {chunk_x_max}, Z {chunk_z_min} à {chunk_z_max}\n")
+print(f"📦 Chunks: {len(chunks)} (dans le rayon uniquement)\n")
 
 # Collecter les minerais
 ores_by_type = defaultdict(list)
@@ -90,85 +94,124 @@ for ore_type, data in ORE_TYPES.items():
 
 print("🔍 Scan des chunks...\n")
 
-chunks_scanned = 0
-for nbt_data, chunk_x, chunk_z in reader.iterate_chunks(show_progress=False):
-    if not (chunk_x_min <= chunk_x <= chunk_x_max and chunk_z_min <= chunk_z <= chunk_z_max):
-        continue
-    
-    chunks_scanned += 1
-    found = reader.scan_chunk_for_blocks(nbt_data, all_ore_ids, y_min=-64, y_max=320)
-    
-    for x_local, y, z_local, block_id in found:
-        abs_x = chunk_x * 16 + x_local
-        abs_z = chunk_z * 16 + z_local
-        distance = math.sqrt((abs_x - TARGET_X)**2 + (abs_z - TARGET_Z)**2)
-        
-        if distance <= SEARCH_RADIUS:
-            ore_type = ore_id_to_type[block_id]
-            ores_by_type[ore_type].append({
-                'x': abs_x,
-                'y': y,
-                'z': abs_z,
-                'distance': distance,
-                'deepslate': 'deepslate' in block_id
-            })
+for hit in query.find(TARGET_X, TARGET_Z, SEARCH_RADIUS, all_ore_ids, y_min=-64, y_max=320):
+    ore_type = ore_id_to_type[hit.block_id]
+    ores_by_type[ore_type].append({
+        'x': hit.x,
+        'y': hit.y,
+        'z': hit.z,
+        'distance': hit.distance,
+        'deepslate': 'deepslate' in hit.block_id
+    })
 
+chunks_scanned = query.chunks_scanned
 print(f"✓ {chunks_scanned} chunks scannés")
 
-# Générer le HTML
-html_content = f"""<!DOCTYPE html>
+# ============================================================
+# PAYLOAD COMPACT
+# ============================================================
+# Chaque minerai est encodé sur 4 entiers 32 bits little-endian :
+#   [x, y, z, type_index | deepslate << 8]
+# Les enregistrements sont triés par distance pour que les listes côté
+# navigateur soient directement dans le bon ordre.
+ore_type_names = list(ORE_TYPES.keys())
+
+records = []
+for type_index, ore_type in enumerate(ore_type_names):
+    for ore in ores_by_type.get(ore_type, []):
+        flags = type_index | (0x100 if ore['deepslate'] else 0)
+        records.append((ore['distance'], ore['x'], ore['y'], ore['z'], flags))
+
+records.sort()
+
+payload = array('i')
+for _, x, y, z, flags in records:
+    payload.extend((x, y, z, flags))
+
+if sys.byteorder == 'big':
+    payload.byteswap()
+
+payload_bytes = payload.tobytes()
+del records, payload
+
+# Statistiques globales
+total_ores = sum(len(ores) for ores in ores_by_type.values())
+types_found = len([t for t, o in ores_by_type.items() if o])
+
+types_meta = [
+    {
+        'name': ore_type,
+        'emoji': ORE_TYPES[ore_type]['emoji'],
+        'color': ORE_TYPES[ore_type]['color'],
+        'count': len(ores_by_type.get(ore_type, []))
+    }
+    for ore_type in ore_type_names
+]
+
+meta = {
+    'centerX': TARGET_X,
+    'centerZ': TARGET_Z,
+    'radius': SEARCH_RADIUS,
+    'total': total_ores,
+    'types': types_meta
+}
+
+# ============================================================
+# GÉNÉRATION HTML (écriture incrémentale)
+# ============================================================
+HTML_HEAD = """<!DOCTYPE html>
 <html lang="fr">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Carte des Minerais - Minecraft</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
             color: #fff;
             padding: 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: rgba(0, 0, 0, 0.7);
             border-radius: 15px;
             padding: 30px;
             box-shadow: 0 10px 40px rgba(0, 0, 0, 0.5);
-        }}
+        }
         
-        h1 {{
+        h1 {
             text-align: center;
             font-size: 2.5em;
             margin-bottom: 10px;
             text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.5);
-        }}
+        }
         
-        .info-box {{
+        .info-box {
             background: rgba(255, 255, 255, 0.1);
             padding: 15px;
             border-radius: 10px;
             margin-bottom: 30px;
             text-align: center;
-        }}
+        }
         
-        .filters {{
+        .filters {
             display: flex;
             flex-wrap: wrap;
             gap: 10px;
             margin-bottom: 30px;
             justify-content: center;
-        }}
+        }
         
-        .filter-btn {{
+        .filter-btn {
             padding: 10px 20px;
             border: none;
             border-radius: 5px;
@@ -179,25 +222,39 @@ html_content = f"""<!DOCTYPE html>
             display: flex;
             align-items: center;
             gap: 5px;
-        }}
+            opacity: 0.4;
+        }
         
-        .filter-btn:hover {{
+        .filter-btn:hover {
             transform: scale(1.05);
             box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }}
+        }
         
-        .filter-btn.active {{
+        .filter-btn.active {
             box-shadow: 0 0 20px currentColor;
-        }}
+            opacity: 1;
+        }
+        
+        .plot {
+            display: flex;
+            justify-content: center;
+            margin-bottom: 30px;
+        }
         
-        .ore-section {{
+        #ore-canvas {
+            background: #1a1a1a;
+            border-radius: 10px;
+            max-width: 100%;
+        }
+        
+        .ore-section {
             margin-bottom: 30px;
             background: rgba(255, 255, 255, 0.05);
             padding: 20px;
             border-radius: 10px;
-        }}
+        }
         
-        .ore-header {{
+        .ore-header {
             display: flex;
             align-items: center;
             gap: 10px;
@@ -206,186 +263,297 @@ html_content = f"""<!DOCTYPE html>
             padding: 10px;
             background: rgba(255, 255, 255, 0.1);
             border-radius: 5px;
-        }}
+        }
         
-        .ore-header:hover {{
+        .ore-header:hover {
             background: rgba(255, 255, 255, 0.15);
-        }}
+        }
         
-        .ore-emoji {{
+        .ore-emoji {
             font-size: 2em;
-        }}
+        }
         
-        .ore-title {{
+        .ore-title {
             font-size: 1.5em;
             font-weight: bold;
-        }}
+        }
         
-        .ore-count {{
+        .ore-count {
             margin-left: auto;
             background: rgba(255, 255, 255, 0.2);
             padding: 5px 15px;
             border-radius: 20px;
-        }}
+        }
         
-        .ore-list {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
-            gap: 10px;
-            max-height: 400px;
+        .ore-list {
+            position: relative;
+            height: 400px;
             overflow-y: auto;
-            padding: 10px;
-        }}
+        }
         
-        .ore-item {{
+        .ore-spacer {
+            position: relative;
+        }
+        
+        .ore-item {
+            position: absolute;
+            left: 0;
+            right: 10px;
+            height: 32px;
+            display: flex;
+            align-items: center;
+            gap: 20px;
             background: rgba(255, 255, 255, 0.1);
-            padding: 10px;
+            padding: 0 10px;
             border-radius: 5px;
             border-left: 3px solid;
-            transition: all 0.3s;
-        }}
+        }
         
-        .ore-item:hover {{
+        .ore-item:hover {
             background: rgba(255, 255, 255, 0.2);
-            transform: translateX(5px);
-        }}
+        }
         
-        .coords {{
+        .coords {
             font-family: 'Courier New', monospace;
             font-weight: bold;
-        }}
+        }
         
-        .distance {{
+        .distance {
             color: #FFD700;
             font-size: 0.9em;
-        }}
+        }
         
-        .deepslate {{
+        .deepslate {
             background: rgba(100, 100, 100, 0.3);
-        }}
+        }
         
-        .stats {{
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             margin-top: 30px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: rgba(255, 255, 255, 0.1);
             padding: 20px;
             border-radius: 10px;
             text-align: center;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 2em;
             font-weight: bold;
             color: #FFD700;
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             margin-top: 5px;
             opacity: 0.8;
-        }}
+        }
         
-        .hidden {{
+        .hidden {
             display: none;
-        }}
+        }
         
-        ::-webkit-scrollbar {{
+        ::-webkit-scrollbar {
             width: 10px;
-        }}
+        }
         
-        ::-webkit-scrollbar-track {{
+        ::-webkit-scrollbar-track {
             background: rgba(255, 255, 255, 0.1);
             border-radius: 5px;
-        }}
+        }
         
-        ::-webkit-scrollbar-thumb {{
+        ::-webkit-scrollbar-thumb {
             background: rgba(255, 255, 255, 0.3);
             border-radius: 5px;
-        }}
+        }
         
-        ::-webkit-scrollbar-thumb:hover {{
+        ::-webkit-scrollbar-thumb:hover {
             background: rgba(255, 255, 255, 0.5);
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>⛏️ Carte des Minerais - Minecraft</h1>
-        
-        <div class="info-box">
-            <div><strong>📍 Position centrale:</strong> X={TARGET_X}, Z={TARGET_Z}</div>
-            <div><strong>🔍 Rayon de recherche:</strong> {SEARCH_RADIUS} blocs</div>
-            <div><strong>📅 Généré le:</strong> {datetime.now().strftime('%d/%m/%Y à %H:%M:%S')}</div>
-        </div>
-        
-        <div class="filters">
-"""
-
-# Ajouter les boutons de filtre
-for ore_type, data in ORE_TYPES.items():
-    count = len(ores_by_type.get(ore_type, []))
-    html_content += f"""
-            <button class="filter-btn active" 
-                    data-ore="{ore_type}"
-                    style="background-color: {data['color']}; color: #000;">
-                <span>{data['emoji']}</span>
-                <span>{ore_type} ({count})</span>
-            </button>
 """
 
-html_content += """
+HTML_BODY = """
+        <div class="filters" id="filters"></div>
+        
+        <div class="plot">
+            <canvas id="ore-canvas" width="800" height="800"></canvas>
         </div>
         
-        <div id="ore-sections">
+        <div id="ore-sections"></div>
 """
 
-# Ajouter les sections pour chaque minerai
-for ore_type, data in ORE_TYPES.items():
-    ores = ores_by_type.get(ore_type, [])
-    if not ores:
-        continue
-    
-    ores.sort(key=lambda o: o['distance'])
-    
-    html_content += f"""
-        <div class="ore-section" data-ore-section="{ore_type}">
-            <div class="ore-header" onclick="toggleSection('{ore_type}')">
-                <span class="ore-emoji">{data['emoji']}</span>
-                <span class="ore-title">{ore_type}</span>
-                <span class="ore-count">{len(ores)} trouvé(s)</span>
-            </div>
-            <div class="ore-list" id="list-{ore_type}">
-"""
-    
-    for i, ore in enumerate(ores[:100], 1):  # Limiter à 100 par type
-        deepslate_class = "deepslate" if ore['deepslate'] else ""
-        html_content += f"""
-                <div class="ore-item {deepslate_class}" style="border-color: {data['color']}">
-                    <div class="coords">X={ore['x']}, Y={ore['y']}, Z={ore['z']}</div>
-                    <div class="distance">📏 {ore['distance']:.1f}m</div>
-                    {'<div>🪨 Deepslate</div>' if ore['deepslate'] else ''}
-                </div>
-"""
-    
-    if len(ores) > 100:
-        html_content += f"<div class='ore-item'>... et {len(ores) - 100} autres</div>"
-    
-    html_content += """
-            </div>
-        </div>
+# Le script client : décode le payload, dessine le canvas et virtualise les listes
+HTML_SCRIPT = """
+    <script>
+        const ROW_HEIGHT = 36;
+        const OVERSCAN = 10;
+        
+        // Décoder le payload base64 en Int32Array (4 entiers par minerai)
+        const raw = atob(document.getElementById('ore-payload').textContent.trim());
+        const bytes = new Uint8Array(raw.length);
+        for (let i = 0; i < raw.length; i++) {
+            bytes[i] = raw.charCodeAt(i);
+        }
+        const ORES = new Int32Array(bytes.buffer);
+        const COUNT = ORES.length / 4;
+        
+        // Index des enregistrements par type (déjà triés par distance)
+        const byType = META.types.map(t => new Uint32Array(t.count));
+        const fill = new Uint32Array(META.types.length);
+        for (let i = 0; i < COUNT; i++) {
+            const t = ORES[i * 4 + 3] & 0xFF;
+            byType[t][fill[t]++] = i;
+        }
+        
+        const enabled = META.types.map(() => true);
+        
+        // Canvas : vue de dessus X/Z
+        const canvas = document.getElementById('ore-canvas');
+        const ctx = canvas.getContext('2d');
+        
+        function drawPlot() {
+            const size = canvas.width;
+            const scale = size / (META.radius * 2 + 2);
+            const cx = size / 2;
+            const cz = size / 2;
+            
+            ctx.fillStyle = '#1a1a1a';
+            ctx.fillRect(0, 0, size, size);
+            
+            ctx.strokeStyle = 'rgba(255, 255, 255, 0.3)';
+            ctx.beginPath();
+            ctx.arc(cx, cz, META.radius * scale, 0, Math.PI * 2);
+            ctx.stroke();
+            
+            const dot = Math.max(1, Math.floor(scale));
+            META.types.forEach((type, t) => {
+                if (!enabled[t]) {
+                    return;
+                }
+                ctx.fillStyle = type.color;
+                const idx = byType[t];
+                for (let k = 0; k < idx.length; k++) {
+                    const i = idx[k] * 4;
+                    const px = cx + (ORES[i] - META.centerX) * scale;
+                    const pz = cz + (ORES[i + 2] - META.centerZ) * scale;
+                    ctx.fillRect(px, pz, dot, dot);
+                }
+            });
+            
+            ctx.fillStyle = '#FFFFFF';
+            ctx.fillRect(cx - 3, cz - 3, 6, 6);
+        }
+        
+        // Listes virtualisées : seules les lignes visibles existent dans le DOM
+        function renderRows(list, t) {
+            const idx = byType[t];
+            const type = META.types[t];
+            const spacer = list.firstChild;
+            const first = Math.max(0, Math.floor(list.scrollTop / ROW_HEIGHT) - OVERSCAN);
+            const last = Math.min(idx.length, Math.ceil((list.scrollTop + list.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+            
+            const rows = [];
+            for (let k = first; k < last; k++) {
+                const i = idx[k] * 4;
+                const x = ORES[i], y = ORES[i + 1], z = ORES[i + 2];
+                const deepslate = (ORES[i + 3] & 0x100) !== 0;
+                const distance = Math.hypot(x - META.centerX, z - META.centerZ);
+                rows.push(
+                    `<div class="ore-item${deepslate ? ' deepslate' : ''}" ` +
+                    `style="top: ${k * ROW_HEIGHT}px; border-color: ${type.color}">` +
+                    `<span>${k + 1}.</span>` +
+                    `<span class="coords">X=${x}, Y=${y}, Z=${z}</span>` +
+                    `<span class="distance">📏 ${distance.toFixed(1)}m</span>` +
+                    (deepslate ? '<span>🪨 Deepslate</span>' : '') +
+                    `</div>`
+                );
+            }
+            spacer.innerHTML = rows.join('');
+        }
+        
+        const filters = document.getElementById('filters');
+        const sections = document.getElementById('ore-sections');
+        
+        META.types.forEach((type, t) => {
+            const btn = document.createElement('button');
+            btn.className = 'filter-btn active';
+            btn.style.backgroundColor = type.color;
+            btn.style.color = '#000';
+            btn.innerHTML = `<span>${type.emoji}</span><span>${type.name} (${type.count})</span>`;
+            filters.appendChild(btn);
+            
+            let section = null;
+            if (type.count > 0) {
+                section = document.createElement('div');
+                section.className = 'ore-section';
+                section.innerHTML =
+                    `<div class="ore-header">` +
+                    `<span class="ore-emoji">${type.emoji}</span>` +
+                    `<span class="ore-title">${type.name}</span>` +
+                    `<span class="ore-count">${type.count} trouvé(s)</span>` +
+                    `</div>` +
+                    `<div class="ore-list"><div class="ore-spacer" ` +
+                    `style="height: ${type.count * ROW_HEIGHT}px"></div></div>`;
+                sections.appendChild(section);
+                
+                const list = section.querySelector('.ore-list');
+                let pending = false;
+                list.addEventListener('scroll', () => {
+                    if (pending) {
+                        return;
+                    }
+                    pending = true;
+                    requestAnimationFrame(() => {
+                        pending = false;
+                        renderRows(list, t);
+                    });
+                });
+                section.querySelector('.ore-header').addEventListener('click', () => {
+                    list.classList.toggle('hidden');
+                    renderRows(list, t);
+                });
+                renderRows(list, t);
+            }
+            
+            btn.addEventListener('click', () => {
+                btn.classList.toggle('active');
+                enabled[t] = btn.classList.contains('active');
+                if (section) {
+                    section.classList.toggle('hidden', !enabled[t]);
+                }
+                drawPlot();
+            });
+        });
+        
+        drawPlot();
+    </script>
+</body>
+</html>
 """
 
-# Statistiques globales
-total_ores = sum(len(ores) for ores in ores_by_type.values())
-types_found = len([t for t, o in ores_by_type.items() if o])
+# Créer le dossier output s'il n'existe pas
+os.makedirs(os.path.dirname(OUTPUT_HTML) or '.', exist_ok=True)
 
-html_content += f"""
+# Écrire le fichier HTML au fil de l'eau (pas de grosse chaîne en mémoire)
+with open(OUTPUT_HTML, 'w', encoding='utf-8') as f:
+    f.write(HTML_HEAD)
+    f.write(f"""        
+        <div class="info-box">
+            <div><strong>📍 Position centrale:</strong> X={TARGET_X}, Z={TARGET_Z}</div>
+            <div><strong>🔍 Rayon de recherche:</strong> {SEARCH_RADIUS} blocs</div>
+            <div><strong>📅 Généré le:</strong> {datetime.now().strftime('%d/%m/%Y à %H:%M:%S')}</div>
         </div>
-        
+""")
+    f.write(HTML_BODY)
+    f.write(f"""        
         <div class="stats">
             <div class="stat-card">
                 <div class="stat-value">{total_ores}</div>
@@ -407,39 +575,18 @@ html_content += f"""
     </div>
     
     <script>
-        // Filtres
-        document.querySelectorAll('.filter-btn').forEach(btn => {{
-            btn.addEventListener('click', function() {{
-                this.classList.toggle('active');
-                const oreType = this.dataset.ore;
-                const section = document.querySelector(`[data-ore-section="${{oreType}}"]`);
-                if (section) {{
-                    section.classList.toggle('hidden');
-                }}
-            }});
-        }});
-        
-        // Toggle sections
-        function toggleSection(oreType) {{
-            const list = document.getElementById(`list-${{oreType}}`);
-            if (list.style.display === 'none') {{
-                list.style.display = 'grid';
-            }} else {{
-                list.style.display = 'none';
-            }}
-        }}
+        const META = {json.dumps(meta, ensure_ascii=False)};
     </script>
-</body>
-</html>
-"""
-
-# Créer le dossier output s'il n'existe pas
-import os
-os.makedirs('output', exist_ok=True)
-
-# Écrire le fichier HTML
-with open(OUTPUT_HTML, 'w', encoding='utf-8') as f:
-    f.write(html_content)
+    <script type="application/octet-stream" id="ore-payload">
+""")
+    
+    # Encoder le payload par blocs (multiples de 3 octets pour un base64 continu)
+    for offset in range(0, len(payload_bytes), PAYLOAD_CHUNK_BYTES):
+        f.write(base64.b64encode(payload_bytes[offset:offset + PAYLOAD_CHUNK_BYTES]).decode('ascii'))
+        f.write('\n')
+    
+    f.write("    </script>\n")
+    f.write(HTML_SCRIPT)
 
 print(f"\n✅ Carte HTML générée avec succès !")
 print(f"📂 Fichier: {OUTPUT_HTML}")
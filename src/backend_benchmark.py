@@ -0,0 +1,299 @@
+"""
+Benchmark comparatif des backends de lecture sur un monde synthétique.
+
+Chaque backend enregistré scanne le même monde (format 1.13-1.17, lisible par
+tous les backends) ; les résultats, y compris l'analyse d'exposition, doivent
+être identiques avant qu'un backend plus rapide puisse être adopté.
+
+Usage:
+    python -m src.backend_benchmark [--chunks 16] [--backends modern anvil]
+"""
+
+import argparse
+import io
+import random
+import struct
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+from nbt import nbt
+
+from .config import DIMENSION_Y_RANGES, RESOURCE_GROUPS
+from .exposure import ExposureTracker
+from .modern_region_reader import VERSION_NON_SPANNING
+from .reader_backend import available_backends, create_backend
+
+
+# Blocs de remplissage des sections synthétiques
+_FILLER_BLOCKS = ["minecraft:stone", "minecraft:air", "minecraft:water", "minecraft:gravel"]
+
+# DataVersion de 1.18 : sections à la racine du chunk (sections/block_states)
+_VERSION_ROOT_SECTIONS = 2860
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Résultat d'un backend sur le monde synthétique.
+    """
+    backend: str
+    seconds: float  # Durée du scan complet
+    chunks: int  # Chunks lus
+    hits: List[Tuple[int, int, int, str]]  # Blocs trouvés (x, y, z, block_id), triés
+    data_version: int = 0  # DataVersion du monde synthétique
+    exposed: List[Tuple[int, int, int]] = field(default_factory=list)  # Blocs exposés (x, y, z), triés
+
+    @property
+    def chunks_per_second(self) -> float:
+        """Débit du backend."""
+        return self.chunks / self.seconds if self.seconds else 0.0
+
+
+def _pack_block_states(indices: np.ndarray, palette_size: int, spanning: bool) -> np.ndarray:
+    """Empaquette 4096 indices de palette en longs uint64 (format 1.13-1.17)."""
+    bits = max(4, (palette_size - 1).bit_length())
+    if spanning:
+        # Flux de bits continu, bit de poids faible en premier
+        stream = ((indices[:, None].astype(np.uint64) >> np.arange(bits, dtype=np.uint64)) & 1)
+        stream = stream.astype(np.uint8).reshape(-1)
+        stream = np.concatenate([stream, np.zeros((-stream.size) % 64, dtype=np.uint8)])
+        longs = np.packbits(stream, bitorder='little').view('<u8')
+    else:
+        per_long = 64 // bits
+        padded = np.zeros(-(-4096 // per_long) * per_long, dtype=np.uint64)
+        padded[:4096] = indices
+        shifts = np.arange(per_long, dtype=np.uint64) * np.uint64(bits)
+        longs = np.bitwise_or.reduce(padded.reshape(-1, per_long) << shifts, axis=1)
+    return longs.astype(np.uint64)
+
+
+def _synthetic_chunk(chunk_x: int, chunk_z: int, data_version: int, rng: random.Random) -> bytes:
+    """Construit un chunk NBT compressé (zlib) avec des minerais aléatoires."""
+    ores = [block for blocks in RESOURCE_GROUPS.values() for block in blocks]
+    root_sections = data_version >= _VERSION_ROOT_SECTIONS
+    root = nbt.NBTFile()
+    root.tags.append(nbt.TAG_Int(name="DataVersion", value=data_version))
+    level = root if root_sections else nbt.TAG_Compound(name="Level")
+    level.tags.append(nbt.TAG_Int(name="xPos", value=chunk_x))
+    level.tags.append(nbt.TAG_Int(name="zPos", value=chunk_z))
+    if not root_sections:
+        level.tags.append(nbt.TAG_List(name="TileEntities", type=nbt.TAG_Compound))
+
+    sections = nbt.TAG_List(name="sections" if root_sections else "Sections", type=nbt.TAG_Compound)
+    for section_y in range(8):
+        names = _FILLER_BLOCKS + rng.sample(ores, rng.randint(0, 4))
+        if rng.random() < 0.3:
+            # Grande palette : 5 à 6 bits par bloc (indices chevauchants avant 1.16)
+            names += [f"minecraft:filler_{i}" for i in range(rng.randint(12, 40))]
+
+        weights = np.full(len(names), 0.2 / len(names))
+        weights[0] += 0.8
+        indices = np.array(rng.choices(range(len(names)), weights=weights.tolist(), k=4096),
+                           dtype=np.uint16)
+
+        section = nbt.TAG_Compound()
+        section.tags.append(nbt.TAG_Byte(name="Y", value=section_y))
+        # 1.18+ : palette et données dans block_states ; avant : Palette et BlockStates
+        container = nbt.TAG_Compound(name="block_states") if root_sections else section
+        palette = nbt.TAG_List(name="palette" if root_sections else "Palette", type=nbt.TAG_Compound)
+        for name in names:
+            entry = nbt.TAG_Compound()
+            entry.tags.append(nbt.TAG_String(name="Name", value=name))
+            palette.tags.append(entry)
+        container.tags.append(palette)
+        states = nbt.TAG_Long_Array(name="data" if root_sections else "BlockStates")
+        longs = _pack_block_states(indices, len(names), data_version < VERSION_NON_SPANNING)
+        # anvil-parser, une fois importé, écrit les TAG_Long_Array en non signé
+        states.update_fmt(len(longs))
+        unsigned = states.fmt.format.endswith("Q")
+        states.value = (longs if unsigned else longs.view(np.int64)).tolist()
+        container.tags.append(states)
+        if root_sections:
+            section.tags.append(container)
+        sections.tags.append(section)
+
+    level.tags.append(sections)
+    if not root_sections:
+        root.tags.append(level)
+
+    buffer = io.BytesIO()
+    root.write_file(buffer=buffer)
+    return zlib.compress(buffer.getvalue())
+
+
+def write_synthetic_world(
+    world_path: str,
+    chunks: int = 16,
+    data_version: int = 2586,
+    seed: int = 0
+) -> Path:
+    """
+    Écrit un monde synthétique d'une région (r.0.0.mca).
+
+    Args:
+        world_path: Dossier du monde à créer
+        chunks: Nombre de chunks générés (au plus 1024)
+        data_version: DataVersion des chunks (ex: 2586 = 1.16.5, 2230 = 1.15.2 ;
+            2975 = 1.18.2, lu seulement par le backend modern)
+        seed: Graine aléatoire
+
+    Returns:
+        Chemin du fichier de région écrit
+    """
+    rng = random.Random(seed)
+    region_file = Path(world_path) / "region" / "r.0.0.mca"
+    region_file.parent.mkdir(parents=True, exist_ok=True)
+
+    header = bytearray(8192)
+    body = bytearray()
+    sector = 2
+    for slot in sorted(rng.sample(range(1024), min(chunks, 1024))):
+        local_x, local_z = slot % 32, slot // 32
+        payload = _synthetic_chunk(local_x, local_z, data_version, rng)
+        blob = struct.pack(">IB", len(payload) + 1, 2) + payload
+        blob += b"\0" * ((-len(blob)) % 4096)
+        sectors = len(blob) // 4096
+        header[4 * slot:4 * slot + 4] = struct.pack(">I", (sector << 8) | sectors)
+        header[4096 + 4 * slot:4096 + 4 * slot + 4] = struct.pack(">I", 1)
+        body += blob
+        sector += sectors
+
+    region_file.write_bytes(bytes(header + body))
+    return region_file
+
+
+def benchmark_backend(
+    backend: str,
+    world_path: str,
+    block_ids: List[str],
+    y_min: int = 0,
+    y_max: int = 255
+) -> BenchmarkResult:
+    """
+    Scanne tout le monde avec un backend.
+
+    Args:
+        backend: Nom du backend
+        world_path: Chemin du monde
+        block_ids: Blocs recherchés
+        y_min: Hauteur minimale
+        y_max: Hauteur maximale
+
+    Returns:
+        Résultat du backend
+    """
+    reader = create_backend(backend, world_path)
+    hits = []
+    chunks = 0
+
+    start = time.perf_counter()
+    for chunk, chunk_x, chunk_z in reader.iterate_chunks(show_progress=False):
+        chunks += 1
+        for x, y, z, block_id in reader.scan_chunk_for_blocks(chunk, block_ids, y_min, y_max):
+            hits.append((chunk_x * 16 + x, y, chunk_z * 16 + z, block_id))
+    seconds = time.perf_counter() - start
+
+    hits.sort()
+    return BenchmarkResult(backend=backend, seconds=seconds, chunks=chunks, hits=hits,
+                           exposed=exposed_hits(reader, block_ids, y_min, y_max))
+
+
+def exposed_hits(reader, block_ids: List[str], y_min: int, y_max: int) -> List[Tuple[int, int, int]]:
+    """
+    Analyse d'exposition avec un backend (passe séparée, hors chronométrage).
+
+    Args:
+        reader: Lecteur du backend
+        block_ids: Blocs recherchés
+        y_min: Hauteur minimale
+        y_max: Hauteur maximale
+
+    Returns:
+        Positions (x, y, z) des blocs exposés, triées
+    """
+    # Import différé : resource_finder importe le registre des backends
+    from .resource_finder import ResourceLocation
+
+    tracker = ExposureTracker(*DIMENSION_Y_RANGES["overworld"])
+    locations = []
+    for chunk, chunk_x, chunk_z in reader.iterate_chunks(show_progress=False):
+        chunk_locations = [
+            ResourceLocation(x=chunk_x * 16 + x, y=y, z=chunk_z * 16 + z, block_id=block_id, resource_type="")
+            for x, y, z, block_id in reader.scan_chunk_for_blocks(chunk, block_ids, y_min, y_max)
+        ]
+        tracker.process_chunk(chunk_x, chunk_z, reader.chunk_nbt(chunk), chunk_locations)
+        locations.extend(chunk_locations)
+    tracker.finish()
+
+    return sorted((loc.x, loc.y, loc.z) for loc in locations if loc.exposed)
+
+
+def run_benchmark(
+    backends: Optional[List[str]] = None,
+    chunks: int = 16,
+    data_versions: Tuple[int, ...] = (2586, 2230),
+    world_dir: Optional[str] = None
+) -> Tuple[List[BenchmarkResult], bool]:
+    """
+    Compare les backends sur des mondes synthétiques (un par DataVersion).
+
+    Args:
+        backends: Backends à comparer (défaut: tous les backends enregistrés)
+        chunks: Nombre de chunks par monde
+        data_versions: Formats testés (défaut: 1.16 et 1.15, indices chevauchants)
+        world_dir: Dossier où écrire les mondes (défaut: dossier temporaire)
+
+    Returns:
+        Tuple (résultats de chaque backend pour chaque monde, résultats identiques)
+    """
+    backends = backends or available_backends()
+    block_ids = [block for blocks in RESOURCE_GROUPS.values() for block in blocks]
+    results = []
+    identical = True
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base_dir = Path(world_dir or tmp_dir)
+        for data_version in data_versions:
+            world_path = base_dir / f"synthetic_{data_version}"
+            write_synthetic_world(str(world_path), chunks=chunks, data_version=data_version)
+
+            world_results = [benchmark_backend(name, str(world_path), block_ids) for name in backends]
+            for result in world_results:
+                result.data_version = data_version
+            reference = world_results[0]
+            identical &= all(
+                result.hits == reference.hits and result.exposed == reference.exposed
+                for result in world_results
+            )
+            results.extend(world_results)
+
+    return results, identical
+
+
+def main():
+    """Lance le benchmark et affiche le tableau comparatif."""
+    parser = argparse.ArgumentParser(description="Benchmark des backends de lecture")
+    parser.add_argument("--chunks", type=int, default=16, help="Chunks par monde synthétique")
+    parser.add_argument("--backends", nargs="+", choices=available_backends(),
+                        help="Backends à comparer (défaut: tous)")
+    args = parser.parse_args()
+
+    results, identical = run_benchmark(args.backends, chunks=args.chunks)
+
+    print(f"{'format':>7} {'backend':<12} {'chunks':>7} {'blocs':>8} {'exposés':>8} "
+          f"{'secondes':>9} {'chunks/s':>9}")
+    for result in results:
+        print(f"{result.data_version:>7} {result.backend:<12} {result.chunks:>7} {len(result.hits):>8} "
+              f"{len(result.exposed):>8} {result.seconds:>9.3f} {result.chunks_per_second:>9.1f}")
+
+    print("✓ Résultats identiques" if identical else "❌ Résultats différents entre backends")
+    raise SystemExit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Module de requêtes groupées : plusieurs recherches (x, z, rayon, ressources)
+traitées en une seule passe sur le monde.
+"""
+
+import json
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from tqdm import tqdm
+
+from .config import get_resource_blocks, RESOURCE_Y_DISTRIBUTION
+from .reader_backend import ReaderBackend
+from .radius_query import RadiusHit, chunks_in_radius, group_chunks_by_region
+
+
+@dataclass
+class TargetQuery:
+    """
+    Une recherche autour d'une position (ex: la base d'un joueur).
+    """
+    name: str  # Nom de la requête (ex: "base_alice")
+    x: int  # Centre X (en blocs)
+    z: int  # Centre Z (en blocs)
+    radius: float  # Rayon de recherche horizontal (en blocs)
+    resources: List[str]  # Ressources recherchées (ex: ["diamond", "iron"])
+
+
+@dataclass
+class TargetResult:
+    """
+    Résultat d'une requête : les blocs trouvés par ressource, triés par distance.
+    """
+    query: TargetQuery
+    hits: Dict[str, List[RadiusHit]] = field(default_factory=dict)
+
+
+def load_queries(path: str) -> List[TargetQuery]:
+    """
+    Charge une liste de requêtes depuis un fichier JSON.
+
+    Format attendu :
+        [{"name": "base_alice", "x": -88, "z": 23, "radius": 64, "resources": ["diamond", "iron"]}, ...]
+
+    Args:
+        path: Chemin du fichier JSON
+
+    Returns:
+        Liste des requêtes
+
+    Raises:
+        ValueError: Si une requête est invalide ou une ressource inconnue
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    if not isinstance(entries, list):
+        raise ValueError(f"Le fichier {path} doit contenir une liste de requêtes")
+
+    queries = []
+    for i, entry in enumerate(entries):
+        try:
+            query = TargetQuery(
+                name=str(entry.get("name", f"requete_{i + 1}")),
+                x=int(entry["x"]),
+                z=int(entry["z"]),
+                radius=float(entry["radius"]),
+                resources=list(entry["resources"])
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Requête {i + 1} invalide dans {path}: {e}")
+
+        # Valide les noms de ressources (lève ValueError si inconnue)
+        for resource_name in query.resources:
+            get_resource_blocks(resource_name)
+
+        queries.append(query)
+
+    return queries
+
+
+class BatchQueryRunner:
+    """
+    Exécute plusieurs requêtes en lisant chaque chunk nécessaire une seule fois.
+    """
+
+    def __init__(self, reader: ReaderBackend):
+        """
+        Initialise l'exécuteur.
+
+        Args:
+            reader: Lecteur de région à utiliser (backend et dimension, voir create_backend())
+        """
+        self.reader = reader
+        self.chunks_scanned = 0
+
+    def run(
+        self,
+        queries: List[TargetQuery],
+        show_progress: bool = True
+    ) -> List[TargetResult]:
+        """
+        Exécute toutes les requêtes en une seule passe.
+
+        Args:
+            queries: Requêtes à exécuter
+            show_progress: Afficher la progression
+
+        Returns:
+            Un résultat par requête, dans le même ordre
+        """
+        results = [
+            TargetResult(query=q, hits={name: [] for name in q.resources})
+            for q in queries
+        ]
+
+        # Pour chaque requête : bloc -> ressource et plage Y par ressource
+        block_to_resource = []
+        y_ranges = []
+        for q in queries:
+            mapping = {}
+            for resource_name in q.resources:
+                for block_id in get_resource_blocks(resource_name):
+                    mapping[block_id] = resource_name
+            block_to_resource.append(mapping)
+            y_ranges.append({
+                name: RESOURCE_Y_DISTRIBUTION.get(name, (-64, 320))
+                for name in q.resources
+            })
+
+        # Union des chunks nécessaires : chunk -> requêtes qui le couvrent
+        chunk_queries: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for i, q in enumerate(queries):
+            for chunk in chunks_in_radius(q.x, q.z, q.radius):
+                chunk_queries[chunk].append(i)
+
+        regions = group_chunks_by_region(list(chunk_queries.keys()))
+        self.chunks_scanned = 0
+
+        for (region_x, region_z), slots in tqdm(
+            sorted(regions.items()), desc="Régions", disable=not show_progress
+        ):
+            region_file = self.reader.get_region_file(region_x, region_z)
+            if not self.reader.has_region(region_file):
+                continue
+
+            if hasattr(self.reader, "read_chunks"):
+                chunks = self.reader.read_chunks(region_file, slots)
+            else:
+                # Lecteur sans accès chunk par chunk : région entière, filtrée
+                wanted = set(slots)
+                chunks = (
+                    (chunk, chunk_x % 32, chunk_z % 32)
+                    for chunk, chunk_x, chunk_z in self.reader.iterate_chunks(region_file, show_progress=False)
+                    if (chunk_x % 32, chunk_z % 32) in wanted
+                )
+
+            try:
+                for nbt_data, local_x, local_z in chunks:
+                    chunk_x = region_x * 32 + local_x
+                    chunk_z = region_z * 32 + local_z
+                    query_indices = chunk_queries[(chunk_x, chunk_z)]
+                    self.chunks_scanned += 1
+
+                    # Union des blocs et des hauteurs recherchés dans ce chunk
+                    block_ids = set()
+                    y_min, y_max = 320, -64
+                    for i in query_indices:
+                        block_ids.update(block_to_resource[i])
+                        for low, high in y_ranges[i].values():
+                            y_min = min(y_min, low)
+                            y_max = max(y_max, high)
+
+                    found = self.reader.scan_chunk_for_blocks(
+                        nbt_data, list(block_ids), y_min, y_max
+                    )
+
+                    # Router chaque bloc vers les requêtes qui le couvrent
+                    for x_local, y, z_local, block_id in found:
+                        abs_x = chunk_x * 16 + x_local
+                        abs_z = chunk_z * 16 + z_local
+
+                        for i in query_indices:
+                            resource_name = block_to_resource[i].get(block_id)
+                            if resource_name is None:
+                                continue
+
+                            low, high = y_ranges[i][resource_name]
+                            if not (low <= y <= high):
+                                continue
+
+                            q = queries[i]
+                            distance_sq = (abs_x - q.x) ** 2 + (abs_z - q.z) ** 2
+                            if distance_sq <= q.radius * q.radius:
+                                results[i].hits[resource_name].append(RadiusHit(
+                                    x=abs_x,
+                                    y=y,
+                                    z=abs_z,
+                                    block_id=block_id,
+                                    distance=math.sqrt(distance_sq)
+                                ))
+            except Exception as e:
+                if show_progress:
+                    tqdm.write(f"Erreur région r.{region_x}.{region_z}.mca: {e}")
+                continue
+
+        for result in results:
+            for hits in result.hits.values():
+                hits.sort(key=lambda h: h.distance)
+
+        return results
+
+
+def export_batch_results(
+    results: List[TargetResult],
+    output_path: str,
+    include_locations: bool = False
+) -> Path:
+    """
+    Exporte les résultats d'un lot de requêtes en JSON (un bloc par requête).
+
+    Args:
+        results: Résultats des requêtes
+        output_path: Chemin du fichier de sortie
+        include_locations: Inclure la liste complète des emplacements
+
+    Returns:
+        Chemin du fichier créé
+    """
+    report = []
+    for result in results:
+        q = result.query
+        resources = {}
+        for resource_name, hits in result.hits.items():
+            entry = {
+                "total_blocs": len(hits),
+                "plus_proche": {
+                    "x": hits[0].x,
+                    "y": hits[0].y,
+                    "z": hits[0].z,
+                    "distance": round(hits[0].distance, 2)
+                } if hits else None
+            }
+            if include_locations:
+                entry["emplacements"] = [
+                    {
+                        "x": h.x,
+                        "y": h.y,
+                        "z": h.z,
+                        "block_id": h.block_id,
+                        "distance": round(h.distance, 2)
+                    }
+                    for h in hits
+                ]
+            resources[resource_name] = entry
+
+        report.append({
+            "nom": q.name,
+            "centre_x": q.x,
+            "centre_z": q.z,
+            "rayon": q.radius,
+            "ressources": resources
+        })
+
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    return output_file
+
+
+if __name__ == "__main__":
+    print("Module batch_query chargé avec succès ✓")
@@ -0,0 +1,181 @@
+"""
+Table globale d'internement des noms de blocs et matcher compilé
+(IDs exacts, jokers "*_ore", expressions régulières "re:...").
+
+Les palettes identiques (très nombreuses dans un monde) ne sont comparées
+qu'une seule fois : le masque palette → blocs recherchés est mémorisé.
+"""
+
+import fnmatch
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Pattern, Sequence, Tuple
+
+import numpy as np
+
+
+# Nombre maximal de palettes mémorisées par matcher avant remise à zéro
+MAX_MEMOISED_PALETTES = 65536
+
+# Préfixe d'un motif à interpréter comme expression régulière
+REGEX_PREFIX = "re:"
+
+
+class BlockNameTable:
+    """
+    Table d'internement : nom de bloc → petit entier, partagée par tout le processus.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def intern(self, name: str) -> int:
+        """
+        Retourne l'identifiant entier d'un nom de bloc (l'attribue si nouveau).
+
+        Args:
+            name: Nom du bloc (ex: "minecraft:diamond_ore")
+
+        Returns:
+            Identifiant entier stable pour la durée du processus
+        """
+        block_id = self._ids.get(name)
+        if block_id is None:
+            with self._lock:
+                block_id = self._ids.get(name)
+                if block_id is None:
+                    block_id = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = block_id
+        return block_id
+
+    def intern_all(self, names: Iterable[str]) -> Tuple[int, ...]:
+        """Interne une palette complète."""
+        return tuple(self.intern(name) for name in names)
+
+    def name(self, block_id: int) -> str:
+        """Retourne le nom associé à un identifiant."""
+        return self._names[block_id]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+# Table unique du processus
+BLOCK_NAMES = BlockNameTable()
+
+
+def _compile_pattern(pattern: str) -> Pattern:
+    """Convertit un motif (exact, joker ou "re:...") en expression régulière."""
+    if pattern.startswith(REGEX_PREFIX):
+        return re.compile(pattern[len(REGEX_PREFIX):])
+    return re.compile(fnmatch.translate(pattern))
+
+
+def is_pattern(block_id: str) -> bool:
+    """Indique si un ID de bloc est un motif (joker ou expression régulière)."""
+    return block_id.startswith(REGEX_PREFIX) or any(c in block_id for c in "*?[")
+
+
+class BlockMatcher:
+    """
+    Matcher compilé d'un ensemble d'IDs de blocs et de motifs.
+
+    Exemples de motifs:
+        "minecraft:diamond_ore"      ID exact
+        "*_ore"                      joker (fnmatch)
+        "re:minecraft:(deepslate_)?gold_ore"   expression régulière (match complet)
+    """
+
+    def __init__(self, patterns: Sequence[str], names: BlockNameTable = BLOCK_NAMES):
+        """
+        Compile les motifs.
+
+        Args:
+            patterns: IDs exacts et/ou motifs
+            names: Table d'internement à utiliser
+        """
+        self.patterns = tuple(patterns)
+        self.names = names
+        self._exact = {p for p in self.patterns if not is_pattern(p)}
+        self._regexes = [_compile_pattern(p) for p in self.patterns if is_pattern(p)]
+
+        # Résultat mémorisé par identifiant interné, puis par palette complète
+        self._id_matches: Dict[int, bool] = {}
+        self._palette_masks: Dict[Tuple[int, ...], np.ndarray] = {}
+
+    def matches(self, name: str) -> bool:
+        """
+        Indique si un nom de bloc correspond au matcher.
+
+        Args:
+            name: Nom du bloc
+
+        Returns:
+            True si le bloc est recherché
+        """
+        block_id = self.names.intern(name)
+        result = self._id_matches.get(block_id)
+        if result is None:
+            result = name in self._exact or any(r.fullmatch(name) for r in self._regexes)
+            self._id_matches[block_id] = result
+        return result
+
+    def palette_mask(self, palette: Sequence[str]) -> np.ndarray:
+        """
+        Retourne le masque des entrées de palette recherchées (mémorisé par palette).
+
+        Args:
+            palette: Noms des blocs de la palette d'une section
+
+        Returns:
+            Tableau booléen de même longueur que la palette
+        """
+        key = self.names.intern_all(palette)
+        mask = self._palette_masks.get(key)
+        if mask is None:
+            mask = np.fromiter(
+                (self.matches(name) for name in palette), dtype=bool, count=len(palette)
+            )
+            mask.flags.writeable = False
+            if len(self._palette_masks) >= MAX_MEMOISED_PALETTES:
+                self._palette_masks.clear()
+            self._palette_masks[key] = mask
+        return mask
+
+    def cache_info(self) -> Dict[str, int]:
+        """Retourne la taille des mémos du matcher."""
+        return {
+            "noms_testes": len(self._id_matches),
+            "palettes_memorisees": len(self._palette_masks)
+        }
+
+
+@lru_cache(maxsize=256)
+def _cached_matcher(patterns: Tuple[str, ...]) -> BlockMatcher:
+    """Matcher partagé par liste de motifs (les mémos profitent à tous les appels)."""
+    return BlockMatcher(patterns)
+
+
+def compile_matcher(block_ids) -> BlockMatcher:
+    """
+    Retourne le matcher compilé d'une liste d'IDs/motifs (partagé entre les appels).
+
+    Args:
+        block_ids: Liste d'IDs de blocs et de motifs, ou BlockMatcher déjà compilé
+
+    Returns:
+        Matcher compilé
+    """
+    if isinstance(block_ids, BlockMatcher):
+        return block_ids
+    if isinstance(block_ids, str):
+        block_ids = [block_ids]
+    return _cached_matcher(tuple(block_ids))
+
+
+if __name__ == "__main__":
+    print("Module block_matcher chargé avec succès ✓")
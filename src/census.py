@@ -0,0 +1,355 @@
+"""
+Recensement complet des blocs par niveau Y (et par région) en une seule passe.
+Chaque section est comptée par bincount de ses indices de palette ; les sections
+uniformes (palette d'un seul bloc) sont comptées sans décodage.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from tqdm import tqdm
+
+from .config import APP_CONFIG, DIMENSION_Y_RANGES
+from .chunk_cache import CACHE_Y_RANGE, ChunkResultCache, pack_array, unpack_array
+from .modern_region_reader import decode_section_indices, iter_chunk_sections, payload_digest
+from .reader_backend import create_backend
+
+
+class BlockCensus:
+    """
+    Matrice de comptage (bloc × Y) pour une plage de hauteurs donnée.
+    """
+
+    def __init__(self, y_min: Optional[int] = None, y_max: Optional[int] = None,
+                 dtype=np.int64):
+        """
+        Initialise un recensement vide.
+
+        Args:
+            y_min: Hauteur minimale comptée (défaut: APP_CONFIG["world_min_y"])
+            y_max: Hauteur maximale comptée (défaut: APP_CONFIG["world_max_y"])
+            dtype: Type des compteurs
+        """
+        self.y_min = APP_CONFIG["world_min_y"] if y_min is None else y_min
+        self.y_max = APP_CONFIG["world_max_y"] if y_max is None else y_max
+        self.names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.counts = np.zeros((0, self.height), dtype=dtype)
+
+    @property
+    def height(self) -> int:
+        """Nombre de niveaux Y couverts."""
+        return self.y_max - self.y_min + 1
+
+    def block_index(self, name: str) -> int:
+        """
+        Retourne la ligne d'un bloc dans la matrice (l'ajoute si nouveau).
+
+        Args:
+            name: Nom du bloc
+
+        Returns:
+            Indice de ligne
+        """
+        row = self._index.get(name)
+        if row is None:
+            row = len(self.names)
+            self._index[name] = row
+            self.names.append(name)
+            if row >= self.counts.shape[0]:
+                grown = np.zeros((max(16, 2 * self.counts.shape[0]), self.height),
+                                 dtype=self.counts.dtype)
+                grown[:self.counts.shape[0]] = self.counts
+                self.counts = grown
+        return row
+
+    def add_section(self, palette: List[str], indices: Optional[np.ndarray], base_y: int):
+        """
+        Ajoute une section au recensement.
+
+        Args:
+            palette: Noms des blocs de la palette
+            indices: 4096 indices de palette (ordre x + z*16 + y*256), None si uniforme
+            base_y: Y du bas de la section
+        """
+        # Niveaux de la section dans la plage recensée
+        first = max(base_y, self.y_min)
+        last = min(base_y + 15, self.y_max)
+        if first > last:
+            return
+
+        rows = np.array([self.block_index(name) for name in palette], dtype=np.intp)
+        columns = slice(first - self.y_min, last - self.y_min + 1)
+
+        if indices is None or len(palette) == 1:
+            # Section uniforme : 256 blocs par niveau, sans décodage
+            self.counts[rows[0], columns] += 256
+            return
+
+        # bincount de (y_local, indice) : une ligne de palette par niveau
+        palette_size = len(palette)
+        levels = np.arange(4096, dtype=np.intp) // 256
+        per_level = np.bincount(
+            levels * palette_size + np.minimum(indices, palette_size - 1),
+            minlength=16 * palette_size
+        ).reshape(16, palette_size)[first - base_y:last - base_y + 1]
+
+        # np.add.at gère les palettes contenant deux fois le même nom
+        np.add.at(self.counts[:, columns], rows, per_level.T)
+
+    def merge(self, other: "BlockCensus"):
+        """
+        Ajoute les comptes d'un autre recensement (même plage Y).
+
+        Args:
+            other: Recensement à fusionner
+        """
+        if (other.y_min, other.y_max) != (self.y_min, self.y_max):
+            raise ValueError("Les recensements doivent couvrir la même plage Y")
+        rows = np.array([self.block_index(name) for name in other.names], dtype=np.intp)
+        if len(rows):
+            self.counts[rows] += other.matrix()
+
+    def add_matrix(self, names: List[str], matrix: np.ndarray, y_min: int):
+        """
+        Ajoute une matrice (bloc × Y) couvrant une autre plage de hauteurs ;
+        seuls les niveaux communs aux deux plages sont comptés.
+
+        Args:
+            names: Noms des blocs (lignes de la matrice)
+            matrix: Comptes par bloc et par niveau
+            y_min: Y de la première colonne de la matrice
+        """
+        first = max(y_min, self.y_min)
+        last = min(y_min + matrix.shape[1] - 1, self.y_max)
+        if first > last:
+            return
+        levels = matrix[:, first - y_min:last - y_min + 1]
+        present = np.flatnonzero(levels.any(axis=1))  # Blocs absents de la plage commune : ignorés
+        rows = np.array([self.block_index(names[i]) for i in present], dtype=np.intp)
+        if len(rows):
+            self.counts[rows, first - self.y_min:last - self.y_min + 1] += levels[present]
+
+    def matrix(self) -> np.ndarray:
+        """Retourne la matrice (bloc × Y) sans les lignes de réserve."""
+        return self.counts[:len(self.names)]
+
+    def per_y(self, name: str) -> np.ndarray:
+        """
+        Retourne le nombre de blocs d'un type par niveau Y.
+
+        Args:
+            name: Nom du bloc
+
+        Returns:
+            Tableau de longueur height (indice 0 = y_min)
+        """
+        row = self._index.get(name)
+        if row is None:
+            return np.zeros(self.height, dtype=self.counts.dtype)
+        return self.counts[row].copy()
+
+    def totals(self) -> Dict[str, int]:
+        """Retourne le total de chaque bloc, trié par quantité décroissante."""
+        sums = self.matrix().sum(axis=1)
+        order = np.argsort(-sums, kind="stable")
+        return {self.names[i]: int(sums[i]) for i in order}
+
+
+def census_chunk(census: BlockCensus, nbt_data: Any):
+    """
+    Recense toutes les sections d'un chunk (format 1.18+ ou 1.13-1.17).
+
+    Args:
+        census: Recensement à compléter
+        nbt_data: Données NBT du chunk (racine, voir ReaderBackend.chunk_nbt())
+    """
+    for section_y, names, data_array, spanning in iter_chunk_sections(nbt_data):
+        if len(names) == 1 or data_array is None:
+            census.add_section(names[:1], None, section_y * 16)
+            continue
+
+        indices = decode_section_indices(data_array, len(names), spanning)
+        census.add_section(names, indices, section_y * 16)
+
+
+def _census_region(
+    task: Tuple[str, str, int, int, Optional[str], str, Optional[str]]
+) -> Tuple[Tuple[int, int], List[str], np.ndarray]:
+    """Tâche d'un worker : recense une région (exécutée dans un processus séparé)."""
+    world_path, region_path, y_min, y_max, cache_path, dimension, backend = task
+    reader = create_backend(backend, world_path, dimension)
+    region_file = Path(region_path)
+
+    census = BlockCensus(y_min, y_max)
+    if cache_path is None or not hasattr(reader, "iterate_chunk_payloads"):
+        for chunk, _, _ in reader.iterate_chunks(region_file, show_progress=False):
+            census_chunk(census, reader.chunk_nbt(chunk))
+        return reader.get_region_coordinates(region_file), census.names, census.matrix()
+
+    # Recensement par chunk, sur toute la hauteur, réutilisé entre sauvegardes
+    cache = ChunkResultCache(cache_path)
+    payloads = list(reader.iterate_chunk_payloads(region_file))
+    digests = [payload_digest(payload) for payload, _, _ in payloads]
+    known = cache.get("census", list(set(digests)))
+    new_census: Dict[bytes, bytes] = {}
+
+    for (payload, _, _), digest in zip(payloads, digests):
+        blob = known.get(digest) or new_census.get(digest)
+        if blob is None:
+            try:
+                nbt_data = reader.parse_chunk_payload(*payload)
+            except Exception:
+                continue  # Chunk corrompu, comme dans iterate_chunks()
+            if nbt_data is None:
+                continue
+            chunk_census = BlockCensus(*CACHE_Y_RANGE)
+            census_chunk(chunk_census, nbt_data)
+            # Au plus 256 blocs d'un même type par niveau : uint16 suffit
+            blob = pack_array(chunk_census.names, chunk_census.matrix().astype('<u2'))
+            new_census[digest] = blob
+        names, matrix = unpack_array(blob, '<u2', CACHE_Y_RANGE[1] - CACHE_Y_RANGE[0] + 1)
+        census.add_matrix(names, matrix, CACHE_Y_RANGE[0])
+
+    cache.put("census", new_census)
+    cache.close()
+    return reader.get_region_coordinates(region_file), census.names, census.matrix()
+
+
+class WorldCensus:
+    """
+    Recensement d'un monde entier : total et détail par région.
+    """
+
+    def __init__(self, y_min: Optional[int] = None, y_max: Optional[int] = None):
+        self.total = BlockCensus(y_min, y_max)
+        self.regions: Dict[Tuple[int, int], BlockCensus] = {}
+
+    def add_region(self, region: Tuple[int, int], names: List[str], matrix: np.ndarray):
+        """Ajoute le recensement d'une région (résultat d'un worker)."""
+        census = BlockCensus(self.total.y_min, self.total.y_max)
+        for name in names:
+            census.block_index(name)
+        census.counts[:len(names)] = matrix
+        self.regions[region] = census
+        self.total.merge(census)
+
+    def save(self, path: str) -> Path:
+        """
+        Exporte le recensement en tableaux compacts (.npz compressé).
+
+        Contenu: names (blocs), y_min, counts (bloc × Y, uint64),
+        regions (R × 2) et region_counts (R × bloc × Y, uint32).
+
+        Args:
+            path: Chemin du fichier .npz
+
+        Returns:
+            Chemin du fichier créé
+        """
+        names = self.total.names
+        region_keys = sorted(self.regions)
+        region_counts = np.zeros((len(region_keys), len(names), self.total.height), dtype=np.uint32)
+        for i, key in enumerate(region_keys):
+            census = self.regions[key]
+            rows = [self.total._index[name] for name in census.names]
+            region_counts[i, rows] = census.matrix()
+
+        output_file = Path(path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'wb') as f:
+            np.savez_compressed(
+                f,
+                names=np.array(names, dtype=str),
+                y_min=np.int32(self.total.y_min),
+                counts=self.total.matrix().astype(np.uint64),
+                regions=np.array(region_keys, dtype=np.int32).reshape(-1, 2),
+                region_counts=region_counts
+            )
+        return output_file
+
+    @classmethod
+    def load(cls, path: str) -> "WorldCensus":
+        """
+        Recharge un recensement exporté par save().
+
+        Args:
+            path: Chemin du fichier .npz
+
+        Returns:
+            Recensement du monde
+        """
+        with np.load(path) as data:
+            names = [str(name) for name in data["names"]]
+            counts = data["counts"].astype(np.int64)
+            y_min = int(data["y_min"])
+            world = cls(y_min, y_min + counts.shape[1] - 1)
+            for key, matrix in zip(data["regions"].tolist(), data["region_counts"]):
+                world.add_region(tuple(key), names, matrix.astype(np.int64))
+        return world
+
+
+def run_census(
+    world_path: str,
+    workers: Optional[int] = None,
+    y_min: Optional[int] = None,
+    y_max: Optional[int] = None,
+    show_progress: bool = True,
+    cache_path: Optional[str] = None,
+    dimension: str = "overworld",
+    backend: Optional[str] = None
+) -> WorldCensus:
+    """
+    Recense tous les blocs du monde, une région par tâche.
+
+    Args:
+        world_path: Chemin vers le monde Minecraft
+        workers: Nombre de processus (défaut: nombre de CPU, 1 = sans parallélisme)
+        y_min: Hauteur minimale (défaut: celle de la dimension)
+        y_max: Hauteur maximale (défaut: celle de la dimension)
+        show_progress: Afficher la progression
+        cache_path: Cache des résultats par chunk (voir ChunkResultCache), ou None ;
+            ignoré si la plage Y dépasse CACHE_Y_RANGE
+        dimension: Dimension recensée ("overworld", "nether" ou "end")
+        backend: Lecteur de région (voir available_backends(), défaut: APP_CONFIG["reader_backend"])
+
+    Returns:
+        Recensement du monde (total + par région)
+    """
+    dimension_y_min, dimension_y_max = DIMENSION_Y_RANGES[dimension]
+    world = WorldCensus(
+        dimension_y_min if y_min is None else y_min,
+        dimension_y_max if y_max is None else y_max
+    )
+    if world.total.y_min < CACHE_Y_RANGE[0] or world.total.y_max > CACHE_Y_RANGE[1]:
+        cache_path = None
+    region_files = create_backend(backend, world_path, dimension).list_region_files()
+    tasks = [
+        (str(world_path), str(region_file), world.total.y_min, world.total.y_max,
+         str(cache_path) if cache_path else None, dimension, backend)
+        for region_file in region_files
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    pbar = tqdm(total=len(tasks), desc="Régions recensées", disable=not show_progress, unit="régions")
+
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            world.add_region(*_census_region(task))
+            pbar.update(1)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [executor.submit(_census_region, task) for task in tasks]
+            for future in as_completed(futures):
+                world.add_region(*future.result())
+                pbar.update(1)
+
+    pbar.close()
+    return world
+
+
+if __name__ == "__main__":
+    print("Module census chargé avec succès ✓")
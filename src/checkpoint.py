@@ -0,0 +1,143 @@
+"""
+Points de reprise des longs scans : chaque région terminée est enregistrée avec
+ses emplacements, pour reprendre un scan interrompu (`main.py --resume`) sans
+rescanner les régions déjà faites.
+
+Une région terminée coûte l'écriture d'un petit fichier .npz et du manifeste
+JSON, tous deux atomiques (fichier temporaire puis renommage).
+"""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .resource_finder import ResourceLocation
+from .shards import locations_from_arrays, locations_to_arrays
+
+
+# Version du format des points de reprise
+CHECKPOINT_VERSION = 1
+
+
+class ScanCheckpoint:
+    """
+    Point de reprise d'un scan : manifeste (paramètres, régions terminées)
+    et un fichier d'emplacements par région terminée.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        params: Dict[str, Any],
+        region_stat: Optional[Callable[[Path], Tuple[int, float]]] = None
+    ):
+        """
+        Initialise le point de reprise (rien n'est lu ni écrit).
+
+        Args:
+            directory: Dossier du point de reprise
+            params: Paramètres du scan (ressource, dimension, plages...) ; une reprise
+                n'est possible qu'avec les mêmes paramètres
+            region_stat: Taille et date de modification d'une région (défaut: celles du
+                fichier ; voir ReaderBackend.region_stat pour les archives)
+        """
+        self.directory = Path(directory)
+        self.params = json.loads(json.dumps(params))  # Tuples -> listes, comme une fois relus
+        self.region_stat = region_stat
+        self.completed: Dict[str, List[float]] = {}  # Nom de région -> [taille, mtime]
+
+    @property
+    def manifest_path(self) -> Path:
+        """Chemin du manifeste."""
+        return self.directory / "checkpoint.json"
+
+    def _region_path(self, region_name: str) -> Path:
+        """Fichier des emplacements d'une région terminée."""
+        return self.directory / f"{region_name}.npz"
+
+    def _signature(self, region_file: Path) -> List[float]:
+        """Taille et date de modification d'un fichier de région."""
+        if self.region_stat is not None:
+            return list(self.region_stat(region_file))
+        stat = region_file.stat()
+        return [stat.st_size, stat.st_mtime]
+
+    def load(self) -> bool:
+        """
+        Relit le point de reprise d'un scan interrompu.
+
+        Returns:
+            True si un point de reprise aux mêmes paramètres a été relu
+        """
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if manifest.get("version") != CHECKPOINT_VERSION or manifest.get("params") != self.params:
+            return False
+        self.completed = manifest.get("regions", {})
+        return True
+
+    def is_complete(self, region_file: Path) -> bool:
+        """
+        Indique si une région a été terminée et n'a pas été modifiée depuis.
+
+        Args:
+            region_file: Fichier de région
+        """
+        signature = self.completed.get(region_file.name)
+        return signature is not None and signature == self._signature(region_file)
+
+    def completed_locations(self, region_files: List[Path], resource_type: str) -> List[ResourceLocation]:
+        """
+        Relit les emplacements enregistrés de régions terminées.
+
+        Args:
+            region_files: Régions terminées (voir is_complete())
+            resource_type: Ressource recherchée
+
+        Returns:
+            Emplacements de ces régions
+        """
+        locations = []
+        for region_file in region_files:
+            with np.load(self._region_path(region_file.name)) as data:
+                locations.extend(locations_from_arrays(data, resource_type))
+        return locations
+
+    def complete_region(self, region_file: Path, locations: List[ResourceLocation]):
+        """
+        Enregistre une région terminée et ses emplacements.
+
+        Args:
+            region_file: Fichier de région
+            locations: Emplacements trouvés dans la région
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        region_path = self._region_path(region_file.name)
+        tmp_file = region_path.with_name(region_path.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            np.savez(f, **locations_to_arrays(locations))
+        tmp_file.replace(region_path)
+
+        self.completed[region_file.name] = self._signature(region_file)
+        tmp_file = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": CHECKPOINT_VERSION, "params": self.params,
+                       "regions": self.completed}, f)
+        tmp_file.replace(self.manifest_path)
+
+    def clear(self):
+        """Supprime le point de reprise (scan terminé ou paramètres différents)."""
+        self.completed = {}
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("Module checkpoint chargé avec succès ✓")
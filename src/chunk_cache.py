@@ -0,0 +1,194 @@
+"""
+Cache des résultats de scan par contenu de chunk, partagé entre sauvegardes.
+
+La clé est l'empreinte des données compressées du chunk (voir payload_digest) :
+un chunk identique octet pour octet dans deux copies du monde n'est décodé
+qu'une fois. Le cache garde, par chunk, tous les minerais connus (toutes
+ressources, toute la hauteur) et son recensement des blocs par Y.
+
+Stockage : une base SQLite (un enregistrement par chunk), utilisable par
+plusieurs processus à la fois.
+"""
+
+import json
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Dict, Generator, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .config import APP_CONFIG, DIMENSION_Y_RANGES, RESOURCE_GROUPS
+from .modern_region_reader import ModernRegionReader, payload_digest
+
+
+# Version du format des enregistrements
+CACHE_VERSION = 1
+
+# Hauteurs couvertes par les résultats en cache (toutes dimensions)
+CACHE_Y_RANGE = (
+    min(y_min for y_min, _ in DIMENSION_Y_RANGES.values()),
+    max(y_max for _, y_max in DIMENSION_Y_RANGES.values())
+)
+
+# Minerais gardés en cache (toutes les ressources connues)
+CACHE_BLOCK_IDS = sorted({block for blocks in RESOURCE_GROUPS.values() for block in blocks})
+
+
+def pack_array(names: List[str], array: np.ndarray) -> bytes:
+    """Encode une liste de noms et un tableau d'entiers (zlib)."""
+    return zlib.compress(json.dumps(names).encode() + b"\0" + array.tobytes())
+
+
+def unpack_array(blob: bytes, dtype: str, columns: int) -> Tuple[List[str], np.ndarray]:
+    """Décode un enregistrement écrit par pack_array()."""
+    raw = zlib.decompress(blob)
+    separator = raw.index(b"\0")
+    names = json.loads(raw[:separator])
+    return names, np.frombuffer(raw[separator + 1:], dtype=dtype).reshape(-1, columns)
+
+
+class CachedChunk:
+    """
+    Chunk servi par le cache : minerais connus, sans données NBT.
+    """
+
+    __slots__ = ("hits",)
+
+    def __init__(self, hits: List[Tuple[int, int, int, str]]):
+        self.hits = hits  # (x_local, y, z_local, block_id) de tous les minerais
+
+    def find_blocks(self, block_ids: Iterable[str], y_min: int, y_max: int) -> List[Tuple[int, int, int, str]]:
+        """Filtre les minerais du chunk (même résultat que scan_chunk_for_blocks())."""
+        wanted = set(block_ids)
+        return [hit for hit in self.hits if hit[3] in wanted and y_min <= hit[1] <= y_max]
+
+
+class ChunkResultCache:
+    """
+    Résultats de scan par empreinte de chunk (minerais et recensement).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Ouvre (ou crée) le cache.
+
+        Args:
+            path: Fichier SQLite (défaut: APP_CONFIG["chunk_cache"])
+        """
+        self.path = Path(path or APP_CONFIG["chunk_cache"])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.hits_reused = 0
+        self.chunks_decoded = 0
+
+        self._db = sqlite3.connect(str(self.path), timeout=60)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS chunks (digest BLOB PRIMARY KEY, hits BLOB, census BLOB)")
+
+        # Liste de minerais ou hauteurs différentes : les minerais en cache ne sont plus complets
+        signature = json.dumps([CACHE_VERSION, CACHE_Y_RANGE, CACHE_BLOCK_IDS])
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+        if row is None or row[0] != signature:
+            with self._db:
+                if row is not None:
+                    self._db.execute("UPDATE chunks SET hits = NULL, census = NULL")
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('signature', ?)", (signature,))
+
+    def get(self, column: str, digests: List[bytes]) -> Dict[bytes, bytes]:
+        """
+        Lit les enregistrements connus pour plusieurs empreintes.
+
+        Args:
+            column: "hits" (minerais) ou "census" (recensement)
+            digests: Empreintes des chunks
+
+        Returns:
+            Empreinte -> enregistrement, pour les chunks présents dans le cache
+        """
+        found = {}
+        for start in range(0, len(digests), 500):
+            batch = digests[start:start + 500]
+            rows = self._db.execute(
+                f"SELECT digest, {column} FROM chunks WHERE {column} IS NOT NULL "
+                f"AND digest IN ({','.join('?' * len(batch))})",
+                batch
+            )
+            found.update(rows)
+        return found
+
+    def put(self, column: str, items: Dict[bytes, bytes]):
+        """
+        Enregistre les résultats de plusieurs chunks (une seule transaction).
+
+        Args:
+            column: "hits" (minerais) ou "census" (recensement)
+            items: Empreinte -> enregistrement
+        """
+        if not items:
+            return
+        with self._db:
+            self._db.executemany(
+                f"INSERT INTO chunks (digest, {column}) VALUES (?, ?) "
+                f"ON CONFLICT(digest) DO UPDATE SET {column} = excluded.{column}",
+                list(items.items())
+            )
+
+    def iterate_region(
+        self,
+        reader: ModernRegionReader,
+        region_file: Path
+    ) -> Generator[Tuple[CachedChunk, int, int], None, None]:
+        """
+        Itère sur les chunks d'une région en réutilisant les minerais en cache.
+
+        Seuls les chunks inconnus du cache sont décompressés, puis ajoutés au cache
+        une fois la région parcourue.
+
+        Args:
+            reader: Lecteur de la copie du monde
+            region_file: Fichier de région
+
+        Yields:
+            Tuple (chunk en cache, chunk_x_abs, chunk_z_abs)
+        """
+        payloads = list(reader.iterate_chunk_payloads(region_file))
+        digests = [payload_digest(payload) for payload, _, _ in payloads]
+        known = self.get("hits", list(set(digests)))
+        new_hits: Dict[bytes, bytes] = {}
+
+        for (payload, chunk_x, chunk_z), digest in zip(payloads, digests):
+            blob = known.get(digest) or new_hits.get(digest)
+            if blob is not None:
+                self.hits_reused += 1
+                names, rows = unpack_array(blob, '<i2', 4)
+                hits = [(x, y, z, names[block]) for x, y, z, block in rows.tolist()]
+            else:
+                try:
+                    nbt_data = reader.parse_chunk_payload(*payload)
+                except Exception:
+                    continue  # Chunk corrompu, comme dans iterate_chunks()
+                if nbt_data is None:
+                    continue
+                self.chunks_decoded += 1
+                hits = reader.scan_chunk_for_blocks(nbt_data, CACHE_BLOCK_IDS, *CACHE_Y_RANGE)
+                new_hits[digest] = self._pack_hits(hits)
+            yield CachedChunk(hits), chunk_x, chunk_z
+
+        self.put("hits", new_hits)
+
+    @staticmethod
+    def _pack_hits(hits: List[Tuple[int, int, int, str]]) -> bytes:
+        """Encode les minerais d'un chunk."""
+        names = sorted({hit[3] for hit in hits})
+        index = {name: i for i, name in enumerate(names)}
+        rows = np.array([(x, y, z, index[block]) for x, y, z, block in hits], dtype='<i2').reshape(-1, 4)
+        return pack_array(names, rows)
+
+    def close(self):
+        """Ferme la base."""
+        self._db.close()
+
+
+if __name__ == "__main__":
+    print("Module chunk_cache chargé avec succès ✓")
@@ -0,0 +1,225 @@
+"""
+Regroupement des blocs trouvés par densité (style DBSCAN) sur le plan X/Z.
+
+Les points sont rangés dans une grille de cellules de côté eps/√2 : les voisins
+d'un point ne peuvent se trouver que dans les 5×5 cellules autour de la sienne.
+Les paires de voisins sont générées de façon vectorisée ; le coût est proche du
+linéaire et le résultat ne dépend pas de l'origine de la grille.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .config import APP_CONFIG
+
+
+@dataclass
+class Cluster:
+    """
+    Zone dense de blocs (les zones ne se chevauchent pas : chaque bloc appartient à au plus une zone).
+    """
+    count: int  # Nombre de blocs
+    centroid: Tuple[float, float, float]  # Centre (x, y, z)
+    bbox: Tuple[int, int, int, int]  # (x_min, z_min, x_max, z_max)
+    radius: float  # Distance horizontale maximale entre le centre et un bloc
+
+
+def _propagate_labels(count: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Étiquette minimale par composante connexe (propagation + saut de pointeurs)."""
+    labels = np.arange(count)
+    while len(a):
+        smallest = np.minimum(labels[a], labels[b])
+        updated = labels.copy()
+        np.minimum.at(updated, a, smallest)
+        np.minimum.at(updated, b, smallest)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    return labels
+
+
+def _neighbour_pairs(
+    points: np.ndarray,
+    eps: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Paires de points à distance <= eps, via la grille.
+
+    Chaque paire de cellules voisines n'est visitée qu'une fois : les paires
+    d'une même cellule sont listées dans les deux sens (point lui-même compris),
+    les paires entre deux cellules dans un seul sens.
+
+    Returns:
+        Tuple (i, j, distance², même cellule) de tableaux alignés
+    """
+    side = eps / math.sqrt(2)
+    cells = np.floor(points / side).astype(np.int64)
+    cell_keys = (cells[:, 0] << 32) + cells[:, 1]
+
+    # Points triés par cellule : chaque cellule est une tranche [start, end)
+    order = np.argsort(cell_keys, kind="stable")
+    unique_keys, starts, sizes = np.unique(cell_keys[order], return_index=True, return_counts=True)
+
+    eps_sq = eps * eps
+    pairs_i, pairs_j, pairs_d, pairs_same = [], [], [], []
+    for dx in range(-2, 3):
+        for dz in range(-2, 3):
+            if (dx, dz) < (0, 0):
+                continue  # Paire de cellules déjà visitée dans l'autre sens
+            neighbour_keys = ((cells[:, 0] + dx) << 32) + (cells[:, 1] + dz)
+            pos = np.minimum(np.searchsorted(unique_keys, neighbour_keys), len(unique_keys) - 1)
+            present = np.nonzero(unique_keys[pos] == neighbour_keys)[0]
+            if len(present) == 0:
+                continue
+
+            # Chaque point est associé à tous les points de la cellule voisine
+            counts = sizes[pos[present]]
+            i = np.repeat(present, counts)
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            j = order[np.repeat(starts[pos[present]], counts) + offsets]
+
+            dist = ((points[i] - points[j]) ** 2).sum(axis=1)
+            close = dist <= eps_sq
+            pairs_i.append(i[close])
+            pairs_j.append(j[close])
+            pairs_d.append(dist[close])
+            pairs_same.append(np.full(int(close.sum()), (dx, dz) == (0, 0)))
+
+    return (np.concatenate(pairs_i), np.concatenate(pairs_j),
+            np.concatenate(pairs_d), np.concatenate(pairs_same))
+
+
+def dbscan_labels(points: np.ndarray, eps: float, min_points: int) -> np.ndarray:
+    """
+    Étiquette des points 2D par densité (DBSCAN) à l'aide d'une grille.
+
+    Args:
+        points: Tableau (N, 2) de coordonnées (x, z)
+        eps: Rayon de voisinage (en blocs)
+        min_points: Nombre minimal de voisins (point compris) d'un point central
+
+    Returns:
+        Étiquette de zone de chaque point (-1 = bruit)
+    """
+    count = len(points)
+    labels = np.full(count, -1, dtype=np.int64)
+    if count == 0:
+        return labels
+
+    i, j, dist, same_cell = _neighbour_pairs(points, eps)
+
+    # 1. Points centraux : au moins min_points voisins
+    neighbours = np.bincount(i, minlength=count) + np.bincount(j[~same_cell], minlength=count)
+    core = neighbours >= min_points
+
+    # 2. Zones : composantes connexes des points centraux
+    core_edges = core[i] & core[j]
+    components = _propagate_labels(count, i[core_edges], j[core_edges])
+    labels[core] = components[core]
+
+    # 3. Points de bordure : rattachés au point central le plus proche
+    forward = ~core[i] & core[j]
+    backward = core[i] & ~core[j]
+    bi = np.concatenate([i[forward], j[backward]])
+    bj = np.concatenate([j[forward], i[backward]])
+    bd = np.concatenate([dist[forward], dist[backward]])
+    if len(bi):
+        nearest = np.lexsort((bj, bd, bi))
+        first = np.ones(len(nearest), dtype=bool)
+        first[1:] = bi[nearest][1:] != bi[nearest][:-1]
+        chosen = nearest[first]
+        labels[bi[chosen]] = components[bj[chosen]]
+
+    # Étiquettes consécutives 0..k-1
+    clustered = labels >= 0
+    if clustered.any():
+        labels[clustered] = np.unique(labels[clustered], return_inverse=True)[1].reshape(-1)
+    return labels
+
+
+def find_clusters(
+    locations,
+    eps: Optional[float] = None,
+    min_points: Optional[int] = None
+) -> List[Cluster]:
+    """
+    Regroupe des emplacements en zones denses, sans chevauchement.
+
+    Args:
+        locations: Emplacements (objets avec x, y, z)
+        eps: Rayon de voisinage en blocs (défaut: APP_CONFIG["cluster_eps"])
+        min_points: Voisins minimum d'un point central (défaut: APP_CONFIG["cluster_min_points"])
+
+    Returns:
+        Liste des zones, de la plus peuplée à la moins peuplée
+    """
+    if eps is None:
+        eps = APP_CONFIG["cluster_eps"]
+    if min_points is None:
+        min_points = APP_CONFIG["cluster_min_points"]
+
+    if not locations:
+        return []
+
+    coords = np.array([(loc.x, loc.y, loc.z) for loc in locations], dtype=np.int64)
+    labels = dbscan_labels(coords[:, [0, 2]].astype(np.float64), eps, min_points)
+
+    clustered = labels >= 0
+    if not clustered.any():
+        return []
+
+    labels = labels[clustered]
+    coords = coords[clustered]
+    cluster_count = int(labels.max()) + 1
+
+    counts = np.bincount(labels, minlength=cluster_count)
+    centroids = np.stack([
+        np.bincount(labels, weights=coords[:, axis], minlength=cluster_count) / counts
+        for axis in range(3)
+    ], axis=1)
+
+    bounds = np.empty((cluster_count, 4), dtype=np.int64)
+    bounds[:, :2] = np.iinfo(np.int64).max
+    bounds[:, 2:] = np.iinfo(np.int64).min
+    for column, axis in ((0, 0), (1, 2)):
+        np.minimum.at(bounds[:, column], labels, coords[:, axis])
+        np.maximum.at(bounds[:, column + 2], labels, coords[:, axis])
+
+    distances = np.hypot(coords[:, 0] - centroids[labels, 0], coords[:, 2] - centroids[labels, 2])
+    radii = np.zeros(cluster_count)
+    np.maximum.at(radii, labels, distances)
+
+    order = np.argsort(-counts, kind="stable")
+    return [
+        Cluster(
+            count=int(counts[i]),
+            centroid=tuple(round(v, 2) for v in centroids[i].tolist()),
+            bbox=tuple(bounds[i].tolist()),
+            radius=round(float(radii[i]), 2)
+        )
+        for i in order
+    ]
+
+
+def clusters_to_hotspots(clusters: List[Cluster]) -> List[Tuple[int, int, int, int]]:
+    """
+    Convertit des zones en hotspots au format historique (x, z, count, radius).
+
+    Args:
+        clusters: Zones denses
+
+    Returns:
+        Liste de tuples (x_center, z_center, count, radius)
+    """
+    return [
+        (round(c.centroid[0]), round(c.centroid[2]), c.count, max(1, math.ceil(c.radius)))
+        for c in clusters
+    ]
+
+
+if __name__ == "__main__":
+    print("Module clustering chargé avec succès ✓")
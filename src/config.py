@@ -26,6 +26,18 @@ BLOCK_IDS: Dict[str, str] = {
     "deepslate_redstone_ore": "minecraft:deepslate_redstone_ore",
     "emerald_ore": "minecraft:emerald_ore",
     "deepslate_emerald_ore": "minecraft:deepslate_emerald_ore",
+    
+    # Nether
+    "ancient_debris": "minecraft:ancient_debris",
+    "nether_gold_ore": "minecraft:nether_gold_ore",
+    "nether_quartz_ore": "minecraft:nether_quartz_ore",
+    "gilded_blackstone": "minecraft:gilded_blackstone",
+    
+    # End
+    "chorus_flower": "minecraft:chorus_flower",
+    "chorus_plant": "minecraft:chorus_plant",
+    "purpur_block": "minecraft:purpur_block",
+    "purpur_pillar": "minecraft:purpur_pillar",
 }
 
 # Groupes de ressources pour faciliter les recherches
@@ -62,6 +74,49 @@ RESOURCE_GROUPS: Dict[str, List[str]] = {
         BLOCK_IDS["emerald_ore"],
         BLOCK_IDS["deepslate_emerald_ore"]
     ],
+    
+    # Nether
+    "ancient_debris": [
+        BLOCK_IDS["ancient_debris"]
+    ],
+    "nether_gold": [
+        BLOCK_IDS["nether_gold_ore"],
+        BLOCK_IDS["gilded_blackstone"]
+    ],
+    "quartz": [
+        BLOCK_IDS["nether_quartz_ore"]
+    ],
+    
+    # End (les blocs de purpur signalent les cités de l'End)
+    "chorus": [
+        BLOCK_IDS["chorus_flower"],
+        BLOCK_IDS["chorus_plant"]
+    ],
+    "end_city": [
+        BLOCK_IDS["purpur_block"],
+        BLOCK_IDS["purpur_pillar"]
+    ],
+}
+
+# Dossier des régions de chaque dimension (relatif au monde)
+DIMENSIONS: Dict[str, str] = {
+    "overworld": "region",
+    "nether": "DIM-1/region",
+    "end": "DIM1/region",
+}
+
+# Hauteurs du monde par dimension (y_min, y_max)
+DIMENSION_Y_RANGES: Dict[str, tuple] = {
+    "overworld": (-64, 319),
+    "nether": (0, 255),
+    "end": (0, 255),
+}
+
+# Ressources recherchées dans chaque dimension
+DIMENSION_RESOURCES: Dict[str, List[str]] = {
+    "overworld": ["diamond", "iron", "gold", "copper", "coal", "lapis", "redstone", "emerald"],
+    "nether": ["ancient_debris", "nether_gold", "quartz"],
+    "end": ["chorus", "end_city"],
 }
 
 # Distribution des minerais par Y-level (hauteur) en Minecraft 1.21
@@ -75,8 +130,21 @@ RESOURCE_Y_DISTRIBUTION: Dict[str, tuple] = {
     "lapis": (-64, 64),        # Souterrain
     "redstone": (-64, 16),     # Profond uniquement
     "emerald": (-16, 320),     # Montagnes uniquement
+    "ancient_debris": (8, 119),  # Nether, pic entre Y=13 et Y=17
+    "nether_gold": (10, 117),  # Nether (et blackstone dorée des bastions)
+    "quartz": (10, 117),       # Nether
+    "chorus": (0, 255),        # End, sur les îles extérieures
+    "end_city": (0, 255),      # End, îles extérieures
 }
 
+# Blocs "ouverts" : un minerai voisin de l'un d'eux est visible depuis une cave
+EXPOSURE_BLOCKS: List[str] = [
+    "minecraft:air",
+    "minecraft:cave_air",
+    "minecraft:void_air",
+    "minecraft:water",
+]
+
 # Couleurs pour les cartes (RGB)
 RESOURCE_COLORS: Dict[str, tuple] = {
     "diamond": (0, 255, 255),      # Cyan
@@ -87,6 +155,11 @@ RESOURCE_COLORS: Dict[str, tuple] = {
     "lapis": (0, 0, 255),          # Bleu
     "redstone": (255, 0, 0),       # Rouge
     "emerald": (0, 255, 0),        # Vert
+    "ancient_debris": (110, 70, 50),  # Brun
+    "nether_gold": (255, 170, 0),  # Or orangé
+    "quartz": (235, 225, 210),     # Blanc cassé
+    "chorus": (150, 90, 150),      # Violet
+    "end_city": (200, 130, 220),   # Purpur
     "stone": (128, 128, 128),      # Gris (fond)
     "air": (255, 255, 255),        # Blanc (cavernes)
 }
@@ -98,7 +171,19 @@ APP_CONFIG = {
     "region_size": 32,             # Nombre de chunks par région (constante Minecraft)
     "hotspot_radius": 32,          # Rayon (en blocs) pour détecter les zones riches
     "hotspot_threshold": 10,       # Nombre minimum de blocs pour considérer une zone comme riche
+    "hotspot_method": "grid",      # Détection des zones riches: "grid" (cercles) ou "dbscan" (densité)
+    "cluster_eps": 16,             # Rayon de voisinage (en blocs) du mode "dbscan"
+    "cluster_min_points": 10,      # Voisins minimum d'un bloc central en mode "dbscan"
     "map_scale": 4,                # Échelle de la carte (1 pixel = N blocs)
+    "section_cache_bytes": 64 * 1024 * 1024,  # Budget mémoire du cache de sections décodées
+    "world_min_y": -64,            # Hauteur minimale du monde (Overworld 1.18+, voir DIMENSION_Y_RANGES)
+    "world_max_y": 319,            # Hauteur maximale du monde (Overworld 1.18+, voir DIMENSION_Y_RANGES)
+    "summary_dir": "output/summaries",  # Résumés par région (un sous-dossier par monde)
+    "reader_backend": "modern",    # Lecteur de région: "modern", "anvil" ou "anvil-slow"
+    "checkpoint_dir": "output/checkpoints",  # Points de reprise des scans (voir --resume)
+    "chunk_cache": "output/chunk_cache.sqlite",  # Résultats par contenu de chunk (voir --chunk-cache)
+    "archive_index_dir": "output/archive_index",  # Listes des membres des tar compressés
+    "async_max_pending": 4,        # Régions en cours ou en attente par requête asynchrone
 }
 
 def get_resource_blocks(resource_name: str) -> List[str]:
@@ -119,6 +204,21 @@ def get_resource_blocks(resource_name: str) -> List[str]:
                         f"Ressources disponibles: {list(RESOURCE_GROUPS.keys())}")
     return RESOURCE_GROUPS[resource_name]
 
+def get_resource_dimension(resource_name: str) -> str:
+    """
+    Retourne la dimension où se trouve une ressource.
+    
+    Args:
+        resource_name: Nom de la ressource
+    
+    Returns:
+        Nom de la dimension ("overworld" par défaut)
+    """
+    for dimension, resources in DIMENSION_RESOURCES.items():
+        if resource_name in resources:
+            return dimension
+    return "overworld"
+
 def get_resource_color(resource_name: str) -> tuple:
     """
     Retourne la couleur RGB associée à une ressource.
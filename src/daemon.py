@@ -0,0 +1,337 @@
+"""
+Mode démon : garde un monde chargé en mémoire et répond aux requêtes
+(rayon, plus proche, statistiques, carte) via HTTP local ou socket Unix.
+"""
+
+import json
+import os
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from .config import RESOURCE_GROUPS, RESOURCE_Y_DISTRIBUTION, get_resource_dimension
+from .modern_region_reader import ModernRegionReader
+from .ore_index import OreIndex
+from .resource_finder import ResourceFinder, ResourceStats
+from .section_cache import SectionCache
+from .statistics import StatisticsCalculator
+
+
+def _hit_to_dict(hit) -> Dict:
+    """Convertit un RadiusHit en dictionnaire JSON."""
+    return {
+        "x": hit.x,
+        "y": hit.y,
+        "z": hit.z,
+        "block_id": hit.block_id,
+        "distance": round(hit.distance, 2)
+    }
+
+
+class QueryDaemon:
+    """
+    Service de requêtes sur un monde chargé une seule fois.
+    """
+
+    def __init__(
+        self,
+        world_path: str,
+        output_dir: str = "output",
+        section_cache_bytes: Optional[int] = None,
+        dimension: str = "overworld"
+    ):
+        """
+        Initialise le démon.
+
+        Args:
+            world_path: Chemin vers le monde Minecraft
+            output_dir: Répertoire de sortie pour les cartes générées
+            section_cache_bytes: Budget mémoire des sections décodées
+                (défaut: APP_CONFIG["section_cache_bytes"])
+            dimension: Dimension servie ("overworld", "nether" ou "end")
+        """
+        self.world_path = world_path
+        self.output_dir = Path(output_dir)
+        self.dimension = dimension
+        self.reader = ModernRegionReader(world_path, section_cache=SectionCache(section_cache_bytes),
+                                         dimension=dimension)
+        self.index = OreIndex(self.reader)
+        self.finder = ResourceFinder(world_path, write_summaries=False, dimension=dimension)
+        self.calc = StatisticsCalculator()
+
+        # Statistiques globales par ressource (calculées une fois)
+        self._stats: Dict[str, ResourceStats] = {}
+        self._stats_lock = threading.Lock()
+        self.requests_served = 0
+
+    # ------------------------------------------------------------
+    # Paramètres
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def _get_int(params: Dict[str, List[str]], name: str, default: Optional[int] = None) -> int:
+        """Lit un paramètre entier obligatoire (ou avec valeur par défaut)."""
+        if name not in params:
+            if default is None:
+                raise ValueError(f"Paramètre manquant: {name}")
+            return default
+        try:
+            return int(float(params[name][0]))
+        except ValueError:
+            raise ValueError(f"Paramètre invalide: {name}={params[name][0]}")
+
+    def _get_resources(self, params: Dict[str, List[str]]) -> List[str]:
+        """Lit la liste des ressources (resource=diamond,iron) de la dimension servie."""
+        if "resource" not in params:
+            raise ValueError("Paramètre manquant: resource")
+        resources = [r for value in params["resource"] for r in value.split(",") if r]
+        for resource_name in resources:
+            if resource_name not in RESOURCE_GROUPS:
+                raise ValueError(f"Ressource inconnue: {resource_name}. "
+                                 f"Ressources disponibles: {list(RESOURCE_GROUPS.keys())}")
+            if get_resource_dimension(resource_name) != self.dimension:
+                raise ValueError(f"{resource_name} ne se trouve pas dans la dimension servie "
+                                 f"({self.dimension})")
+        return resources
+
+    @staticmethod
+    def _get_y_range(params: Dict[str, List[str]]) -> Optional[Tuple[int, int]]:
+        """Lit une plage Y optionnelle (y_min / y_max)."""
+        if "y_min" not in params and "y_max" not in params:
+            return None
+        return (
+            QueryDaemon._get_int(params, "y_min", -64),
+            QueryDaemon._get_int(params, "y_max", 320)
+        )
+
+    # ------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------
+
+    def query_radius(self, params: Dict[str, List[str]]) -> Dict:
+        """Minerais dans un rayon autour de (x, z)."""
+        x = self._get_int(params, "x")
+        z = self._get_int(params, "z")
+        radius = self._get_int(params, "radius", 32)
+        limit = self._get_int(params, "limit", 100)
+        resources = self._get_resources(params)
+
+        hits = self.index.radius(x, z, radius, resources, self._get_y_range(params))
+        return {
+            "total": len(hits),
+            "resultats": [_hit_to_dict(h) for h in hits[:limit]]
+        }
+
+    def query_nearest(self, params: Dict[str, List[str]]) -> Dict:
+        """Minerai le plus proche de (x, z)."""
+        x = self._get_int(params, "x")
+        z = self._get_int(params, "z")
+        max_radius = self._get_int(params, "max_radius", 512)
+        resources = self._get_resources(params)
+
+        hit = self.index.nearest(x, z, resources, max_radius, self._get_y_range(params))
+        return {"plus_proche": _hit_to_dict(hit) if hit else None}
+
+    def query_block(self, params: Dict[str, List[str]]) -> Dict:
+        """Bloc exact à (x, y, z), lu dans les sections décodées en cache."""
+        x = self._get_int(params, "x")
+        y = self._get_int(params, "y")
+        z = self._get_int(params, "z")
+
+        section = self.reader.get_section(x >> 4, z >> 4, y >> 4)
+        block_id = section.block_at(x & 15, y & 15, z & 15) if section else None
+        return {"x": x, "y": y, "z": z, "block_id": block_id}
+
+    def get_stats(self, resource_name: str) -> ResourceStats:
+        """
+        Retourne les statistiques globales d'une ressource (indexe le monde au besoin).
+
+        Args:
+            resource_name: Nom de la ressource
+
+        Returns:
+            Statistiques de la ressource
+        """
+        with self._stats_lock:
+            if resource_name not in self._stats:
+                self.index.load_all()
+                y_min, y_max = RESOURCE_Y_DISTRIBUTION.get(resource_name, (-64, 320))
+                locations = [
+                    loc for loc in self.index.locations(resource_name)
+                    if y_min <= loc.y <= y_max
+                ]
+                self._stats[resource_name] = self.finder.stats_from_locations(
+                    resource_name, locations
+                )
+            return self._stats[resource_name]
+
+    def invalidate_stats(self):
+        """Oublie les statistiques calculées (après une mise à jour de l'index)."""
+        with self._stats_lock:
+            self._stats.clear()
+
+    def query_stats(self, params: Dict[str, List[str]]) -> Dict:
+        """Rapport statistique complet d'une ressource."""
+        resources = self._get_resources(params)
+        return {
+            resource_name: self.calc.generate_full_report(self.get_stats(resource_name))
+            for resource_name in resources
+        }
+
+    def query_map(self, params: Dict[str, List[str]]) -> Dict:
+        """Génère une carte 2D d'une ressource et retourne son chemin."""
+        # Import différé : PIL n'est chargé qu'à la première carte demandée
+        from .map_generator import MapGenerator
+
+        resources = self._get_resources(params)
+        y_level = self._get_int(params, "y_level", 0) if "y_level" in params else None
+
+        map_gen = MapGenerator(str(self.output_dir / "maps"))
+        paths = {}
+        for resource_name in resources:
+            stats = self.get_stats(resource_name)
+            paths[resource_name] = str(map_gen.generate_2d_map(stats, y_level=y_level))
+        return {"cartes": paths}
+
+    def query_info(self, params: Dict[str, List[str]]) -> Dict:
+        """État du démon et de l'index."""
+        info = self.index.info()
+        info["monde"] = str(self.world_path)
+        info["dimension"] = self.dimension
+        info["requetes_servies"] = self.requests_served
+        info["cache_sections"] = self.reader.section_cache.stats()
+        return info
+
+    def handle(self, path: str, params: Dict[str, List[str]]) -> Dict:
+        """
+        Exécute une requête et mesure sa latence.
+
+        Args:
+            path: Route demandée (/radius, /nearest, /block, /stats, /map, /info)
+            params: Paramètres de la requête
+
+        Returns:
+            Réponse JSON (avec la latence en millisecondes)
+
+        Raises:
+            KeyError: Si la route est inconnue
+            ValueError: Si les paramètres sont invalides
+        """
+        routes = {
+            "/radius": self.query_radius,
+            "/nearest": self.query_nearest,
+            "/block": self.query_block,
+            "/stats": self.query_stats,
+            "/map": self.query_map,
+            "/info": self.query_info,
+        }
+        if path not in routes:
+            raise KeyError(path)
+
+        start = time.perf_counter()
+        response = routes[path](params)
+        response["latence_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        self.requests_served += 1
+        return response
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    """Gestionnaire HTTP : GET /route?param=valeur → JSON."""
+
+    query_daemon: QueryDaemon = None
+    quiet = False
+
+    def address_string(self) -> str:
+        # Les sockets Unix n'ont pas d'adresse client
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: Dict):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        start = time.perf_counter()
+
+        try:
+            response = self.query_daemon.handle(url.path, params)
+            status = 200
+        except KeyError:
+            response = {"erreur": f"Route inconnue: {url.path}"}
+            status = 404
+        except ValueError as e:
+            response = {"erreur": str(e)}
+            status = 400
+        except Exception as e:
+            response = {"erreur": f"Erreur interne: {e}"}
+            status = 500
+
+        self._send_json(status, response)
+        self.log_message('"%s" %d %.2f ms', self.requestline, status,
+                         (time.perf_counter() - start) * 1000)
+
+    def log_request(self, code="-", size="-"):
+        # La ligne de log (avec latence) est écrite dans do_GET
+        pass
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serveur HTTP multi-thread sur socket Unix."""
+
+    daemon_threads = True
+
+
+def serve(
+    daemon: QueryDaemon,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Optional[str] = None,
+    quiet: bool = False
+):
+    """
+    Lance le serveur (bloquant jusqu'à Ctrl-C).
+
+    Args:
+        daemon: Démon à exposer
+        host: Adresse d'écoute HTTP
+        port: Port d'écoute HTTP
+        socket_path: Chemin d'une socket Unix (remplace host/port si fourni)
+        quiet: Ne pas journaliser les requêtes
+    """
+    handler = type("DaemonRequestHandler", (_DaemonRequestHandler,), {
+        "query_daemon": daemon,
+        "quiet": quiet
+    })
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = _ThreadingUnixHTTPServer(socket_path, handler)
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    print("Module daemon chargé avec succès ✓")
@@ -0,0 +1,134 @@
+"""
+Recherche des ressources de plusieurs dimensions (Overworld, Nether, End) en un
+seul job : toutes les régions des dimensions demandées sont réparties sur un même
+pool de processus.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from tqdm import tqdm
+
+from .config import (
+    DIMENSION_RESOURCES,
+    DIMENSION_Y_RANGES,
+    RESOURCE_GROUPS,
+    RESOURCE_Y_DISTRIBUTION,
+)
+from .reader_backend import create_backend
+from .resource_finder import ResourceFinder, ResourceLocation, ResourceStats
+
+
+# Tâche d'un worker : (monde, dimension, fichier de région, ressources, backend)
+_RegionTask = Tuple[str, str, str, List[str], Optional[str]]
+
+
+def _scan_region(task: _RegionTask) -> Tuple[str, Dict[str, List[Tuple[int, int, int, str]]]]:
+    """Tâche d'un worker : cherche les ressources d'une dimension dans une région."""
+    world_path, dimension, region_path, resources, backend = task
+    reader = create_backend(backend, world_path, dimension)
+    y_min, y_max = DIMENSION_Y_RANGES[dimension]
+
+    block_resource = {block: name for name in resources for block in RESOURCE_GROUPS[name]}
+    hits: Dict[str, List[Tuple[int, int, int, str]]] = {name: [] for name in resources}
+
+    for chunk, chunk_x, chunk_z in reader.iterate_chunks(Path(region_path), show_progress=False):
+        for x, y, z, block_id in reader.scan_chunk_for_blocks(chunk, list(block_resource), y_min, y_max):
+            resource = block_resource[block_id]
+            low, high = RESOURCE_Y_DISTRIBUTION.get(resource, (y_min, y_max))
+            if low <= y <= high:
+                hits[resource].append((chunk_x * 16 + x, y, chunk_z * 16 + z, block_id))
+
+    return dimension, hits
+
+
+def scan_dimensions(
+    world_path: str,
+    dimensions: Optional[List[str]] = None,
+    resources: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    backend: Optional[str] = None,
+    hotspot_method: Optional[str] = None,
+    show_progress: bool = True,
+    hotspots: bool = True
+) -> Dict[str, Dict[str, ResourceStats]]:
+    """
+    Cherche les ressources de chaque dimension, une région par tâche.
+
+    Les dimensions sans dossier de régions (jamais visitées) sont ignorées.
+
+    Args:
+        world_path: Chemin vers le monde Minecraft
+        dimensions: Dimensions à analyser (défaut: les trois)
+        resources: Ressources à chercher (défaut: toutes celles de chaque dimension)
+        workers: Nombre de processus (défaut: nombre de CPU, 1 = sans parallélisme)
+        backend: Lecteur de région (défaut: APP_CONFIG["reader_backend"])
+        hotspot_method: "grid" ou "dbscan" (défaut: APP_CONFIG["hotspot_method"])
+        show_progress: Afficher la progression
+        hotspots: Détecter les zones riches de chaque ressource
+
+    Returns:
+        Dictionnaire dimension -> ressource -> statistiques
+    """
+    dimensions = dimensions or list(DIMENSION_RESOURCES)
+
+    tasks: List[_RegionTask] = []
+    wanted: Dict[str, List[str]] = {}
+    for dimension in dimensions:
+        names = [r for r in DIMENSION_RESOURCES[dimension] if resources is None or r in resources]
+        if not names:
+            continue
+        try:
+            region_files = create_backend(backend, world_path, dimension).list_region_files()
+        except ValueError:
+            continue  # Dimension jamais visitée
+        wanted[dimension] = names
+        tasks.extend(
+            (str(world_path), dimension, str(region_file), names, backend)
+            for region_file in region_files
+        )
+
+    hits: Dict[str, Dict[str, List[Tuple[int, int, int, str]]]] = {
+        dimension: {name: [] for name in names} for dimension, names in wanted.items()
+    }
+
+    def merge(dimension: str, region_hits: Dict[str, List[Tuple[int, int, int, str]]]):
+        for name, found in region_hits.items():
+            hits[dimension][name].extend(found)
+
+    workers = workers or os.cpu_count() or 1
+    pbar = tqdm(total=len(tasks), desc="Régions analysées", disable=not show_progress, unit="régions")
+
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            merge(*_scan_region(task))
+            pbar.update(1)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [executor.submit(_scan_region, task) for task in tasks]
+            for future in as_completed(futures):
+                merge(*future.result())
+                pbar.update(1)
+
+    pbar.close()
+
+    # Statistiques par dimension (ordre des emplacements indépendant de l'ordre des workers)
+    results: Dict[str, Dict[str, ResourceStats]] = {}
+    for dimension, by_resource in hits.items():
+        finder = ResourceFinder(world_path, hotspot_method=hotspot_method, write_summaries=False,
+                                backend=backend, dimension=dimension)
+        results[dimension] = {
+            name: finder.stats_from_locations(name, [
+                ResourceLocation(x=x, y=y, z=z, block_id=block_id, resource_type=name)
+                for x, y, z, block_id in sorted(found)
+            ], hotspots=hotspots)
+            for name, found in by_resource.items()
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    print("Module dimension_scan chargé avec succès ✓")
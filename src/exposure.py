@@ -0,0 +1,220 @@
+"""
+Analyse d'exposition des minerais : un bloc est exposé si l'un de ses six voisins
+est de l'air ou de l'eau (visible depuis une cave).
+
+Calculée pendant le scan, chunk par chunk : masques NumPy décalés sur la colonne
+du chunk, et faces des chunks voisins conservées pour les blocs en bordure.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .block_matcher import compile_matcher
+from .config import APP_CONFIG, EXPOSURE_BLOCKS
+from .modern_region_reader import decode_section_indices, iter_chunk_sections
+
+
+# Faces d'un chunk conservées pour ses voisins (ordre dans le tableau empaqueté)
+_WEST, _EAST, _NORTH, _SOUTH = range(4)
+
+
+def chunk_open_mask(
+    nbt_data: Any,
+    y_min: Optional[int] = None,
+    y_max: Optional[int] = None
+) -> np.ndarray:
+    """
+    Calcule le masque des blocs ouverts (air/eau) d'une colonne de chunk.
+
+    Les sections absentes du chunk sont considérées comme de l'air. Les chunks
+    1.13-1.17 (`Level/Sections`, indices chevauchants avant 20w17a) sont aussi lus.
+
+    Args:
+        nbt_data: Données NBT du chunk (racine, avec DataVersion)
+        y_min: Hauteur minimale du monde (défaut: APP_CONFIG["world_min_y"])
+        y_max: Hauteur maximale du monde (défaut: APP_CONFIG["world_max_y"])
+
+    Returns:
+        Tableau booléen d'axes (y - y_min, z local, x local)
+    """
+    y_min = APP_CONFIG["world_min_y"] if y_min is None else y_min
+    y_max = APP_CONFIG["world_max_y"] if y_max is None else y_max
+    matcher = compile_matcher(EXPOSURE_BLOCKS)
+
+    mask = np.ones((y_max - y_min + 1, 16, 16), dtype=bool)
+    if nbt_data.get('sections') is None and nbt_data.get('Level') is not None and y_min < 0:
+        # Chunk 1.13-1.17 : le monde commence à Y=0, rien d'ouvert en dessous
+        mask[:-y_min] = False
+
+    for section_y, names, data_array, spanning in iter_chunk_sections(nbt_data):
+        base_y = section_y * 16
+        if base_y + 15 < y_min or base_y > y_max:
+            continue
+
+        palette_mask = matcher.palette_mask(names)
+
+        first = max(base_y, y_min)
+        last = min(base_y + 15, y_max)
+        target = mask[first - y_min:last - y_min + 1]
+
+        if len(names) == 1 or data_array is None or palette_mask.all() or not palette_mask.any():
+            # Section sans mélange ouvert/fermé : pas de décodage
+            target[...] = palette_mask[0]
+            continue
+
+        indices = decode_section_indices(data_array, len(names), spanning)
+        indices = np.minimum(indices, len(names) - 1)
+        cube = palette_mask[indices].reshape(16, 16, 16)
+        target[...] = cube[first - base_y:last - base_y + 1]
+
+    return mask
+
+
+def exposed_grid(open_mask: np.ndarray) -> np.ndarray:
+    """
+    Marque les blocs dont un voisin (dans la colonne du chunk) est ouvert.
+
+    Le dessus du monde est considéré comme ouvert (ciel), le dessous comme fermé.
+    Les voisins des chunks adjacents sont traités par ExposureTracker.
+
+    Args:
+        open_mask: Masque des blocs ouverts d'axes (y, z, x)
+
+    Returns:
+        Tableau booléen de même forme
+    """
+    exposed = np.zeros_like(open_mask)
+    exposed[1:] |= open_mask[:-1]        # Dessous
+    exposed[:-1] |= open_mask[1:]        # Dessus
+    exposed[-1] = True                   # Ciel au-dessus du plus haut niveau
+    exposed[:, 1:] |= open_mask[:, :-1]  # Nord (z - 1)
+    exposed[:, :-1] |= open_mask[:, 1:]  # Sud (z + 1)
+    exposed[:, :, 1:] |= open_mask[:, :, :-1]  # Ouest (x - 1)
+    exposed[:, :, :-1] |= open_mask[:, :, 1:]  # Est (x + 1)
+    return exposed
+
+
+class ExposureTracker:
+    """
+    Calcule l'attribut `exposed` des minerais au fil du scan des chunks.
+
+    Les minerais en bordure de chunk sont résolus dès que le chunk voisin est
+    scanné (ses faces sont conservées, empaquetées, jusqu'à ce que ses quatre
+    voisins aient été vus). Un voisin jamais scanné (non généré) est considéré fermé.
+    """
+
+    def __init__(self, y_min: Optional[int] = None, y_max: Optional[int] = None):
+        """
+        Initialise le suivi.
+
+        Args:
+            y_min: Hauteur minimale du monde (défaut: APP_CONFIG["world_min_y"])
+            y_max: Hauteur maximale du monde (défaut: APP_CONFIG["world_max_y"])
+        """
+        self.y_min = APP_CONFIG["world_min_y"] if y_min is None else y_min
+        self.y_max = APP_CONFIG["world_max_y"] if y_max is None else y_max
+        self.height = self.y_max - self.y_min + 1
+
+        # Faces empaquetées (4 × hauteur × 16 bits) des chunks scannés
+        self._faces: Dict[Tuple[int, int], np.ndarray] = {}
+        self._seen = set()
+        # Chunk voisin attendu -> [(emplacement, face, y index, position le long de la face)]
+        self._pending: Dict[Tuple[int, int], List[Tuple[Any, int, int, int]]] = {}
+
+    def _resolve(self, chunk: Tuple[int, int], requests: List[Tuple[Any, int, int, int]]):
+        """Résout des minerais en bordure à l'aide des faces d'un chunk voisin."""
+        if chunk not in self._faces:
+            return
+        faces = np.unpackbits(self._faces[chunk], count=4 * self.height * 16).reshape(4, self.height, 16)
+        for location, face, y_index, along in requests:
+            if faces[face, y_index, along]:
+                location.exposed = True
+
+    def process_chunk(
+        self,
+        chunk_x: int,
+        chunk_z: int,
+        nbt_data: Any,
+        locations: List[Any]
+    ):
+        """
+        Marque les minerais d'un chunk et résout les minerais voisins en attente.
+
+        Args:
+            chunk_x: Coordonnée X absolue du chunk
+            chunk_z: Coordonnée Z absolue du chunk
+            nbt_data: Données NBT du chunk (déjà lues par le scan)
+            locations: Minerais trouvés dans ce chunk (ResourceLocation, coordonnées absolues)
+        """
+        chunk = (chunk_x, chunk_z)
+        open_mask = chunk_open_mask(nbt_data, self.y_min, self.y_max)
+
+        faces = np.stack([
+            open_mask[:, :, 0],   # Ouest (x = 0)
+            open_mask[:, :, 15],  # Est (x = 15)
+            open_mask[:, 0, :],   # Nord (z = 0)
+            open_mask[:, 15, :],  # Sud (z = 15)
+        ])
+        self._faces[chunk] = np.packbits(faces)
+        self._seen.add(chunk)
+
+        if locations:
+            xs = np.fromiter((loc.x & 15 for loc in locations), dtype=np.intp, count=len(locations))
+            ys = np.fromiter((loc.y - self.y_min for loc in locations), dtype=np.intp, count=len(locations))
+            zs = np.fromiter((loc.z & 15 for loc in locations), dtype=np.intp, count=len(locations))
+            inside = exposed_grid(open_mask)[ys, zs, xs]
+
+            for location, exposed, x, y, z in zip(
+                locations, inside.tolist(), xs.tolist(), ys.tolist(), zs.tolist()
+            ):
+                location.exposed = exposed
+                if exposed:
+                    continue
+                # Voisins dans les chunks adjacents : (chunk, face du voisin, position le long)
+                if x == 0:
+                    self._request((chunk_x - 1, chunk_z), location, _EAST, y, z)
+                if x == 15:
+                    self._request((chunk_x + 1, chunk_z), location, _WEST, y, z)
+                if z == 0:
+                    self._request((chunk_x, chunk_z - 1), location, _SOUTH, y, x)
+                if z == 15:
+                    self._request((chunk_x, chunk_z + 1), location, _NORTH, y, x)
+
+        # Minerais voisins qui attendaient ce chunk
+        waiting = self._pending.pop(chunk, None)
+        if waiting:
+            self._resolve(chunk, waiting)
+
+        # Oublier les faces dont les quatre voisins ont été vus
+        for neighbour in [chunk, (chunk_x - 1, chunk_z), (chunk_x + 1, chunk_z),
+                          (chunk_x, chunk_z - 1), (chunk_x, chunk_z + 1)]:
+            nx, nz = neighbour
+            if neighbour in self._faces and all(
+                n in self._seen for n in ((nx - 1, nz), (nx + 1, nz), (nx, nz - 1), (nx, nz + 1))
+            ):
+                del self._faces[neighbour]
+
+    def _request(self, neighbour: Tuple[int, int], location: Any,
+                 face: int, y_index: int, along: int):
+        """Résout tout de suite si le voisin est connu, sinon met en attente."""
+        if neighbour in self._faces:
+            self._resolve(neighbour, [(location, face, y_index, along)])
+        elif neighbour not in self._seen:
+            self._pending.setdefault(neighbour, []).append((location, face, y_index, along))
+
+    def finish(self) -> int:
+        """
+        Termine l'analyse : les minerais dont le voisin n'a jamais été scanné restent fermés.
+
+        Returns:
+            Nombre de minerais restés en attente
+        """
+        unresolved = sum(len(requests) for requests in self._pending.values())
+        self._pending.clear()
+        self._faces.clear()
+        return unresolved
+
+
+if __name__ == "__main__":
+    print("Module exposure chargé avec succès ✓")
@@ -7,16 +7,35 @@ Interface en ligne de commande (CLI) pour analyser les ressources.
 import argparse
 import sys
 import os
+import threading
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
 from colorama import init, Fore, Style
 
 # Ajouter le dossier parent au PYTHONPATH pour permettre les imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.resource_finder import ResourceFinder
-from src.map_generator import MapGenerator
+from src.modern_region_reader import ModernRegionReader
+from src.map_generator import MapGenerator, StreamingMap
 from src.statistics import StatisticsCalculator
-from src.config import RESOURCE_GROUPS
+from src.batch_query import BatchQueryRunner, load_queries, export_batch_results
+from src.daemon import QueryDaemon, serve
+from src.ore_index import OreIndex
+from src.watcher import RegionWatcher, WatchUpdate
+from src.census import run_census
+from src.region_summary import RegionSummaryStore
+from src.reader_backend import ReaderBackend, available_backends, create_backend
+from src.dimension_scan import scan_dimensions
+from src.shards import ShardResult, parse_shard, partition_regions, merge_shards
+from src.checkpoint import ScanCheckpoint
+from src.snapshot_diff import SnapshotDiffer
+from src.chunk_cache import ChunkResultCache
+from src.config import (
+    RESOURCE_GROUPS, RESOURCE_Y_DISTRIBUTION, APP_CONFIG, DIMENSIONS, DIMENSION_RESOURCES,
+    get_resource_dimension
+)
 
 # Initialiser colorama pour les couleurs dans le terminal
 init(autoreset=True)
@@ -68,6 +87,46 @@ Exemples d'utilisation:
   # Exporter les données en JSON
   python main.py --world-path /path/to/world --resource diamond --export-json output/diamonds.json
   
+  # Plusieurs recherches (x, z, rayon, ressources) en une seule passe
+  python main.py --world-path /path/to/world --batch queries.json --export-json output/batch.json
+  
+  # Démon de requêtes (ex: curl "http://127.0.0.1:8765/nearest?x=-88&z=23&resource=diamond")
+  python main.py --world-path /path/to/world --serve --port 8765
+  
+  # Recensement complet des blocs par Y et par région
+  python main.py --world-path /path/to/world --census output/census.npz --workers 8
+  
+  # Débris antiques du Nether (la dimension est déduite de la ressource)
+  python main.py --world-path /path/to/world --resource ancient_debris
+  
+  # Toutes les ressources des trois dimensions en un seul job
+  python main.py --world-path /path/to/world --dimension all --workers 8 --export-json output/all.json
+  
+  # Minerais apparus / minés depuis une ancienne sauvegarde
+  python main.py --world-path /path/to/world --diff backups/world-2024-05-01.tar.gz \\
+      --export-json output/diff.json
+  
+  # Reprendre un scan interrompu (les régions terminées ne sont pas rescannées)
+  python main.py --world-path /path/to/world --resource diamond --resume
+  
+  # Scan réparti sur 4 machines (monde partagé), puis fusion des résultats partiels
+  python main.py --world-path /nfs/world --resource diamond --shard 1/4
+  python main.py --world-path /nfs/world --merge output/shards/diamond_*of4.npz --generate-map
+  
+  # Les 20 diamants les plus proches de la base, écrits dès qu'ils sont connus
+  python main.py --world-path /path/to/world --resource diamond --stream output/near.jsonl \\
+      --near 120 -340 --limit 20
+  
+  # Diamants, or, fer et émeraudes sur une seule carte (un seul scan)
+  python main.py --world-path /path/to/world --composite-map diamond gold iron emerald
+  
+  # Vue d'ensemble instantanée depuis les résumés par région (heatmap + rapport)
+  python main.py --world-path /path/to/world --overview --resource diamond
+  
+  # Rafraîchir l'export JSON à chaque modification du monde
+  python main.py --world-path /path/to/world --resource diamond --watch --interval 300 \\
+      --index output/index.json.gz --export-json output/diamonds.json
+  
 Ressources disponibles: {}
         """.format(", ".join(RESOURCE_GROUPS.keys()))
     )
@@ -83,9 +142,155 @@ Ressources disponibles: {}
     parser.add_argument(
         "--resource",
         type=str,
-        required=True,
         choices=list(RESOURCE_GROUPS.keys()),
-        help="Type de ressource à rechercher"
+        help="Type de ressource à rechercher "
+             "(obligatoire sauf avec --batch, --serve, --overview, --census, --merge, --diff, "
+             "--composite-map ou --dimension all)"
+    )
+    
+    parser.add_argument(
+        "--batch",
+        type=str,
+        metavar="FILE",
+        help="Fichier JSON de requêtes [{name, x, z, radius, resources}] traitées en une passe"
+    )
+    
+    # Mode démon
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Lancer le démon de requêtes (/radius, /nearest, /stats, /map, /info)"
+    )
+    
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="Adresse d'écoute du démon (défaut: 127.0.0.1)"
+    )
+    
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Port d'écoute du démon (défaut: 8765)"
+    )
+    
+    parser.add_argument(
+        "--socket",
+        type=str,
+        metavar="PATH",
+        help="Écouter sur une socket Unix plutôt qu'en TCP"
+    )
+    
+    parser.add_argument(
+        "--preload",
+        action="store_true",
+        help="Indexer tout le monde au démarrage du démon"
+    )
+    
+    # Mode watch
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Surveiller les régions et ne re-scanner que les chunks modifiés"
+    )
+    
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=300,
+        help="Délai entre deux passages de surveillance en secondes (défaut: 300)"
+    )
+    
+    parser.add_argument(
+        "--index",
+        type=str,
+        metavar="PATH",
+        help="Index persistant des minerais (rechargé au démarrage, mis à jour par --watch)"
+    )
+    
+    # Recensement
+    parser.add_argument(
+        "--census",
+        type=str,
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="Recenser tous les blocs par Y et par région (export .npz, défaut: <output-dir>/census.npz)"
+    )
+    
+    parser.add_argument(
+        "--backend",
+        choices=available_backends(),
+        default=APP_CONFIG["reader_backend"],
+        help="Lecteur de région (défaut: %(default)s ; \"anvil\" pour les mondes 1.13-1.17)"
+    )
+    
+    parser.add_argument(
+        "--dimension",
+        choices=list(DIMENSIONS) + ["all"],
+        help="Dimension analysée (défaut: celle de la ressource ; \"all\" = les trois en un seul job)"
+    )
+    
+    parser.add_argument(
+        "--overview",
+        action="store_true",
+        help="Vue d'ensemble depuis les résumés par région (seules les régions modifiées sont rescannées)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Nombre de processus pour le recensement et --dimension all (défaut: nombre de CPU)"
+    )
+    
+    parser.add_argument(
+        "--diff",
+        type=str,
+        metavar="OLD",
+        help="Comparer le monde à une ancienne copie (dossier ou archive) : minerais apparus et disparus"
+    )
+    
+    parser.add_argument(
+        "--chunk-cache",
+        type=str,
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="Réutiliser les résultats des chunks déjà vus, même dans une autre sauvegarde "
+             f"(scans complets et recensement, défaut: {APP_CONFIG['chunk_cache']})"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reprendre un scan interrompu depuis son point de reprise (mêmes options)"
+    )
+    
+    # Scan distribué
+    parser.add_argument(
+        "--shard",
+        type=str,
+        metavar="i/N",
+        help="Ne scanner que la part i (1 à N) des régions, équilibrée par taille, "
+             "et écrire un résultat partiel"
+    )
+    
+    parser.add_argument(
+        "--shard-output",
+        type=str,
+        metavar="PATH",
+        help="Fichier du résultat partiel (défaut: <output-dir>/shards/<ressource>_<dimension>_<i>of<N>.npz)"
+    )
+    
+    parser.add_argument(
+        "--merge",
+        type=str,
+        nargs="+",
+        metavar="SHARD",
+        help="Fusionner les résultats partiels de --shard (rapport, cartes, export JSON)"
     )
     
     # Filtres de zone
@@ -105,6 +310,27 @@ Ressources disponibles: {}
         help="Plage de chunks en Z (ex: --z-range -10 10)"
     )
     
+    parser.add_argument(
+        "--exposure",
+        action="store_true",
+        help="Marquer les blocs exposés à l'air ou à l'eau (visibles depuis une cave)"
+    )
+    
+    parser.add_argument(
+        "--veins",
+        action="store_true",
+        help="Regrouper les blocs en filons 3D (nombre, tailles, centres)"
+    )
+    
+    parser.add_argument(
+        "--hotspots",
+        type=str,
+        choices=["grid", "dbscan"],
+        default=APP_CONFIG["hotspot_method"],
+        help="Détection des zones riches: cercles sur grille ou regroupement par densité "
+             f"(défaut: {APP_CONFIG['hotspot_method']})"
+    )
+    
     parser.add_argument(
         "--y-range",
         type=int,
@@ -120,6 +346,15 @@ Ressources disponibles: {}
         help="Générer une carte 2D des ressources"
     )
     
+    parser.add_argument(
+        "--composite-map",
+        type=str,
+        nargs="*",
+        metavar="RESOURCE",
+        help="Une seule carte de plusieurs ressources (une couche par ressource, avec légende), "
+             "en un seul scan (défaut: toutes les ressources de la dimension)"
+    )
+    
     parser.add_argument(
         "--heatmap",
         action="store_true",
@@ -145,6 +380,29 @@ Ressources disponibles: {}
         help="Inclure la liste complète des emplacements dans l'export JSON"
     )
     
+    parser.add_argument(
+        "--stream",
+        type=str,
+        metavar="PATH",
+        help="Écrire les blocs en JSON Lines au fur et à mesure du scan (mémoire constante ; "
+             "avec --generate-map, la carte est remplie pendant le scan)"
+    )
+    
+    parser.add_argument(
+        "--near",
+        type=int,
+        nargs=2,
+        metavar=("X", "Z"),
+        help="Avec --stream : blocs du plus proche au plus lointain de la position X Z"
+    )
+    
+    parser.add_argument(
+        "--limit",
+        type=int,
+        metavar="N",
+        help="Avec --stream : arrêter le scan après N blocs (avec --near : les N plus proches)"
+    )
+    
     # Options d'affichage
     parser.add_argument(
         "--no-progress",
@@ -172,7 +430,662 @@ Ressources disponibles: {}
         help="Répertoire de sortie pour les cartes et exports (défaut: output/)"
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    
+    scan_all = args.dimension == "all"
+    composite = args.composite_map is not None
+    if not (args.batch or args.serve or args.overview or args.census is not None or args.merge
+            or args.diff or composite or scan_all) and not args.resource:
+        parser.error("l'argument --resource est obligatoire "
+                     "(sauf avec --batch, --serve, --overview, --census, --merge, --diff, "
+                     "--composite-map ou --dimension all)")
+    
+    if composite:
+        if scan_all:
+            parser.error("--composite-map représente une seule dimension (pas --dimension all)")
+        unknown = [name for name in args.composite_map if name not in RESOURCE_GROUPS]
+        if unknown:
+            parser.error(f"ressource(s) inconnue(s) pour --composite-map: {', '.join(unknown)}")
+        if args.dimension is None and args.composite_map:
+            args.dimension = get_resource_dimension(args.composite_map[0])
+        dimension = args.dimension or "overworld"
+        elsewhere = [name for name in args.composite_map if get_resource_dimension(name) != dimension]
+        if elsewhere:
+            parser.error(f"{', '.join(elsewhere)} ne se trouve(nt) pas dans la dimension {dimension}")
+    
+    if args.shard:
+        try:
+            args.shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.x_range or args.z_range or scan_all:
+            parser.error("--shard ne se combine pas avec --x-range, --z-range ou --dimension all")
+        if args.exposure:
+            # Les chunks voisins appartenant aux autres shards ne seraient jamais lus
+            parser.error("--shard ne se combine pas avec --exposure (exposition incomplète aux bords des régions)")
+    
+    if (args.batch or args.serve or args.watch or args.census is not None or args.overview or args.diff) and scan_all:
+        parser.error("--batch, --serve, --watch, --census, --overview et --diff portent sur une seule "
+                     "dimension (pas --dimension all)")
+    if (args.serve or args.watch) and args.backend != "modern":
+        parser.error("--serve et --watch utilisent le lecteur modern (index et cache de sections)")
+    
+    if args.resume and args.exposure:
+        # Les faces des régions terminées ne sont pas enregistrées : leurs voisines
+        # reprises ne verraient pas les cavités de l'autre côté de la bordure
+        parser.error("--resume ne se combine pas avec --exposure (relancer le scan complet)")
+    
+    if (args.near or args.limit) and not args.stream:
+        parser.error("--near et --limit s'utilisent avec --stream")
+    if args.stream and (args.exposure or args.veins or args.shard or args.resume or scan_all):
+        parser.error("--stream ne se combine pas avec --exposure, --veins, --shard, --resume "
+                     "ou --dimension all")
+    
+    if args.dimension is None:
+        args.dimension = get_resource_dimension(args.resource) if args.resource else "overworld"
+    elif args.resource and not scan_all and get_resource_dimension(args.resource) != args.dimension:
+        parser.error(f"{args.resource} ne se trouve pas dans la dimension {args.dimension}")
+    
+    return args
+
+
+def write_outputs(args, stats, calc: StatisticsCalculator):
+    """
+    Génère les sorties demandées (cartes, graphique, export JSON) pour une ressource.
+    
+    Args:
+        args: Arguments parsés
+        stats: Statistiques de la ressource
+        calc: Calculateur de statistiques
+    """
+    output_dir = Path(args.output_dir)
+    
+    if args.generate_map:
+        print(f"{Fore.CYAN}🗺️  Génération de la carte...{Style.RESET_ALL}")
+        map_gen = MapGenerator(str(output_dir / "maps"))
+        map_path = map_gen.generate_2d_map(
+            stats,
+            y_level=args.y_level,
+            show_hotspots=True
+        )
+        print_success(f"Carte générée: {map_path}")
+    
+    if args.heatmap:
+        print(f"{Fore.CYAN}🌡️  Génération de la heatmap...{Style.RESET_ALL}")
+        map_gen = MapGenerator(str(output_dir / "maps"))
+        heatmap_path = map_gen.generate_heatmap(
+            stats,
+            y_level=args.y_level
+        )
+        print_success(f"Heatmap générée: {heatmap_path}")
+    
+    if args.height_chart:
+        print(f"{Fore.CYAN}📈 Génération du graphique de distribution...{Style.RESET_ALL}")
+        map_gen = MapGenerator(str(output_dir / "maps"))
+        chart_path = map_gen.generate_height_distribution_chart(stats)
+        print_success(f"Graphique généré: {chart_path}")
+    
+    if args.export_json:
+        print(f"{Fore.CYAN}💾 Export JSON...{Style.RESET_ALL}")
+        json_path = calc.export_to_json(
+            stats,
+            args.export_json,
+            include_locations=args.include_locations
+        )
+        print_success(f"Données exportées: {json_path}")
+
+
+def run_batch(args, world_path: Path):
+    """
+    Exécute un lot de requêtes (--batch) en une seule passe sur le monde.
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+    """
+    queries = load_queries(args.batch)
+    elsewhere = sorted({
+        name for query in queries for name in query.resources
+        if get_resource_dimension(name) != args.dimension
+    })
+    if elsewhere:
+        raise ValueError(f"{', '.join(elsewhere)} ne se trouve(nt) pas dans la dimension {args.dimension} "
+                         f"(préciser --dimension, un lot par dimension)")
+    print_info(f"{len(queries)} requête(s) chargée(s) depuis {args.batch}\n")
+    
+    print(f"{Fore.CYAN}🔎 Analyse en cours...{Style.RESET_ALL}\n")
+    runner = BatchQueryRunner(create_backend(args.backend, str(world_path), args.dimension))
+    results = runner.run(queries, show_progress=not args.no_progress)
+    
+    print()
+    print_success(f"{runner.chunks_scanned} chunks lus (chacun une seule fois)")
+    
+    for result in results:
+        q = result.query
+        print(f"\n{Fore.YELLOW}📍 {q.name} (X={q.x}, Z={q.z}, rayon {q.radius:g}){Style.RESET_ALL}")
+        for resource_name, hits in result.hits.items():
+            if hits:
+                closest = hits[0]
+                print(f"   • {resource_name}: {len(hits)} blocs "
+                      f"(plus proche: X={closest.x}, Y={closest.y}, Z={closest.z}, "
+                      f"{closest.distance:.1f}m)")
+            else:
+                print(f"   • {resource_name}: aucun")
+    
+    if args.export_json:
+        print(f"\n{Fore.CYAN}💾 Export JSON...{Style.RESET_ALL}")
+        json_path = export_batch_results(
+            results,
+            args.export_json,
+            include_locations=args.include_locations
+        )
+        print_success(f"Données exportées: {json_path}")
+    
+    print(f"\n{Fore.GREEN}✅ Analyse terminée avec succès !{Style.RESET_ALL}\n")
+
+
+def run_overview(args, world_path: Path):
+    """
+    Affiche la vue d'ensemble du monde depuis les résumés par région (--overview).
+    
+    Les régions sans résumé à jour (nouvelles ou modifiées) sont scannées d'abord.
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+    """
+    store = RegionSummaryStore(str(world_path),
+                               reader=create_backend(args.backend, str(world_path), args.dimension))
+    summaries, missing = store.load_all()
+    print_info(f"{len(summaries)} résumé(s) de région à jour, {len(missing)} région(s) à scanner")
+    
+    if missing:
+        print(f"{Fore.CYAN}🔎 Résumé des régions manquantes...{Style.RESET_ALL}\n")
+        summaries += store.build(missing, show_progress=not args.no_progress)
+    
+    if not summaries:
+        print_error("Aucune région trouvée")
+        return
+    
+    calc = StatisticsCalculator()
+    calc.print_overview(summaries)
+    
+    map_gen = MapGenerator(output_dir=str(Path(args.output_dir) / "maps"))
+    resources = [args.resource] if args.resource else summaries[0].resources
+    for resource in resources:
+        if not any(summary.total(resource) for summary in summaries):
+            continue
+        heatmap_path = map_gen.generate_heatmap(summaries=summaries, resource_name=resource)
+        print_success(f"Heatmap générée: {heatmap_path}")
+    
+    if args.export_json:
+        json_path = calc.export_overview_to_json(summaries, args.export_json)
+        print_success(f"Données exportées: {json_path}")
+    
+    print(f"\n{Fore.GREEN}✅ Analyse terminée avec succès !{Style.RESET_ALL}\n")
+
+
+def run_all_dimensions(args, world_path: Path):
+    """
+    Cherche les ressources des trois dimensions en un seul job (--dimension all).
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+    """
+    print(f"{Fore.CYAN}🔎 Analyse de toutes les dimensions...{Style.RESET_ALL}\n")
+    results = scan_dimensions(
+        str(world_path),
+        resources=[args.resource] if args.resource else None,
+        workers=args.workers,
+        backend=args.backend,
+        hotspot_method=args.hotspots,
+        show_progress=not args.no_progress
+    )
+    
+    if not results:
+        print_error("Aucune région trouvée")
+        return
+    
+    for dimension, by_resource in results.items():
+        print(f"\n{Fore.YELLOW}🌍 {dimension}{Style.RESET_ALL}")
+        for resource_name, stats in by_resource.items():
+            print(f"   • {resource_name}: {stats.total_count} blocs, "
+                  f"{len(stats.hotspots)} zone(s) riche(s)")
+    
+    output_dir = Path(args.output_dir)
+    if args.generate_map or args.heatmap or args.height_chart:
+        map_gen = MapGenerator(str(output_dir / "maps" / "dimensions"))
+        for by_resource in results.values():
+            for stats in by_resource.values():
+                if stats.total_count == 0:
+                    continue
+                if args.generate_map:
+                    print_success(f"Carte générée: {map_gen.generate_2d_map(stats, y_level=args.y_level)}")
+                if args.heatmap:
+                    print_success(f"Heatmap générée: {map_gen.generate_heatmap(stats, y_level=args.y_level)}")
+                if args.height_chart:
+                    print_success(f"Graphique généré: {map_gen.generate_height_distribution_chart(stats)}")
+    
+    if args.export_json:
+        print(f"\n{Fore.CYAN}💾 Export JSON...{Style.RESET_ALL}")
+        json_path = StatisticsCalculator().export_dimensions_to_json(
+            results,
+            args.export_json,
+            include_locations=args.include_locations
+        )
+        print_success(f"Données exportées: {json_path}")
+    
+    print(f"\n{Fore.GREEN}✅ Analyse terminée avec succès !{Style.RESET_ALL}\n")
+
+
+def open_checkpoint(args, world_path: Path, reader: ReaderBackend) -> ScanCheckpoint:
+    """
+    Prépare le point de reprise du scan décrit par les arguments.
+    
+    Avec --resume, le point de reprise existant est relu s'il correspond aux mêmes
+    options ; sinon il est remplacé par un nouveau.
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+        reader: Lecteur des régions scannées
+    
+    Returns:
+        Point de reprise à passer à ResourceFinder
+    """
+    name = f"{args.resource}_{args.dimension}"
+    if args.shard:
+        name += f"_{args.shard[0]}of{args.shard[1]}"
+    checkpoint = ScanCheckpoint(
+        str(Path(APP_CONFIG["checkpoint_dir"]) / world_path.resolve().name / name),
+        {
+            "world": str(world_path.resolve()),
+            "resource": args.resource,
+            "dimension": args.dimension,
+            "shard": args.shard,
+            "x_range": args.x_range,
+            "z_range": args.z_range,
+            "y_range": args.y_range,
+            "exposure": args.exposure
+        },
+        region_stat=reader.region_stat
+    )
+    
+    if args.resume and checkpoint.load():
+        print_info(f"Reprise: {len(checkpoint.completed)} région(s) déjà terminée(s)")
+    else:
+        if args.resume:
+            print_info("Aucun point de reprise pour ces options, scan complet")
+        checkpoint.clear()
+    
+    return checkpoint
+
+
+def run_shard(args, world_path: Path):
+    """
+    Scanne la part i/N des régions (--shard) et écrit le résultat partiel.
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+    """
+    index, count = args.shard
+    finder = ResourceFinder(str(world_path), hotspot_method=args.hotspots, backend=args.backend,
+                            dimension=args.dimension, chunk_cache=open_chunk_cache(args))
+    region_size = lambda region_file: finder.reader.region_stat(region_file)[0]
+    region_files = partition_regions(finder.reader.list_region_files(), count, region_size)[index - 1]
+    print_info(f"Shard {index}/{count}: {len(region_files)} région(s) "
+               f"({sum(map(region_size, region_files)) / 1e6:.1f} Mo)\n")
+    
+    y_range = tuple(args.y_range) if args.y_range else RESOURCE_Y_DISTRIBUTION.get(args.resource, (-64, 320))
+    
+    checkpoint = open_checkpoint(args, world_path, finder.reader)
+    
+    print(f"{Fore.CYAN}🔎 Analyse en cours...{Style.RESET_ALL}\n")
+    locations = finder.collect_locations(
+        args.resource,
+        y_range=y_range,
+        show_progress=not args.no_progress,
+        exposure=args.exposure,
+        region_files=region_files,
+        checkpoint=checkpoint
+    )
+    
+    result = ShardResult(
+        resource_type=args.resource,
+        dimension=args.dimension,
+        shard_index=index,
+        shard_count=count,
+        y_range=y_range,
+        regions=[f.name for f in region_files],
+        locations=locations,
+        exposure=args.exposure
+    )
+    output_path = args.shard_output or str(
+        Path(args.output_dir) / "shards" / f"{args.resource}_{args.dimension}_{index}of{count}.npz"
+    )
+    shard_path = result.save(output_path)
+    checkpoint.clear()
+    
+    print()
+    print_success(f"{len(locations)} {args.resource}(s) trouvé(s) dans le shard {index}/{count}")
+    print_success(f"Résultat partiel écrit: {shard_path}")
+    print(f"\n{Fore.GREEN}✅ Analyse terminée avec succès !{Style.RESET_ALL}\n")
+
+
+def run_merge(args, world_path: Path):
+    """
+    Fusionne les résultats partiels des shards (--merge) et génère les sorties.
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+    """
+    print(f"{Fore.CYAN}🧩 Fusion de {len(args.merge)} shard(s)...{Style.RESET_ALL}")
+    stats = merge_shards(args.merge, str(world_path), hotspot_method=args.hotspots, veins=args.veins)
+    
+    print_success(f"{stats.total_count} {stats.resource_type}(s) trouvé(s) !")
+    
+    calc = StatisticsCalculator()
+    if args.stats:
+        calc.print_summary(stats)
+    else:
+        print(f"\n{Fore.YELLOW}📊 Résumé:{Style.RESET_ALL}")
+        print(f"   • Total: {stats.total_count} blocs")
+        print(f"   • Zones riches détectées: {len(stats.hotspots)}\n")
+    
+    write_outputs(args, stats, calc)
+    
+    print(f"\n{Fore.GREEN}✅ Analyse terminée avec succès !{Style.RESET_ALL}\n")
+
+
+def run_diff(args, world_path: Path):
+    """
+    Compare le monde à une ancienne copie (--diff) : minerais apparus et disparus.
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde (copie la plus récente)
+    """
+    print_info(f"Ancienne copie: {args.diff}")
+    
+    print(f"{Fore.CYAN}🔎 Comparaison des copies...{Style.RESET_ALL}\n")
+    diff = SnapshotDiffer(args.diff, str(world_path), args.dimension).diff(show_progress=not args.no_progress)
+    
+    print()
+    print_success(f"{diff.chunks_compared} chunks comparés: {diff.chunks_unchanged} inchangés "
+                  f"(dont {diff.chunks_resaved} resauvegardés), {diff.chunks_modified} modifiés, "
+                  f"{diff.chunks_generated} générés, {diff.chunks_deleted} supprimés")
+    
+    resources = [args.resource] if args.resource else list(diff.added)
+    print(f"\n{Fore.YELLOW}📊 Variations:{Style.RESET_ALL}")
+    for resource in resources:
+        added, removed = len(diff.added[resource]), len(diff.removed[resource])
+        if added or removed:
+            print(f"   • {resource}: +{added} / -{removed}")
+    
+    if args.export_json:
+        print(f"\n{Fore.CYAN}💾 Export JSON...{Style.RESET_ALL}")
+        json_path = diff.export_to_json(args.export_json)
+        print_success(f"Données exportées: {json_path}")
+    
+    print(f"\n{Fore.GREEN}✅ Analyse terminée avec succès !{Style.RESET_ALL}\n")
+
+
+def chunk_cache_path(args) -> Optional[str]:
+    """Chemin du cache des résultats par chunk (--chunk-cache), ou None."""
+    if args.chunk_cache is None:
+        return None
+    return args.chunk_cache or APP_CONFIG["chunk_cache"]
+
+
+def open_chunk_cache(args) -> Optional[ChunkResultCache]:
+    """Ouvre le cache des résultats par chunk si --chunk-cache est demandé."""
+    path = chunk_cache_path(args)
+    return ChunkResultCache(path) if path else None
+
+
+def run_composite_map(args, world_path: Path):
+    """
+    Cherche plusieurs ressources en un seul scan et les dessine sur une seule carte
+    (--composite-map).
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+    """
+    resources = args.composite_map or DIMENSION_RESOURCES[args.dimension]
+    print(f"{Fore.CYAN}🔎 Analyse de {len(resources)} ressource(s) en un seul scan...{Style.RESET_ALL}\n")
+    results = scan_dimensions(
+        str(world_path),
+        dimensions=[args.dimension],
+        resources=resources,
+        workers=args.workers,
+        backend=args.backend,
+        show_progress=not args.no_progress,
+        hotspots=False
+    )
+    
+    if not results:
+        print_error("Aucune région trouvée")
+        return
+    
+    layers = results[args.dimension]
+    print()
+    for resource_name, stats in layers.items():
+        print(f"   • {resource_name}: {stats.total_count} blocs")
+    
+    print(f"\n{Fore.CYAN}🗺️  Génération de la carte composite...{Style.RESET_ALL}")
+    map_gen = MapGenerator(str(Path(args.output_dir) / "maps"))
+    map_path = map_gen.generate_composite_map(layers.values(), y_level=args.y_level)
+    print_success(f"Carte générée: {map_path}")
+    
+    print(f"\n{Fore.GREEN}✅ Analyse terminée avec succès !{Style.RESET_ALL}\n")
+
+
+def run_stream(args, world_path: Path):
+    """
+    Écrit les blocs trouvés au fil du scan (--stream), et remplit la carte en même temps.
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+    """
+    finder = ResourceFinder(str(world_path), hotspot_method=args.hotspots, backend=args.backend,
+                            write_summaries=False, dimension=args.dimension)
+    x_range = tuple(args.x_range) if args.x_range else None
+    z_range = tuple(args.z_range) if args.z_range else None
+    batches = finder.iter_hit_batches(
+        args.resource,
+        x_range=x_range,
+        z_range=z_range,
+        y_range=tuple(args.y_range) if args.y_range else None,
+        origin=tuple(args.near) if args.near else None,
+        limit=args.limit,
+        show_progress=not args.no_progress
+    )
+    
+    stream_map = None
+    if args.generate_map:
+        stream_map = StreamingMap(args.resource, finder.block_bounds(x_range, z_range), args.y_level)
+    
+    def rendered():
+        for batch in batches:
+            if stream_map:
+                stream_map.add(batch)
+            yield batch
+    
+    if args.near:
+        print_info(f"Ordre: du plus proche au plus lointain de X={args.near[0]}, Z={args.near[1]}")
+    print(f"{Fore.CYAN}🔎 Analyse en cours (écriture au fil de l'eau dans {args.stream})...{Style.RESET_ALL}\n")
+    stream_path, count = StatisticsCalculator().export_hits_to_jsonl(rendered(), args.stream)
+    
+    print()
+    print_success(f"{count} {args.resource}(s) exporté(s): {stream_path}")
+    
+    if stream_map:
+        map_gen = MapGenerator(str(Path(args.output_dir) / "maps"))
+        print_success(f"Carte générée: {map_gen.save_stream_map(stream_map)}")
+    
+    print(f"\n{Fore.GREEN}✅ Analyse terminée avec succès !{Style.RESET_ALL}\n")
+
+
+def run_block_census(args, world_path: Path):
+    """
+    Recense tous les blocs du monde par Y et par région (--census).
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+    """
+    y_min, y_max = args.y_range if args.y_range else (None, None)
+    
+    print(f"{Fore.CYAN}🧮 Recensement des blocs...{Style.RESET_ALL}\n")
+    census = run_census(
+        str(world_path),
+        workers=args.workers,
+        y_min=y_min,
+        y_max=y_max,
+        show_progress=not args.no_progress,
+        cache_path=chunk_cache_path(args),
+        dimension=args.dimension,
+        backend=args.backend
+    )
+    
+    totals = census.total.totals()
+    total_blocks = sum(totals.values())
+    print()
+    print_success(f"{total_blocks:,} blocs recensés dans {len(census.regions)} région(s), "
+                  f"{len(totals)} types de blocs")
+    
+    print(f"\n{Fore.YELLOW}📊 Blocs les plus fréquents:{Style.RESET_ALL}")
+    for name, count in list(totals.items())[:10]:
+        print(f"   • {name}: {count:,} ({count / total_blocks * 100:.2f}%)")
+    
+    output_path = args.census or str(Path(args.output_dir) / "census.npz")
+    census_path = census.save(output_path)
+    print_success(f"Recensement exporté: {census_path}")
+    
+    print(f"\n{Fore.GREEN}✅ Analyse terminée avec succès !{Style.RESET_ALL}\n")
+
+
+def create_watcher(args, reader: ModernRegionReader, index: OreIndex) -> RegionWatcher:
+    """
+    Crée la surveillance des régions, en rechargeant l'index persistant si demandé.
+    
+    Args:
+        args: Arguments parsés
+        reader: Lecteur de région du monde
+        index: Index des minerais à maintenir
+    
+    Returns:
+        Surveillance prête à l'emploi
+    """
+    watcher = RegionWatcher(reader, index)
+    
+    if args.index and index.load(args.index):
+        watcher.load_state(args.index + ".regions.json")
+        print_success(f"Index rechargé: {args.index} ({index.info()['chunks_indexes']} chunks)")
+    
+    return watcher
+
+
+def on_watch_update(args, watcher: RegionWatcher, update: WatchUpdate, refresh=None):
+    """
+    Affiche le résultat d'un passage de surveillance et persiste l'index s'il a changé.
+    
+    Args:
+        args: Arguments parsés
+        watcher: Surveillance en cours
+        update: Résultat du passage
+        refresh: Fonction appelée si l'index a changé (rafraîchir les sorties)
+    """
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    
+    if not update.changed:
+        print_info(f"[{timestamp}] Aucun changement ({update.regions_checked} régions, "
+                   f"{update.duration * 1000:.0f} ms)")
+        return
+    
+    print_success(f"[{timestamp}] {len(update.chunks_updated)} chunk(s) mis à jour, "
+                  f"{len(update.chunks_removed)} supprimé(s) dans {update.regions_changed} "
+                  f"région(s) ({update.duration:.2f} s)")
+    
+    if args.index:
+        watcher.index.save(args.index)
+        watcher.save_state(args.index + ".regions.json")
+    
+    if refresh:
+        refresh()
+
+
+def run_watch(args, world_path: Path):
+    """
+    Surveille le monde (--watch) et rafraîchit les sorties à chaque changement.
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+    """
+    finder = ResourceFinder(str(world_path), hotspot_method=args.hotspots, dimension=args.dimension)
+    index = OreIndex(finder.reader)
+    watcher = create_watcher(args, finder.reader, index)
+    calc = StatisticsCalculator()
+    
+    y_min, y_max = args.y_range or RESOURCE_Y_DISTRIBUTION.get(args.resource, (-64, 320))
+    
+    def refresh():
+        locations = [loc for loc in index.locations(args.resource) if y_min <= loc.y <= y_max]
+        stats = finder.stats_from_locations(args.resource, locations)
+        print_info(f"{stats.total_count} {args.resource}(s) dans l'index")
+        if stats.total_count:
+            write_outputs(args, stats, calc)
+    
+    print_info(f"Surveillance toutes les {args.interval:g} s (Ctrl-C pour arrêter)\n")
+    watcher.watch(
+        interval=args.interval,
+        on_update=lambda update: on_watch_update(args, watcher, update, refresh)
+    )
+
+
+def run_daemon(args, world_path: Path):
+    """
+    Lance le démon de requêtes (--serve) jusqu'à Ctrl-C.
+    
+    Args:
+        args: Arguments parsés
+        world_path: Chemin du monde
+    """
+    daemon = QueryDaemon(str(world_path), output_dir=args.output_dir, dimension=args.dimension)
+    
+    if args.watch:
+        # L'index du démon est maintenu à jour en arrière-plan
+        watcher = create_watcher(args, daemon.reader, daemon.index)
+        thread = threading.Thread(
+            target=watcher.watch,
+            kwargs={
+                "interval": args.interval,
+                "on_update": lambda update: on_watch_update(
+                    args, watcher, update, daemon.invalidate_stats
+                )
+            },
+            daemon=True
+        )
+        thread.start()
+    elif args.preload:
+        print(f"{Fore.CYAN}🔍 Indexation du monde...{Style.RESET_ALL}")
+        daemon.index.load_all(show_progress=not args.no_progress)
+        info = daemon.index.info()
+        print_success(f"{info['minerais_indexes']} minerais indexés dans {info['chunks_indexes']} chunks")
+    
+    if args.socket:
+        print_success(f"Démon à l'écoute sur la socket {args.socket}")
+    else:
+        print_success(f"Démon à l'écoute sur http://{args.host}:{args.port}")
+    print_info("Routes: /radius, /nearest, /block, /stats, /map, /info (Ctrl-C pour arrêter)\n")
+    
+    serve(daemon, host=args.host, port=args.port, socket_path=args.socket)
 
 
 def main():
@@ -189,7 +1102,45 @@ def main():
         sys.exit(1)
     
     print_info(f"Monde: {world_path}")
+    
+    scan_all = args.dimension == "all"
+    if (args.batch or args.serve or args.watch or args.overview or args.census is not None
+            or args.merge or args.shard or args.diff or args.stream or args.composite_map is not None
+            or scan_all):
+        try:
+            if args.census is not None:
+                run_block_census(args, world_path)
+            elif args.diff:
+                run_diff(args, world_path)
+            elif args.merge:
+                run_merge(args, world_path)
+            elif args.shard:
+                run_shard(args, world_path)
+            elif args.stream:
+                run_stream(args, world_path)
+            elif args.composite_map is not None:
+                run_composite_map(args, world_path)
+            elif scan_all:
+                run_all_dimensions(args, world_path)
+            elif args.overview:
+                run_overview(args, world_path)
+            elif args.serve:
+                run_daemon(args, world_path)
+            elif args.watch:
+                run_watch(args, world_path)
+            else:
+                run_batch(args, world_path)
+        except KeyboardInterrupt:
+            print(f"\n{Fore.YELLOW}⚠️  Analyse interrompue par l'utilisateur{Style.RESET_ALL}")
+            sys.exit(1)
+        except Exception as e:
+            print_error(f"Erreur: {e}")
+            sys.exit(1)
+        return
+    
     print_info(f"Ressource: {args.resource}")
+    if args.dimension != "overworld":
+        print_info(f"Dimension: {args.dimension}")
     
     if args.x_range:
         print_info(f"Zone X: chunks {args.x_range[0]} à {args.x_range[1]}")
@@ -203,7 +1154,11 @@ def main():
     try:
         # Initialiser le finder
         print(f"{Fore.CYAN}🔍 Initialisation...{Style.RESET_ALL}")
-        finder = ResourceFinder(str(world_path))
+        finder = ResourceFinder(str(world_path), hotspot_method=args.hotspots, backend=args.backend,
+                                dimension=args.dimension, chunk_cache=open_chunk_cache(args))
+        
+        # Pas de reprise avec --exposure : l'exposition demande le scan complet
+        checkpoint = None if args.exposure else open_checkpoint(args, world_path, finder.reader)
         
         # Rechercher les ressources
         print(f"{Fore.CYAN}🔎 Analyse en cours...{Style.RESET_ALL}\n")
@@ -212,8 +1167,13 @@ def main():
             x_range=tuple(args.x_range) if args.x_range else None,
             z_range=tuple(args.z_range) if args.z_range else None,
             y_range=tuple(args.y_range) if args.y_range else None,
-            show_progress=not args.no_progress
+            show_progress=not args.no_progress,
+            exposure=args.exposure,
+            veins=args.veins,
+            checkpoint=checkpoint
         )
+        if checkpoint:
+            checkpoint.clear()
         
         print()
         
@@ -234,6 +1194,11 @@ def main():
             print(f"\n{Fore.YELLOW}📊 Résumé:{Style.RESET_ALL}")
             print(f"   • Total: {stats.total_count} blocs")
             print(f"   • Zones riches détectées: {len(stats.hotspots)}")
+            if stats.exposed_count is not None:
+                print(f"   • Exposés (visibles depuis une cave): {stats.exposed_count} blocs")
+            if stats.veins is not None:
+                print(f"   • Filons: {len(stats.veins)} "
+                      f"(le plus gros: {stats.veins[0].size if stats.veins else 0} blocs)")
             
             if stats.hotspots:
                 top_hotspot = stats.hotspots[0]
@@ -241,46 +1206,14 @@ def main():
                       f"({top_hotspot[2]} blocs)\n")
         
         # Générer les outputs demandés
-        output_dir = Path(args.output_dir)
-        
-        if args.generate_map:
-            print(f"{Fore.CYAN}🗺️  Génération de la carte...{Style.RESET_ALL}")
-            map_gen = MapGenerator(str(output_dir / "maps"))
-            map_path = map_gen.generate_2d_map(
-                stats,
-                y_level=args.y_level,
-                show_hotspots=True
-            )
-            print_success(f"Carte générée: {map_path}")
-        
-        if args.heatmap:
-            print(f"{Fore.CYAN}🌡️  Génération de la heatmap...{Style.RESET_ALL}")
-            map_gen = MapGenerator(str(output_dir / "maps"))
-            heatmap_path = map_gen.generate_heatmap(
-                stats,
-                y_level=args.y_level
-            )
-            print_success(f"Heatmap générée: {heatmap_path}")
-        
-        if args.height_chart:
-            print(f"{Fore.CYAN}📈 Génération du graphique de distribution...{Style.RESET_ALL}")
-            map_gen = MapGenerator(str(output_dir / "maps"))
-            chart_path = map_gen.generate_height_distribution_chart(stats)
-            print_success(f"Graphique généré: {chart_path}")
-        
-        if args.export_json:
-            print(f"{Fore.CYAN}💾 Export JSON...{Style.RESET_ALL}")
-            json_path = calc.export_to_json(
-                stats,
-                args.export_json,
-                include_locations=args.include_locations
-            )
-            print_success(f"Données exportées: {json_path}")
+        write_outputs(args, stats, calc)
         
         print(f"\n{Fore.GREEN}✅ Analyse terminée avec succès !{Style.RESET_ALL}\n")
     
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}⚠️  Analyse interrompue par l'utilisateur{Style.RESET_ALL}")
+        if not args.exposure:
+            print_info("Régions terminées enregistrées : relancer avec --resume pour continuer")
         sys.exit(1)
     
     except Exception as e:
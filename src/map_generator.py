@@ -2,16 +2,93 @@
 Module de génération de cartes visuelles pour les ressources.
 """
 
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
 from pathlib import Path
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 
-from .resource_finder import ResourceLocation, ResourceStats
+from .resource_finder import HitBatch, ResourceLocation, ResourceStats
+from .region_summary import RegionSummary, summary_chunk_counts
 from .config import get_resource_color, APP_CONFIG
 
 
+# Dégradé des heatmaps (faible -> forte densité)
+HEATMAP_COLORS = ['#000033', '#0000FF', '#00FFFF', '#FFFF00', '#FF0000']
+
+
+def dilate_max(image: np.ndarray, size: int, fill=0) -> np.ndarray:
+    """
+    Étend chaque pixel en carré de côté 2*size+1 (maximum des voisins) ; sur un masque,
+    chaque pixel vrai devient un carré, sur une image d'indices le plus grand l'emporte.
+    
+    Args:
+        image: Masque ou image d'indices (hauteur, largeur)
+        size: Demi-côté du carré en pixels
+        fill: Valeur hors de l'image
+    
+    Returns:
+        Image étendue
+    """
+    padded = np.pad(image, size, constant_values=fill)
+    grown = image.copy()
+    height, width = image.shape
+    for dz in range(2 * size + 1):
+        for dx in range(2 * size + 1):
+            np.maximum(grown, padded[dz:dz + height, dx:dx + width], out=grown)
+    return grown
+
+
+class StreamingMap:
+    """
+    Carte 2D remplie lot par lot pendant le scan (même rendu que generate_2d_map()).
+    """
+    
+    def __init__(
+        self,
+        resource_type: str,
+        bounds: Tuple[int, int, int, int],
+        y_level: int = None,
+        scale: int = None
+    ):
+        """
+        Initialise une carte vide.
+        
+        Args:
+            resource_type: Nom de la ressource (couleur)
+            bounds: Zone couverte (x_min, z_min, x_max, z_max) en blocs
+            y_level: Niveau Y représenté (défaut: APP_CONFIG["default_y_level"])
+            scale: Échelle de la carte (1 pixel = N blocs)
+        """
+        self.resource_type = resource_type
+        self.y_level = APP_CONFIG["default_y_level"] if y_level is None else y_level
+        self.scale = APP_CONFIG["map_scale"] if scale is None else scale
+        self.count = 0  # Blocs représentés
+        
+        # Même cadrage que generate_2d_map() (marge de 50 blocs)
+        margin = 50
+        self.x_min, self.z_min = bounds[0] - margin, bounds[1] - margin
+        width = (bounds[2] + margin - self.x_min) // self.scale
+        height = (bounds[3] + margin - self.z_min) // self.scale
+        self.mask = np.zeros((height, width), dtype=bool)
+    
+    def add(self, batch: HitBatch):
+        """Rastérise un lot de blocs (ceux du niveau Y de la carte)."""
+        level = batch.coords[batch.coords[:, 1] == self.y_level]
+        height, width = self.mask.shape
+        x_pixel = (level[:, 0] - self.x_min) // self.scale
+        z_pixel = (level[:, 2] - self.z_min) // self.scale
+        inside = (x_pixel >= 0) & (x_pixel < width) & (z_pixel >= 0) & (z_pixel < height)
+        self.mask[z_pixel[inside], x_pixel[inside]] = True
+        self.count += int(inside.sum())
+    
+    def render(self) -> Image.Image:
+        """Image de la carte : un carré par bloc, comme generate_2d_map()."""
+        pixels = np.full(self.mask.shape + (3,), 40, dtype=np.uint8)
+        pixels[dilate_max(self.mask, max(1, self.scale // 2))] = get_resource_color(self.resource_type)
+        return Image.fromarray(pixels)
+
+
 class MapGenerator:
     """
     Classe pour générer des cartes visuelles des ressources.
@@ -99,8 +176,23 @@ class MapGenerator:
                 fill=resource_color
             )
         
-        # Dessiner les hotspots
-        if show_hotspots and stats.hotspots:
+        # Dessiner les zones denses (sans chevauchement) : leur boîte englobante
+        if show_hotspots and stats.clusters:
+            for cluster in stats.clusters[:5]:  # Top 5
+                bx_min, bz_min, bx_max, bz_max = cluster.bbox
+                draw.rectangle(
+                    [
+                        (bx_min - x_min) // scale,
+                        (bz_min - z_min) // scale,
+                        (bx_max - x_min) // scale,
+                        (bz_max - z_min) // scale
+                    ],
+                    outline=(255, 255, 0),
+                    width=2
+                )
+        
+        # Sinon : cercles des hotspots (méthode "grid")
+        elif show_hotspots and stats.hotspots:
             for x_center, z_center, count, radius in stats.hotspots[:5]:  # Top 5
                 x_pixel = (x_center - x_min) // scale
                 z_pixel = (z_center - z_min) // scale
@@ -122,6 +214,155 @@ class MapGenerator:
         if title is None:
             title = f"{stats.resource_type.capitalize()} - Y={y_level}" if y_level else f"{stats.resource_type.capitalize()} - All Levels"
         
+        subtitle = f"Total: {stats.total_count} blocs | Hotspots: {len(stats.hotspots)}"
+        return self._save_with_header(img, title, subtitle, f"{stats.resource_type}_map")
+    
+    def generate_2d_map_stream(
+        self,
+        batches: Iterable[HitBatch],
+        resource_type: str,
+        bounds: Tuple[int, int, int, int],
+        y_level: int = None,
+        scale: int = None,
+        title: str = None
+    ) -> Path:
+        """
+        Génère une carte 2D à partir des blocs produits au fil du scan, sans garder
+        les emplacements en mémoire (voir StreamingMap).
+        
+        Args:
+            batches: Lots de blocs (voir ResourceFinder.iter_hit_batches())
+            resource_type: Nom de la ressource (couleur, titre)
+            bounds: Zone couverte (x_min, z_min, x_max, z_max) en blocs (voir ResourceFinder.block_bounds())
+            y_level: Niveau Y pour la carte (défaut: APP_CONFIG["default_y_level"])
+            scale: Échelle de la carte (1 pixel = N blocs)
+            title: Titre personnalisé de la carte
+        
+        Returns:
+            Chemin vers l'image générée
+        """
+        stream_map = StreamingMap(resource_type, bounds, y_level, scale)
+        for batch in batches:
+            stream_map.add(batch)
+        return self.save_stream_map(stream_map, title)
+    
+    def generate_composite_map(
+        self,
+        layers: Iterable[ResourceStats],
+        y_level: int = None,
+        scale: int = None,
+        hidden: Optional[Iterable[str]] = None,
+        show_legend: bool = True,
+        title: str = None
+    ) -> Path:
+        """
+        Génère une seule carte 2D de plusieurs ressources, une couche par ressource
+        (couleurs de RESOURCE_COLORS), rastérisée en une passe pour toutes les couches.
+        
+        Les couches les plus rares sont dessinées au-dessus des plus abondantes.
+        
+        Args:
+            layers: Statistiques de chaque ressource (ex: résultat de scan_dimensions())
+            y_level: Niveau Y représenté (None = tous les niveaux)
+            scale: Échelle de la carte (1 pixel = N blocs)
+            hidden: Ressources à masquer (absentes de la carte et de la légende)
+            show_legend: Ajouter la légende (couleur et nombre de blocs par couche)
+            title: Titre personnalisé de la carte
+        
+        Returns:
+            Chemin vers l'image générée
+        """
+        if scale is None:
+            scale = APP_CONFIG["map_scale"]
+        hidden = set(hidden or ())
+        
+        # Coordonnées de chaque couche visible (une seule conversion par couche)
+        visible = []
+        for stats in layers:
+            if stats.resource_type in hidden:
+                continue
+            coords = np.array([(loc.x, loc.y, loc.z) for loc in stats.locations], dtype=np.int32).reshape(-1, 3)
+            if y_level is not None:
+                coords = coords[coords[:, 1] == y_level]
+            if len(coords):
+                visible.append((stats.resource_type, coords))
+        
+        if not visible:
+            level = f" au niveau Y={y_level}" if y_level is not None else ""
+            raise ValueError(f"Aucune ressource à afficher{level}")
+        
+        # Priorité de dessin : la couche la plus rare a l'indice le plus grand (au-dessus)
+        visible.sort(key=lambda layer: len(layer[1]), reverse=True)
+        xs = np.concatenate([coords[:, 0] for _, coords in visible])
+        zs = np.concatenate([coords[:, 2] for _, coords in visible])
+        priority = np.concatenate([
+            np.full(len(coords), i, dtype=np.int16) for i, (_, coords) in enumerate(visible)
+        ])
+        
+        # Même cadrage que generate_2d_map() (marge de 50 blocs)
+        margin = 50
+        x_min, z_min = int(xs.min()) - margin, int(zs.min()) - margin
+        width = (int(xs.max()) + margin - x_min) // scale
+        height = (int(zs.max()) + margin - z_min) // scale
+        
+        # Couche au-dessus dans chaque pixel, puis un carré par bloc
+        labels = np.full(height * width, -1, dtype=np.int16)
+        np.maximum.at(labels, ((zs - z_min) // scale) * width + (xs - x_min) // scale, priority)
+        labels = dilate_max(labels.reshape(height, width), max(1, scale // 2), fill=-1)
+        
+        palette = np.array([(40, 40, 40)] + [get_resource_color(name) for name, _ in visible], dtype=np.uint8)
+        img = Image.fromarray(palette[labels + 1])
+        
+        if show_legend:
+            img = self._add_legend(img, [(name, len(coords)) for name, coords in reversed(visible)])
+        
+        if title is None:
+            title = "Ressources - " + (f"Y={y_level}" if y_level is not None else "All Levels")
+        subtitle = f"Total: {len(xs)} blocs | Couches: {len(visible)}"
+        return self._save_with_header(img, title, subtitle, "composite_map")
+    
+    def _add_legend(self, img: Image.Image, entries: List[Tuple[str, int]]) -> Image.Image:
+        """Ajoute sous la carte une légende (pastille de couleur, ressource, nombre de blocs)."""
+        column_width, row_height = 170, 20
+        columns = max(1, img.width // column_width)
+        rows = -(-len(entries) // columns)
+        
+        legend_img = Image.new('RGB', (max(img.width, column_width), img.height + rows * row_height + 10),
+                               color=(20, 20, 20))
+        legend_img.paste(img, (0, 0))
+        draw = ImageDraw.Draw(legend_img)
+        font = ImageFont.load_default()
+        
+        for i, (name, count) in enumerate(entries):
+            x = 10 + (i % columns) * column_width
+            y = img.height + 5 + (i // columns) * row_height
+            draw.rectangle([x, y + 3, x + 10, y + 13], fill=get_resource_color(name), outline=(200, 200, 200))
+            draw.text((x + 16, y + 2), f"{name} ({count})", fill=(200, 200, 200), font=font)
+        
+        return legend_img
+    
+    def save_stream_map(self, stream_map: "StreamingMap", title: str = None) -> Path:
+        """
+        Enregistre une carte remplie au fil du scan.
+        
+        Args:
+            stream_map: Carte remplie avec StreamingMap.add()
+            title: Titre personnalisé de la carte
+        
+        Returns:
+            Chemin vers l'image générée
+        """
+        if not stream_map.count:
+            raise ValueError(f"Aucune ressource trouvée au niveau Y={stream_map.y_level}")
+        if title is None:
+            title = f"{stream_map.resource_type.capitalize()} - Y={stream_map.y_level}"
+        return self._save_with_header(stream_map.render(), title, f"Total: {stream_map.count} blocs",
+                                      f"{stream_map.resource_type}_map")
+    
+    def _save_with_header(self, img: Image.Image, title: str, subtitle: str, name: str) -> Path:
+        """Ajoute le bandeau de titre au-dessus d'une carte et l'enregistre."""
+        width, height = img.size
+        
         # Créer une nouvelle image avec espace pour le titre
         final_img = Image.new('RGB', (width, height + 60), color=(20, 20, 20))
         final_img.paste(img, (0, 60))
@@ -138,12 +379,11 @@ class MapGenerator:
             font_small = ImageFont.load_default()
         
         draw.text((10, 10), title, fill=(255, 255, 255), font=font_title)
-        draw.text((10, 35), f"Total: {stats.total_count} blocs | Hotspots: {len(stats.hotspots)}", 
-                  fill=(200, 200, 200), font=font_small)
+        draw.text((10, 35), subtitle, fill=(200, 200, 200), font=font_small)
         
         # Sauvegarder l'image
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{stats.resource_type}_map_{timestamp}.png"
+        filename = f"{name}_{timestamp}.png"
         filepath = self.output_dir / filename
         
         final_img.save(filepath)
@@ -206,21 +446,33 @@ class MapGenerator:
     
     def generate_heatmap(
         self,
-        stats: ResourceStats,
+        stats: Optional[ResourceStats] = None,
         grid_size: int = 16,
-        y_level: int = None
+        y_level: int = None,
+        summaries: Optional[List[RegionSummary]] = None,
+        resource_name: Optional[str] = None
     ) -> Path:
         """
         Génère une heatmap de densité des ressources.
         
+        Avec des résumés par région, la heatmap (un pixel par chunk) est produite
+        sans relire le monde ni parcourir les emplacements.
+        
         Args:
             stats: Statistiques des ressources
             grid_size: Taille de la grille pour la heatmap (en blocs)
             y_level: Niveau Y spécifique (None = tous)
+            summaries: Résumés par région à utiliser à la place de stats
+            resource_name: Ressource à afficher (défaut: celle de stats)
         
         Returns:
             Chemin vers la heatmap
         """
+        if summaries is not None:
+            if y_level is not None:
+                raise ValueError("Les résumés par région ne permettent pas de filtrer par Y")
+            return self._generate_summary_heatmap(summaries, resource_name or stats.resource_type)
+        
         import matplotlib.pyplot as plt
         from matplotlib.colors import LinearSegmentedColormap
         
@@ -254,9 +506,8 @@ class MapGenerator:
         fig, ax = plt.subplots(figsize=(14, 10))
         
         # Colormap personnalisée
-        colors = ['#000033', '#0000FF', '#00FFFF', '#FFFF00', '#FF0000']
         n_bins = 100
-        cmap = LinearSegmentedColormap.from_list('custom', colors, N=n_bins)
+        cmap = LinearSegmentedColormap.from_list('custom', HEATMAP_COLORS, N=n_bins)
         
         # Afficher la heatmap
         im = ax.imshow(
@@ -289,6 +540,55 @@ class MapGenerator:
         plt.close()
         
         return filepath
+    
+    def _generate_summary_heatmap(
+        self,
+        summaries: List[RegionSummary],
+        resource_name: str,
+        pixels_per_chunk: int = 4
+    ) -> Path:
+        """
+        Génère la heatmap d'une ressource depuis les résumés par région (PIL, sans matplotlib).
+        
+        Args:
+            summaries: Résumés par région
+            resource_name: Nom de la ressource
+            pixels_per_chunk: Côté d'un chunk en pixels
+        
+        Returns:
+            Chemin vers la heatmap
+        """
+        grid, _ = summary_chunk_counts(summaries, resource_name)
+        if not grid.any():
+            raise ValueError("Aucune ressource pour générer la heatmap")
+        
+        # Dégradé interpolé sur [0, 1] (échelle racine pour garder les chunks pauvres visibles)
+        stops = np.array([
+            [int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in HEATMAP_COLORS
+        ], dtype=np.float64)
+        levels = np.sqrt(grid / grid.max())
+        positions = np.linspace(0, 1, len(stops))
+        rgb = np.stack([np.interp(levels, positions, stops[:, c]) for c in range(3)], axis=-1)
+        
+        # Chunks jamais générés en noir
+        present = np.zeros(grid.shape, dtype=bool)
+        origin_x = min(s.region_x for s in summaries)
+        origin_z = min(s.region_z for s in summaries)
+        for summary in summaries:
+            z0 = (summary.region_z - origin_z) * 32
+            x0 = (summary.region_x - origin_x) * 32
+            present[z0:z0 + 32, x0:x0 + 32] = summary.chunks_present
+        rgb[~present] = 0
+        
+        pixels = np.repeat(np.repeat(rgb.astype(np.uint8), pixels_per_chunk, axis=0),
+                           pixels_per_chunk, axis=1)
+        img = Image.fromarray(pixels, 'RGB')
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = self.output_dir / f"{resource_name}_overview_heatmap_{timestamp}.png"
+        img.save(filepath)
+        
+        return filepath
 
 
 if __name__ == "__main__":
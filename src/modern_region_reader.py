@@ -3,42 +3,381 @@ Lecteur moderne de fichiers de région Minecraft 1.18+
 Compatible avec le nouveau format de chunks (sans 'Level' tag)
 """
 
+import hashlib
+import math
 import struct
 import gzip
 import zlib
 from pathlib import Path
-from typing import Optional, List, Tuple, Generator, Any
+from typing import BinaryIO, Dict, Optional, List, Tuple, Generator, Any, Union
+import numpy as np
 from nbt import nbt
 from tqdm import tqdm
 
+from .block_matcher import BlockMatcher, compile_matcher
+from .config import DIMENSION_Y_RANGES, DIMENSIONS
+from .reader_backend import ReaderBackend, parse_region_header, region_directory
+from .region_archive import RegionArchive, is_archive
+from .section_cache import SectionCache, DecodedSection
 
-class ModernRegionReader:
+
+# DataVersion de 20w17a (1.16) : un indice ne chevauche plus deux longs
+VERSION_NON_SPANNING = 2529
+
+
+def _longs_as_uint64(data_array: List[int]) -> np.ndarray:
+    """Convertit un tableau de longs NBT en uint64 (signés, ou non signés une fois anvil importé)."""
+    try:
+        return np.asarray(data_array, dtype=np.int64).view(np.uint64)
+    except OverflowError:
+        # anvil-parser relit les TAG_Long_Array en non signé (format 'Q')
+        return np.asarray(data_array, dtype=np.uint64)
+
+
+def decode_block_states(data_array: List[int], palette_size: int) -> np.ndarray:
+    """
+    Décode le tableau compacté de block states (format Minecraft 1.21), de façon vectorisée.
+    
+    Minecraft 1.21 utilise un format "compact" où chaque long contient
+    un nombre ENTIER de blocs (pas de chevauchement entre longs).
+    
+    Args:
+        data_array: Tableau de longs (64 bits signés) contenant les indices de palette
+        palette_size: Nombre d'éléments dans la palette
+    
+    Returns:
+        Tableau numpy uint16 de 4096 indices de palette (16x16x16, ordre x + z*16 + y*256)
+    """
+    if data_array is None or len(data_array) == 0:
+        return np.zeros(4096, dtype=np.uint16)
+    
+    # Calculer le nombre de bits par bloc
+    bits_per_block = max(4, math.ceil(math.log2(palette_size))) if palette_size > 1 else 4
+    
+    # Calculer combien de blocs par long (sans chevauchement)
+    blocks_per_long = 64 // bits_per_block
+    mask = np.uint64((1 << bits_per_block) - 1)
+    
+    # Chaque long est découpé en blocks_per_long valeurs par décalages successifs
+    longs = _longs_as_uint64(data_array)
+    shifts = np.arange(blocks_per_long, dtype=np.uint64) * np.uint64(bits_per_block)
+    values = ((longs[:, None] >> shifts) & mask).reshape(-1)
+    
+    indices = np.zeros(4096, dtype=np.uint16)
+    count = min(4096, values.size)
+    indices[:count] = values[:count]
+    return indices
+
+
+def decode_spanning_block_states(data_array: List[int], palette_size: int) -> np.ndarray:
+    """
+    Décode le tableau de block states des versions antérieures à 1.16 (20w17a), de façon vectorisée.
+    
+    Dans cet ancien format, les indices sont empaquetés bout à bout : un indice
+    peut commencer dans un long et se terminer dans le suivant.
+    
+    Args:
+        data_array: Tableau de longs (64 bits signés) contenant les indices de palette
+        palette_size: Nombre d'éléments dans la palette
+    
+    Returns:
+        Tableau numpy uint16 de 4096 indices de palette (16x16x16, ordre x + z*16 + y*256)
+    """
+    if data_array is None or len(data_array) == 0:
+        return np.zeros(4096, dtype=np.uint16)
+    
+    bits_per_block = max(4, math.ceil(math.log2(palette_size))) if palette_size > 1 else 4
+    
+    # Flux de bits continu (bit de poids faible en premier, long après long)
+    longs = _longs_as_uint64(data_array).astype('<u8')
+    bits = np.unpackbits(longs.view(np.uint8), bitorder='little')
+    
+    count = min(4096, bits.size // bits_per_block)
+    weights = np.left_shift(1, np.arange(bits_per_block, dtype=np.uint32))
+    values = bits[:count * bits_per_block].reshape(count, bits_per_block) @ weights
+    
+    indices = np.zeros(4096, dtype=np.uint16)
+    indices[:count] = values
+    return indices
+
+
+def find_section_blocks(
+    palette_names: List[str],
+    indices: Optional[np.ndarray],
+    target_mask: np.ndarray,
+    base_y: int,
+    y_min: int,
+    y_max: int
+) -> List[Tuple[int, int, int, str]]:
+    """
+    Liste les blocs recherchés d'une section à partir de ses indices de palette.
+    
+    Args:
+        palette_names: Noms des blocs de la palette
+        indices: 4096 indices de palette (ordre x + z*16 + y*256), None si palette à un seul bloc
+        target_mask: Masque des entrées de palette recherchées
+        base_y: Y du bas de la section
+        y_min: Hauteur minimale
+        y_max: Hauteur maximale
+    
+    Returns:
+        Liste de tuples (x_local, y, z_local, block_id)
+    """
+    found_blocks = []
+    
+    # Si la palette n'a qu'un seul bloc et c'est notre cible
+    if indices is None:
+        # Tous les blocs de la section sont du type cible
+        block_name = palette_names[0]
+        for y_offset in range(16):
+            y = base_y + y_offset
+            if y_min <= y <= y_max:
+                for x in range(16):
+                    for z in range(16):
+                        found_blocks.append((x, y, z, block_name))
+        return found_blocks
+    
+    # Indices hors palette (données corrompues) : jamais recherchés
+    if int(indices.max()) >= len(target_mask):
+        target_mask = np.concatenate([
+            target_mask,
+            np.zeros(int(indices.max()) + 1 - len(target_mask), dtype=bool)
+        ])
+    
+    # Positions des blocs recherchés (masque vectorisé)
+    positions = np.nonzero(target_mask[indices])[0]
+    
+    for i, palette_idx in zip(positions.tolist(), indices[positions].tolist()):
+        # Convertir l'indice linéaire en coordonnées 3D
+        # Format Minecraft 1.21: X varie le plus vite, puis Z, puis Y
+        # Formule: indice = x + z*16 + y*256
+        x_local = i % 16
+        z_local = (i // 16) % 16
+        y_offset = i // 256
+        
+        y = base_y + y_offset
+        if y_min <= y <= y_max:
+            found_blocks.append((x_local, y, z_local, palette_names[palette_idx]))
+    
+    return found_blocks
+
+
+def scan_legacy_sections(
+    sections: Any,
+    data_version: int,
+    matcher: BlockMatcher,
+    y_min: int,
+    y_max: int
+) -> List[Tuple[int, int, int, str]]:
+    """
+    Cherche des blocs dans les sections d'un chunk 1.13-1.17 (`Level/Sections`).
+    
+    Seules les sections dont la palette contient un bloc recherché sont décodées.
+    
+    Args:
+        sections: Liste NBT `Level/Sections`
+        data_version: DataVersion du chunk (indices chevauchants avant 20w17a)
+        matcher: Blocs recherchés
+        y_min: Hauteur minimale
+        y_max: Hauteur maximale
+    
+    Returns:
+        Liste de tuples (x_local, y, z_local, block_id)
+    """
+    found_blocks = []
+    spanning = data_version < VERSION_NON_SPANNING
+    
+    for section in sections or []:
+        section_y = section.get('Y')
+        palette = section.get('Palette')
+        states = section.get('BlockStates')
+        if section_y is None or not palette or states is None:
+            continue
+        
+        base_y = section_y.value * 16
+        if base_y + 15 < y_min or base_y > y_max:
+            continue
+        
+        # Chercher nos blocs dans la palette avant tout décodage
+        palette_names = [entry['Name'].value for entry in palette]
+        target_mask = matcher.palette_mask(palette_names)
+        if not target_mask.any():
+            continue
+        
+        if spanning:
+            indices = decode_spanning_block_states(states.value, len(palette_names))
+        else:
+            indices = decode_block_states(states.value, len(palette_names))
+        found_blocks.extend(find_section_blocks(
+            palette_names, indices, target_mask, base_y, y_min, y_max
+        ))
+    
+    return found_blocks
+
+
+def iter_chunk_sections(nbt_data: Any) -> Generator[Tuple[int, List[str], Optional[List[int]], bool], None, None]:
+    """
+    Itère sur les sections d'un chunk qui ont une palette, au format 1.18+
+    (`sections`) ou 1.13-1.17 (`Level/Sections`).
+    
+    Args:
+        nbt_data: Données NBT du chunk (racine, avec DataVersion)
+    
+    Yields:
+        Tuple (Y de la section, noms de la palette, tableau de longs ou None,
+        indices chevauchants (avant 20w17a))
+    """
+    sections = nbt_data.get('sections')
+    level = nbt_data.get('Level')
+    
+    if sections is None and level is not None:
+        # Chunk antérieur à 1.18 : Level/Sections
+        data_version = nbt_data.get('DataVersion')
+        spanning = (data_version.value if data_version else 0) < VERSION_NON_SPANNING
+        for section in level.get('Sections') or []:
+            y_tag = section.get('Y')
+            palette = section.get('Palette')
+            if y_tag is None or not palette:
+                continue
+            states = section.get('BlockStates')
+            names = [entry['Name'].value for entry in palette]
+            yield y_tag.value, names, states.value if states is not None else None, spanning
+        return
+    
+    for section in sections or []:
+        y_tag = section.get('Y')
+        block_states = section.get('block_states')
+        palette = block_states.get('palette') if block_states else None
+        if y_tag is None or not palette:
+            continue
+        names = [entry.get('Name').value for entry in palette]
+        data = block_states.get('data')
+        data_array = None
+        if data:
+            data_array = data.value if hasattr(data, 'value') else [v.value for v in data]
+        yield y_tag.value, names, data_array, False
+
+
+def decode_section_indices(
+    data_array: Optional[List[int]],
+    palette_size: int,
+    spanning: bool = False
+) -> np.ndarray:
+    """
+    Décode les indices de palette d'une section (voir iter_chunk_sections()).
+    
+    Args:
+        data_array: Tableau de longs ou None (palette d'un seul bloc)
+        palette_size: Nombre d'éléments dans la palette
+        spanning: Indices chevauchant deux longs (format antérieur à 20w17a)
+    
+    Returns:
+        Tableau numpy uint16 de 4096 indices de palette (ordre x + z*16 + y*256)
+    """
+    if palette_size <= 1 or data_array is None:
+        return np.zeros(4096, dtype=np.uint16)
+    if spanning:
+        return decode_spanning_block_states(data_array, palette_size)
+    return decode_block_states(data_array, palette_size)
+
+
+def read_region_header(region_file: Path) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Lit l'offset table et la table des timestamps d'un fichier de région.
+    
+    Args:
+        region_file: Fichier de région
+    
+    Returns:
+        Tuple (locations, timestamps) de 1024 entrées chacun
+    """
+    with open(region_file, 'rb') as f:
+        return parse_region_header(f.read(8192))
+
+
+def payload_digest(payload: Optional[Tuple[int, bytes]]) -> Optional[bytes]:
+    """
+    Empreinte des données brutes d'un chunk (type de compression + données compressées).
+    
+    Args:
+        payload: Résultat de ModernRegionReader.read_chunk_payload()
+    
+    Returns:
+        Empreinte BLAKE2b (16 octets) ou None si le chunk est vide
+    """
+    if payload is None:
+        return None
+    compression_type, data = payload
+    return hashlib.blake2b(bytes([compression_type]) + data, digest_size=16).digest()
+
+
+class ModernRegionReader(ReaderBackend):
     """
     Lecteur de fichiers de région Minecraft pour versions 1.18+
+    (la recherche de blocs lit aussi les chunks 1.13-1.17)
     """
     
-    def __init__(self, world_path: str):
+    def __init__(
+        self,
+        world_path: str,
+        section_cache: Optional[SectionCache] = None,
+        dimension: str = "overworld"
+    ):
         """
         Initialise le lecteur.
         
         Args:
-            world_path: Chemin vers le monde Minecraft
+            world_path: Chemin vers le monde Minecraft, ou vers une sauvegarde
+                (.zip, .tar, .tar.gz...) lue sans extraction
+            section_cache: Cache des sections décodées (défaut: un cache propre au lecteur)
+            dimension: Dimension lue ("overworld", "nether" ou "end")
         """
         self.world_path = Path(world_path)
-        self.region_path = self.world_path / "region"
+        self.dimension = dimension
+        self.region_path = region_directory(world_path, dimension)
+        self.section_cache = section_cache if section_cache is not None else SectionCache()
+        self.archive = RegionArchive(world_path, dimension) if is_archive(world_path) else None
         
-        if not self.region_path.exists():
-            raise ValueError(f"Le dossier 'region' n'existe pas dans {world_path}")
+        if self.archive is not None:
+            if not self.archive.list_regions():
+                raise ValueError(f"Aucun fichier de région '{DIMENSIONS[dimension]}' dans {world_path}")
+        elif not self.region_path.exists():
+            raise ValueError(f"Le dossier '{self.region_path.relative_to(self.world_path)}' "
+                             f"n'existe pas dans {world_path}")
     
     def list_region_files(self) -> List[Path]:
-        """Liste tous les fichiers de région."""
+        """Liste tous les fichiers de région (chemins virtuels dans le cas d'une archive)."""
+        if self.archive is not None:
+            return [self.region_path / name for name in self.archive.list_regions()]
         return sorted(self.region_path.glob("*.mca"))
     
+    def has_region(self, region_file: Path) -> bool:
+        """Indique si une région existe, sur le disque ou dans l'archive."""
+        if self.archive is not None:
+            return region_file.name in self.archive
+        return region_file.exists()
+    
+    def open_region(self, region_file: Path) -> BinaryIO:
+        """Ouvre un fichier de région, du disque ou de l'archive."""
+        if self.archive is not None:
+            return self.archive.open(region_file.name)
+        return open(region_file, 'rb')
+    
+    def region_stat(self, region_file: Path) -> Tuple[int, float]:
+        """Taille et date de modification d'un fichier de région (du disque ou de l'archive)."""
+        if self.archive is not None:
+            return self.archive.stat(region_file.name)
+        return super().region_stat(region_file)
+    
     def get_region_coordinates(self, region_file: Path) -> Tuple[int, int]:
         """Extrait les coordonnées d'une région depuis son nom."""
         parts = region_file.stem.split('.')
         return int(parts[1]), int(parts[2])
     
+    def get_region_file(self, region_x: int, region_z: int) -> Path:
+        """Retourne le chemin du fichier de région r.X.Z.mca."""
+        return self.region_path / f"r.{region_x}.{region_z}.mca"
+    
     def read_chunk_data(self, region_file: Path, chunk_x: int, chunk_z: int) -> Optional[Any]:
         """
         Lit les données NBT d'un chunk spécifique.
@@ -51,54 +390,288 @@ class ModernRegionReader:
         Returns:
             Données NBT du chunk ou None si vide
         """
-        with open(region_file, 'rb') as f:
+        with self.open_region(region_file) as f:
             # Lire l'offset table (1024 premiers octets)
             offset_index = 4 * ((chunk_x % 32) + (chunk_z % 32) * 32)
             f.seek(offset_index)
             offset_data = struct.unpack('>I', f.read(4))[0]
             
-            if offset_data == 0:
-                return None  # Chunk vide
-            
-            offset = (offset_data >> 8) * 4096
-            sector_count = offset_data & 0xFF
+            return self._read_chunk_at(f, offset_data)
+    
+    def read_chunks(
+        self,
+        region_file: Path,
+        slots: List[Tuple[int, int]],
+        errors: Optional[List[Tuple[int, int]]] = None
+    ) -> Generator[Tuple[Any, int, int], None, None]:
+        """
+        Lit plusieurs chunks d'une même région en n'ouvrant le fichier qu'une fois.
+        
+        Args:
+            region_file: Fichier de région
+            slots: Liste de coordonnées locales (chunk_x, chunk_z) dans la région (0-31)
+            errors: Si fourni, les chunks illisibles (corrompus, en cours d'écriture) y sont
+                ajoutés et la lecture continue ; sinon l'erreur est propagée
+        
+        Yields:
+            Tuple (nbt_data, chunk_x_local, chunk_z_local) pour chaque chunk non vide
+        """
+        with self.open_region(region_file) as f:
+            # Lire l'offset table complète une seule fois
+            header = f.read(4096)
+            if len(header) < 4096:
+                return
             
-            if offset == 0 or sector_count == 0:
-                return None
+            for chunk_x, chunk_z in slots:
+                offset_index = 4 * ((chunk_x % 32) + (chunk_z % 32) * 32)
+                offset_data = struct.unpack_from('>I', header, offset_index)[0]
+                
+                if errors is None:
+                    nbt_data = self._read_chunk_at(f, offset_data)
+                else:
+                    try:
+                        payload = self.read_chunk_payload(f, offset_data)
+                        nbt_data = self.parse_chunk_payload(*payload) if payload else None
+                        readable = payload is None or nbt_data is not None
+                    except Exception:
+                        readable = False
+                    if not readable:
+                        errors.append((chunk_x, chunk_z))
+                        continue
+                if nbt_data:
+                    yield nbt_data, chunk_x, chunk_z
+    
+    def _read_chunk_at(self, f, offset_data: int) -> Optional[Any]:
+        """
+        Lit, décompresse et parse un chunk à partir de son entrée dans l'offset table.
+        
+        Args:
+            f: Fichier de région ouvert en binaire
+            offset_data: Entrée brute de l'offset table (offset << 8 | nombre de secteurs)
+        
+        Returns:
+            Données NBT du chunk ou None si vide
+        """
+        payload = self.read_chunk_payload(f, offset_data)
+        if payload is None:
+            return None
+        return self.parse_chunk_payload(*payload)
+    
+    def read_chunk_payload(self, f, offset_data: int) -> Optional[Tuple[int, bytes]]:
+        """
+        Lit les données brutes (encore compressées) d'un chunk.
+        
+        Args:
+            f: Fichier de région ouvert en binaire
+            offset_data: Entrée brute de l'offset table (offset << 8 | nombre de secteurs)
+        
+        Returns:
+            Tuple (type de compression, données compressées) ou None si vide
+        """
+        if offset_data == 0:
+            return None  # Chunk vide
+        
+        offset = (offset_data >> 8) * 4096
+        sector_count = offset_data & 0xFF
+        
+        if offset == 0 or sector_count == 0:
+            return None
+        
+        # Lire les données du chunk
+        f.seek(offset)
+        length = struct.unpack('>I', f.read(4))[0]
+        compression_type = struct.unpack('B', f.read(1))[0]
+        
+        return compression_type, f.read(length - 1)
+    
+    def iterate_chunk_payloads(
+        self,
+        region_file: Path
+    ) -> Generator[Tuple[Tuple[int, bytes], int, int], None, None]:
+        """
+        Itère sur les données brutes (encore compressées) des chunks d'une région.
+        
+        Args:
+            region_file: Fichier de région
+        
+        Yields:
+            Tuple (payload, chunk_x_abs, chunk_z_abs), payload à passer à parse_chunk_payload()
+        """
+        region_x, region_z = self.get_region_coordinates(region_file)
+        with self.open_region(region_file) as f:
+            header = f.read(4096)
+            if len(header) < 4096:
+                return
+            locations = struct.unpack('>1024I', header)
             
-            # Lire les données du chunk
-            f.seek(offset)
-            length = struct.unpack('>I', f.read(4))[0]
-            compression_type = struct.unpack('B', f.read(1))[0]
+            # Même ordre que iterate_chunks() : X puis Z
+            for chunk_x in range(32):
+                for chunk_z in range(32):
+                    offset_data = locations[chunk_x + chunk_z * 32]
+                    if not offset_data:
+                        continue
+                    try:
+                        payload = self.read_chunk_payload(f, offset_data)
+                    except (OSError, struct.error):
+                        continue
+                    if payload:
+                        yield payload, region_x * 32 + chunk_x, region_z * 32 + chunk_z
+    
+    def parse_chunk_payload(self, compression_type: int, chunk_data: bytes) -> Optional[Any]:
+        """
+        Décompresse et parse les données brutes d'un chunk (voir read_chunk_payload()).
+        
+        Args:
+            compression_type: 1 = GZip, 2 = Zlib, 3 = non compressé
+            chunk_data: Données compressées
+        
+        Returns:
+            Données NBT du chunk ou None si invalide
+        """
+        # Décompresser selon le type
+        if compression_type == 1:  # GZip
+            chunk_data = gzip.decompress(chunk_data)
+        elif compression_type == 2:  # Zlib
+            chunk_data = zlib.decompress(chunk_data)
+        # else: données non compressées
+        
+        # Parser le NBT manuellement (nbt.NBTFile ne fonctionne pas avec des données déjà décompressées)
+        try:
+            from io import BytesIO
+            bio = BytesIO(chunk_data)
             
-            chunk_data = f.read(length - 1)
+            # Lire l'en-tête NBT
+            tag_type = struct.unpack('b', bio.read(1))[0]
+            name_length = struct.unpack('>H', bio.read(2))[0]
+            if name_length > 0:
+                bio.read(name_length)  # Skip le nom
             
-            # Décompresser selon le type
-            if compression_type == 1:  # GZip
-                chunk_data = gzip.decompress(chunk_data)
-            elif compression_type == 2:  # Zlib
-                chunk_data = zlib.decompress(chunk_data)
-            # else: données non compressées
+            # Parser le TAG_Compound
+            compound = nbt.TAG_Compound()
+            compound._parse_buffer(bio)
             
-            # Parser le NBT manuellement (nbt.NBTFile ne fonctionne pas avec des données déjà décompressées)
-            try:
-                from io import BytesIO
-                bio = BytesIO(chunk_data)
-                
-                # Lire l'en-tête NBT
-                tag_type = struct.unpack('b', bio.read(1))[0]
-                name_length = struct.unpack('>H', bio.read(2))[0]
-                if name_length > 0:
-                    bio.read(name_length)  # Skip le nom
-                
-                # Parser le TAG_Compound
-                compound = nbt.TAG_Compound()
-                compound._parse_buffer(bio)
-                
-                return compound
-            except Exception as e:
-                # Erreur de parsing - chunk invalide ou corrompu
-                return None
+            return compound
+        except Exception as e:
+            # Erreur de parsing - chunk invalide ou corrompu
+            return None
+    
+    def read_chunk(self, chunk_x: int, chunk_z: int) -> Optional[Any]:
+        """
+        Lit un chunk à partir de ses coordonnées absolues.
+        
+        Args:
+            chunk_x: Coordonnée X absolue du chunk
+            chunk_z: Coordonnée Z absolue du chunk
+        
+        Returns:
+            Données NBT du chunk ou None si absent
+        """
+        region_file = self.get_region_file(chunk_x // 32, chunk_z // 32)
+        if not self.has_region(region_file):
+            return None
+        return self.read_chunk_data(region_file, chunk_x % 32, chunk_z % 32)
+    
+    def decode_section(self, section: Any) -> Optional[DecodedSection]:
+        """
+        Décode une section NBT (palette + indices).
+        
+        Args:
+            section: Compound NBT d'une section (format 1.18+)
+        
+        Returns:
+            Section décodée ou None si elle n'a pas de block_states
+        """
+        block_states = section.get('block_states')
+        if not block_states:
+            return None
+        
+        palette = block_states.get('palette')
+        if not palette:
+            return None
+        
+        names = [entry.get('Name').value for entry in palette]
+        
+        data = block_states.get('data')
+        if data and len(names) > 1:
+            # Vérifier si data contient des objets NBT ou des int directs
+            if hasattr(data[0], 'value'):
+                data_array = [long_val.value for long_val in data]
+            else:
+                data_array = data.value if hasattr(data, 'value') else list(data)
+            indices = decode_block_states(data_array, len(names))
+        else:
+            # Palette unique : tous les blocs sont identiques
+            indices = np.zeros(4096, dtype=np.uint16)
+        
+        return DecodedSection(indices=indices, palette=names)
+    
+    def decode_chunk_sections(
+        self,
+        chunk_x: int,
+        chunk_z: int,
+        nbt_data: Optional[Any]
+    ) -> Dict[int, DecodedSection]:
+        """
+        Décode toutes les sections d'un chunk et les met en cache.
+        
+        Les sections absentes sont mémorisées comme telles : get_section() ne relit
+        pas le chunk pour elles.
+        
+        Args:
+            chunk_x: Coordonnée X absolue du chunk
+            chunk_z: Coordonnée Z absolue du chunk
+            nbt_data: Données NBT du chunk (format 1.18+ ou 1.13-1.17), None si absent
+        
+        Returns:
+            Dictionnaire Y de section -> section décodée
+        """
+        region = (chunk_x // 32, chunk_z // 32)
+        chunk = (chunk_x % 32, chunk_z % 32)
+        decoded = {}
+        
+        if nbt_data:
+            for section_y, names, data_array, spanning in iter_chunk_sections(nbt_data):
+                section = DecodedSection(
+                    indices=decode_section_indices(data_array, len(names), spanning),
+                    palette=names
+                )
+                self.section_cache.put((region, chunk, section_y), section)
+                decoded[section_y] = section
+        
+        # Mémoriser l'absence des autres sections de la dimension
+        y_min, y_max = DIMENSION_Y_RANGES[self.dimension]
+        for section_y in range(y_min >> 4, (y_max >> 4) + 1):
+            if section_y not in decoded:
+                self.section_cache.put((region, chunk, section_y), None)
+        
+        return decoded
+    
+    def get_section(self, chunk_x: int, chunk_z: int, section_y: int) -> Optional[DecodedSection]:
+        """
+        Retourne une section décodée, depuis le cache si possible.
+        
+        Lors d'un défaut de cache, toutes les sections du chunk sont décodées et mises
+        en cache : les accès voisins ne relisent plus le fichier de région.
+        
+        Args:
+            chunk_x: Coordonnée X absolue du chunk
+            chunk_z: Coordonnée Z absolue du chunk
+            section_y: Index Y de la section (y // 16)
+        
+        Returns:
+            Section décodée ou None si le chunk ou la section n'existe pas
+        """
+        key = ((chunk_x // 32, chunk_z // 32), (chunk_x % 32, chunk_z % 32), section_y)
+        
+        found, section = self.section_cache.get(key)
+        if found:
+            return section
+        
+        sections = self.decode_chunk_sections(chunk_x, chunk_z, self.read_chunk(chunk_x, chunk_z))
+        if section_y not in sections:
+            # Section hors de la dimension : mémoriser aussi son absence
+            self.section_cache.put(key, None)
+        return sections.get(section_y)
     
     def get_block_id(self, nbt_data: Any, x: int, y: int, z: int) -> Optional[str]:
         """
@@ -123,87 +696,48 @@ class ModernRegionReader:
             section_y = y // 16
             
             for section in sections:
-                if section.get('Y') and section['Y'].value == section_y:
-                    # Trouver le bloc dans la palette
-                    palette = section.get('block_states', {}).get('palette')
-                    if not palette:
-                        continue
-                    
-                    # Si la palette n'a qu'un seul élément, tous les blocs sont pareils
-                    if len(palette) == 1:
-                        return palette[0].get('Name', {}).value
-                    
-                    # Sinon, il faut lire les données
-                    # Pour simplifier, on retourne le premier élément de la palette
-                    # (cela ne donne pas le bloc exact mais permet de détecter les types)
-                    for block_entry in palette:
-                        block_name = block_entry.get('Name', {}).value
-                        return block_name
+                y_tag = section.get('Y')
+                if y_tag is None or y_tag.value != section_y:
+                    continue
+                
+                decoded = self.decode_section(section)
+                if decoded is None:
+                    return None
+                
+                return decoded.block_at(x, y - section_y * 16, z)
             
             return None
             
         except Exception:
             return None
     
-    def _decode_block_states(self, data_array: List[int], palette_size: int) -> List[int]:
+    def _decode_block_states(self, data_array: List[int], palette_size: int) -> np.ndarray:
         """
         Décode le tableau compacté de block states (format Minecraft 1.21).
         
-        Minecraft 1.21 utilise un format "compact" où chaque long contient
-        un nombre ENTIER de blocs (pas de chevauchement entre longs).
-        
         Args:
             data_array: Tableau de longs (64 bits) contenant les indices de palette
             palette_size: Nombre d'éléments dans la palette
         
         Returns:
-            Liste de 4096 indices de palette (16x16x16)
+            Tableau de 4096 indices de palette (16x16x16)
         """
-        if not data_array:
-            return [0] * 4096
-        
-        # Calculer le nombre de bits par bloc
-        import math
-        bits_per_block = max(4, math.ceil(math.log2(palette_size))) if palette_size > 1 else 4
-        
-        # Calculer combien de blocs par long (sans chevauchement)
-        blocks_per_long = 64 // bits_per_block
-        
-        # Décoder les indices
-        indices = []
-        mask = (1 << bits_per_block) - 1
-        
-        for i in range(4096):  # 16x16x16 = 4096 blocs
-            # Déterminer dans quel long se trouve ce bloc
-            long_index = i // blocks_per_long
-            # Position du bloc dans ce long
-            block_in_long = i % blocks_per_long
-            # Offset en bits dans le long
-            bit_offset = block_in_long * bits_per_block
-            
-            if long_index >= len(data_array):
-                indices.append(0)
-                continue
-            
-            # Extraire l'indice (pas de chevauchement possible)
-            value = (data_array[long_index] >> bit_offset) & mask
-            indices.append(value)
-        
-        return indices
+        return decode_block_states(data_array, palette_size)
     
     def scan_chunk_for_blocks(
         self,
         nbt_data: Any,
-        block_ids: List[str],
+        block_ids: Union[List[str], BlockMatcher],
         y_min: int = -64,
         y_max: int = 320
     ) -> List[Tuple[int, int, int, str]]:
         """
-        Scanne un chunk pour trouver des blocs spécifiques (format 1.18+).
+        Scanne un chunk pour trouver des blocs spécifiques (format 1.18+, ou 1.13-1.17).
         
         Args:
             nbt_data: Données NBT du chunk
-            block_ids: Liste des IDs de blocs à rechercher
+            block_ids: IDs de blocs ou motifs ("*_ore", "re:...") à rechercher,
+                ou BlockMatcher déjà compilé
             y_min: Hauteur minimale
             y_max: Hauteur maximale
         
@@ -211,9 +745,18 @@ class ModernRegionReader:
             Liste de tuples (x_local, y, z_local, block_id)
         """
         found_blocks = []
+        matcher = compile_matcher(block_ids)
         
         try:
             sections = nbt_data.get('sections')
+            level = nbt_data.get('Level')
+            if sections is None and level is not None:
+                # Chunk antérieur à 1.18 : Level/Sections
+                data_version = nbt_data.get('DataVersion')
+                return scan_legacy_sections(
+                    level.get('Sections'), data_version.value if data_version else 0,
+                    matcher, y_min, y_max
+                )
             if not sections:
                 return found_blocks
             
@@ -238,30 +781,21 @@ class ModernRegionReader:
                 if not palette:
                     continue
                 
-                # Chercher nos blocs dans la palette
-                target_indices = set()
-                palette_names = {}
-                for idx, block_entry in enumerate(palette):
+                # Chercher nos blocs dans la palette (masque mémorisé par palette)
+                palette_names = []
+                for block_entry in palette:
                     block_name = block_entry.get('Name')
-                    if block_name:
-                        name_value = block_name.value
-                        palette_names[idx] = name_value
-                        if name_value in block_ids:
-                            target_indices.add(idx)
+                    palette_names.append(block_name.value if block_name else "")
                 
-                if not target_indices:
+                target_mask = matcher.palette_mask(palette_names)
+                if not target_mask.any():
                     continue
                 
-                # Si la palette n'a qu'un seul bloc et c'est notre cible
-                if len(palette) == 1 and 0 in target_indices:
-                    # Tous les blocs de la section sont du type cible
-                    block_name = palette_names[0]
-                    for y_offset in range(16):
-                        y = base_y + y_offset
-                        if y_min <= y <= y_max:
-                            for x in range(16):
-                                for z in range(16):
-                                    found_blocks.append((x, y, z, block_name))
+                # Palette d'un seul bloc : toute la section est du type cible
+                if len(palette) == 1:
+                    found_blocks.extend(find_section_blocks(
+                        palette_names, None, target_mask, base_y, y_min, y_max
+                    ))
                     continue
                 
                 # Décoder le tableau de données pour avoir les positions exactes
@@ -275,21 +809,9 @@ class ModernRegionReader:
                     
                     # Décoder les indices
                     indices = self._decode_block_states(data_array, len(palette))
-                    
-                    # Parcourir chaque position et vérifier
-                    for i, palette_idx in enumerate(indices):
-                        if palette_idx in target_indices:
-                            # Convertir l'indice linéaire en coordonnées 3D
-                            # Format Minecraft 1.21: X varie le plus vite, puis Z, puis Y
-                            # Formule: indice = x + z*16 + y*256
-                            x_local = i % 16
-                            z_local = (i // 16) % 16
-                            y_offset = i // 256
-                            
-                            y = base_y + y_offset
-                            if y_min <= y <= y_max:
-                                block_name = palette_names[palette_idx]
-                                found_blocks.append((x_local, y, z_local, block_name))
+                    found_blocks.extend(find_section_blocks(
+                        palette_names, indices, target_mask, base_y, y_min, y_max
+                    ))
         
         except Exception as e:
             # Debug si nécessaire
@@ -0,0 +1,317 @@
+"""
+Index en mémoire des minerais, construit chunk par chunk à la demande.
+Utilisé par le mode démon pour répondre aux requêtes sans rescanner le monde.
+"""
+
+import gzip
+import json
+import math
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, Any
+
+from .block_matcher import compile_matcher
+from .config import DIMENSION_Y_RANGES, RESOURCE_GROUPS
+from .modern_region_reader import ModernRegionReader, find_section_blocks
+from .radius_query import RadiusHit, chunks_in_radius, group_chunks_by_region
+from .resource_finder import ResourceLocation
+
+
+# Bloc -> ressource pour tous les minerais connus
+BLOCK_TO_RESOURCE: Dict[str, str] = {
+    block_id: resource_name
+    for resource_name, block_ids in RESOURCE_GROUPS.items()
+    for block_id in block_ids
+}
+
+
+class OreIndex:
+    """
+    Index des minerais par chunk (tous types confondus), rempli paresseusement.
+
+    Les chunks indexés passent par le cache de sections du lecteur (borné en octets) :
+    les accès aux blocs autour des dernières requêtes ne relisent pas le monde.
+    """
+
+    def __init__(self, reader: ModernRegionReader):
+        """
+        Initialise l'index.
+
+        Args:
+            reader: Lecteur de région à utiliser (son section_cache garde les sections décodées)
+        """
+        self.reader = reader
+        self.matcher = compile_matcher(list(BLOCK_TO_RESOURCE.keys()))
+
+        # (chunk_x, chunk_z) -> liste de (x, y, z, block_id) en coordonnées absolues
+        self.chunks: Dict[Tuple[int, int], List[Tuple[int, int, int, str]]] = {}
+
+        self._lock = threading.RLock()
+        self._all_loaded = False
+
+    def _index_chunk(self, chunk_x: int, chunk_z: int, nbt_data: Any, cache_sections: bool = True):
+        """
+        Scanne un chunk décodé et enregistre ses minerais dans l'index.
+
+        Avec cache_sections, toutes les sections sont décodées et gardées dans le cache
+        du lecteur ; sinon seules les sections contenant un minerai sont décodées
+        (indexation complète du monde, qui ne ferait que vider le cache).
+        """
+        y_min, y_max = DIMENSION_Y_RANGES[self.reader.dimension]
+        if cache_sections:
+            found = []
+            for section_y, section in self.reader.decode_chunk_sections(chunk_x, chunk_z, nbt_data).items():
+                base_y = section_y * 16
+                if base_y + 15 < y_min or base_y > y_max:
+                    continue
+                target_mask = self.matcher.palette_mask(section.palette)
+                if target_mask.any():
+                    found.extend(find_section_blocks(
+                        section.palette, section.indices, target_mask, base_y, y_min, y_max
+                    ))
+        else:
+            found = self.reader.scan_chunk_for_blocks(nbt_data, self.matcher, y_min, y_max)
+
+        self.chunks[(chunk_x, chunk_z)] = [
+            (chunk_x * 16 + x_local, y, chunk_z * 16 + z_local, block_id)
+            for x_local, y, z_local, block_id in found
+        ]
+
+    def update_chunk(self, chunk_x: int, chunk_z: int, nbt_data: Optional[Any]):
+        """
+        Remplace les minerais indexés d'un chunk (après modification du monde).
+
+        Args:
+            chunk_x: Coordonnée X absolue du chunk
+            chunk_z: Coordonnée Z absolue du chunk
+            nbt_data: Nouvelles données NBT du chunk ou None s'il a disparu
+        """
+        with self._lock:
+            if nbt_data:
+                self._index_chunk(chunk_x, chunk_z, nbt_data)
+            else:
+                self.reader.decode_chunk_sections(chunk_x, chunk_z, None)
+                self.chunks[(chunk_x, chunk_z)] = []
+
+    def mark_all_loaded(self):
+        """Indique que l'index couvre tout le monde (ex: maintenu par le mode watch)."""
+        self._all_loaded = True
+
+    def save(self, path: str) -> Path:
+        """
+        Sauvegarde l'index sur disque (JSON compressé gzip).
+
+        Args:
+            path: Chemin du fichier d'index
+
+        Returns:
+            Chemin du fichier créé
+        """
+        with self._lock:
+            payload = {
+                "version": 1,
+                "monde_complet": self._all_loaded,
+                "chunks": {
+                    f"{chunk_x},{chunk_z}": [list(hit) for hit in hits]
+                    for (chunk_x, chunk_z), hits in self.chunks.items()
+                }
+            }
+
+        output_file = Path(path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
+        with gzip.open(tmp_file, 'wt', encoding='utf-8') as f:
+            json.dump(payload, f)
+        tmp_file.replace(output_file)
+
+        return output_file
+
+    def load(self, path: str) -> bool:
+        """
+        Recharge un index sauvegardé par save().
+
+        Args:
+            path: Chemin du fichier d'index
+
+        Returns:
+            True si l'index a été chargé, False si le fichier n'existe pas
+        """
+        input_file = Path(path)
+        if not input_file.exists():
+            return False
+
+        with gzip.open(input_file, 'rt', encoding='utf-8') as f:
+            payload = json.load(f)
+
+        chunks = {}
+        for key, hits in payload.get("chunks", {}).items():
+            chunk_x, chunk_z = (int(v) for v in key.split(","))
+            chunks[(chunk_x, chunk_z)] = [tuple(hit) for hit in hits]
+
+        with self._lock:
+            self.chunks = chunks
+            self._all_loaded = bool(payload.get("monde_complet", False))
+
+        return True
+
+    def ensure_chunks(self, chunks: List[Tuple[int, int]]):
+        """
+        Charge dans l'index les chunks qui n'y sont pas encore.
+
+        Args:
+            chunks: Liste de chunks absolus (chunk_x, chunk_z)
+        """
+        with self._lock:
+            missing = [c for c in chunks if c not in self.chunks]
+
+        if not missing:
+            return
+
+        for (region_x, region_z), slots in group_chunks_by_region(missing).items():
+            region_file = self.reader.get_region_file(region_x, region_z)
+            if not self.reader.has_region(region_file):
+                # Région non générée : ses chunks sont indexés comme vides
+                with self._lock:
+                    for local_x, local_z in slots:
+                        self.chunks.setdefault((region_x * 32 + local_x, region_z * 32 + local_z), [])
+                continue
+
+            loaded = set()
+            failed: List[Tuple[int, int]] = []
+            try:
+                for nbt_data, local_x, local_z in self.reader.read_chunks(region_file, slots, failed):
+                    with self._lock:
+                        self._index_chunk(region_x * 32 + local_x, region_z * 32 + local_z, nbt_data)
+                    loaded.add((local_x, local_z))
+            except OSError:
+                # Région illisible : rien n'est mémorisé, elle sera relue à la prochaine requête
+                continue
+
+            # Les chunks absents (non générés) sont indexés comme vides ;
+            # les chunks illisibles ne le sont pas (relus à la prochaine requête)
+            with self._lock:
+                for local_x, local_z in slots:
+                    if (local_x, local_z) not in loaded and (local_x, local_z) not in failed:
+                        self.chunks.setdefault((region_x * 32 + local_x, region_z * 32 + local_z), [])
+
+    def load_all(self, show_progress: bool = False):
+        """
+        Indexe tout le monde (nécessaire pour les statistiques globales).
+
+        Args:
+            show_progress: Afficher la progression
+        """
+        if self._all_loaded:
+            return
+
+        for nbt_data, chunk_x, chunk_z in self.reader.iterate_chunks(show_progress=show_progress):
+            with self._lock:
+                if (chunk_x, chunk_z) not in self.chunks:
+                    self._index_chunk(chunk_x, chunk_z, nbt_data, cache_sections=False)
+
+        self._all_loaded = True
+
+    def radius(
+        self,
+        center_x: int,
+        center_z: int,
+        radius: float,
+        resources: List[str],
+        y_range: Optional[Tuple[int, int]] = None
+    ) -> List[RadiusHit]:
+        """
+        Recherche les minerais dans un rayon, en utilisant l'index.
+
+        Args:
+            center_x: Centre X (en blocs)
+            center_z: Centre Z (en blocs)
+            radius: Rayon horizontal (en blocs)
+            resources: Ressources recherchées
+            y_range: Plage de Y (min, max) ou None pour toutes les hauteurs
+
+        Returns:
+            Liste des blocs trouvés, triée par distance
+        """
+        chunks = chunks_in_radius(center_x, center_z, radius)
+        self.ensure_chunks(chunks)
+
+        wanted = {b for r in resources for b in RESOURCE_GROUPS[r]}
+        radius_sq = radius * radius
+        hits = []
+
+        with self._lock:
+            for chunk in chunks:
+                for x, y, z, block_id in self.chunks.get(chunk, ()):
+                    if block_id not in wanted:
+                        continue
+                    if y_range and not (y_range[0] <= y <= y_range[1]):
+                        continue
+                    distance_sq = (x - center_x) ** 2 + (z - center_z) ** 2
+                    if distance_sq <= radius_sq:
+                        hits.append(RadiusHit(x, y, z, block_id, math.sqrt(distance_sq)))
+
+        hits.sort(key=lambda h: h.distance)
+        return hits
+
+    def nearest(
+        self,
+        center_x: int,
+        center_z: int,
+        resources: List[str],
+        max_radius: float = 512,
+        y_range: Optional[Tuple[int, int]] = None
+    ) -> Optional[RadiusHit]:
+        """
+        Trouve le minerai le plus proche en élargissant progressivement le rayon.
+
+        Args:
+            center_x: Centre X (en blocs)
+            center_z: Centre Z (en blocs)
+            resources: Ressources recherchées
+            max_radius: Rayon maximal de recherche (en blocs)
+            y_range: Plage de Y (min, max) ou None
+
+        Returns:
+            Le bloc le plus proche ou None
+        """
+        radius = 32
+        while True:
+            radius = min(radius, max_radius)
+            hits = self.radius(center_x, center_z, radius, resources, y_range)
+            if hits:
+                return hits[0]
+            if radius >= max_radius:
+                return None
+            radius *= 2
+
+    def locations(self, resource_name: str) -> List[ResourceLocation]:
+        """
+        Retourne tous les emplacements indexés d'une ressource.
+
+        Args:
+            resource_name: Nom de la ressource
+
+        Returns:
+            Liste des emplacements
+        """
+        wanted = set(RESOURCE_GROUPS[resource_name])
+        with self._lock:
+            return [
+                ResourceLocation(x=x, y=y, z=z, block_id=block_id, resource_type=resource_name)
+                for hits in self.chunks.values()
+                for x, y, z, block_id in hits
+                if block_id in wanted
+            ]
+
+    def info(self) -> Dict:
+        """Retourne des informations sur l'état de l'index."""
+        with self._lock:
+            return {
+                "chunks_indexes": len(self.chunks),
+                "minerais_indexes": sum(len(h) for h in self.chunks.values()),
+                "monde_complet": self._all_loaded
+            }
+
+
+if __name__ == "__main__":
+    print("Module ore_index chargé avec succès ✓")
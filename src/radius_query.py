@@ -0,0 +1,196 @@
+"""
+Module de recherche de blocs dans un rayon autour d'une position.
+Ne lit que les fichiers de région et les chunks qui intersectent le disque de recherche.
+"""
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Generator, Any
+
+from .modern_region_reader import ModernRegionReader
+
+
+@dataclass
+class RadiusHit:
+    """
+    Bloc trouvé dans le rayon de recherche.
+    """
+    x: int  # Coordonnée X absolue (en blocs)
+    y: int  # Coordonnée Y absolue (en blocs)
+    z: int  # Coordonnée Z absolue (en blocs)
+    block_id: str  # ID du bloc (ex: "minecraft:diamond_ore")
+    distance: float  # Distance horizontale (X/Z) au centre de recherche
+
+
+def chunk_intersects_disc(
+    chunk_x: int,
+    chunk_z: int,
+    center_x: int,
+    center_z: int,
+    radius: float
+) -> bool:
+    """
+    Indique si un chunk (16x16 blocs) intersecte le disque de recherche.
+
+    Args:
+        chunk_x: Coordonnée X absolue du chunk
+        chunk_z: Coordonnée Z absolue du chunk
+        center_x: Centre X du disque (en blocs)
+        center_z: Centre Z du disque (en blocs)
+        radius: Rayon du disque (en blocs)
+
+    Returns:
+        True si au moins un bloc du chunk est dans le disque
+    """
+    # Point du chunk le plus proche du centre
+    nearest_x = min(max(center_x, chunk_x * 16), chunk_x * 16 + 15)
+    nearest_z = min(max(center_z, chunk_z * 16), chunk_z * 16 + 15)
+    return (nearest_x - center_x) ** 2 + (nearest_z - center_z) ** 2 <= radius * radius
+
+
+def chunks_in_radius(
+    center_x: int,
+    center_z: int,
+    radius: float
+) -> List[Tuple[int, int]]:
+    """
+    Liste les chunks (coordonnées absolues) qui intersectent le disque de recherche.
+
+    Args:
+        center_x: Centre X (en blocs)
+        center_z: Centre Z (en blocs)
+        radius: Rayon (en blocs)
+
+    Returns:
+        Liste de tuples (chunk_x, chunk_z)
+    """
+    reach = int(math.ceil(radius))
+    chunk_x_min = (center_x - reach) // 16
+    chunk_x_max = (center_x + reach) // 16
+    chunk_z_min = (center_z - reach) // 16
+    chunk_z_max = (center_z + reach) // 16
+
+    return [
+        (chunk_x, chunk_z)
+        for chunk_x in range(chunk_x_min, chunk_x_max + 1)
+        for chunk_z in range(chunk_z_min, chunk_z_max + 1)
+        if chunk_intersects_disc(chunk_x, chunk_z, center_x, center_z, radius)
+    ]
+
+
+def group_chunks_by_region(
+    chunks: List[Tuple[int, int]]
+) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+    """
+    Regroupe des chunks absolus par région (paires région → slots locaux).
+
+    Args:
+        chunks: Liste de tuples (chunk_x, chunk_z) absolus
+
+    Returns:
+        Dictionnaire (region_x, region_z) -> liste de (chunk_x_local, chunk_z_local)
+    """
+    slots = defaultdict(list)
+    for chunk_x, chunk_z in chunks:
+        slots[(chunk_x // 32, chunk_z // 32)].append((chunk_x % 32, chunk_z % 32))
+    return dict(slots)
+
+
+class RadiusQuery:
+    """
+    Recherche de blocs dans un rayon, en lisant directement les chunks concernés.
+    """
+
+    def __init__(self, reader: ModernRegionReader):
+        """
+        Initialise la requête.
+
+        Args:
+            reader: Lecteur de région à utiliser
+        """
+        self.reader = reader
+        self.chunks_scanned = 0
+
+    def iterate_chunks(
+        self,
+        center_x: int,
+        center_z: int,
+        radius: float
+    ) -> Generator[Tuple[Any, int, int], None, None]:
+        """
+        Itère uniquement sur les chunks qui intersectent le disque de recherche.
+
+        Args:
+            center_x: Centre X (en blocs)
+            center_z: Centre Z (en blocs)
+            radius: Rayon (en blocs)
+
+        Yields:
+            Tuple (nbt_data, chunk_x_abs, chunk_z_abs)
+        """
+        regions = group_chunks_by_region(chunks_in_radius(center_x, center_z, radius))
+
+        for (region_x, region_z), slots in sorted(regions.items()):
+            region_file = self.reader.get_region_file(region_x, region_z)
+            if not self.reader.has_region(region_file):
+                continue
+
+            try:
+                for nbt_data, chunk_x, chunk_z in self.reader.read_chunks(region_file, slots):
+                    yield nbt_data, region_x * 32 + chunk_x, region_z * 32 + chunk_z
+            except Exception:
+                # Région illisible : on passe à la suivante
+                continue
+
+    def find(
+        self,
+        center_x: int,
+        center_z: int,
+        radius: float,
+        block_ids: List[str],
+        y_min: int = -64,
+        y_max: int = 320
+    ) -> List[RadiusHit]:
+        """
+        Recherche des blocs dans un rayon autour d'une position.
+
+        Args:
+            center_x: Centre X (en blocs)
+            center_z: Centre Z (en blocs)
+            radius: Rayon de recherche horizontal (en blocs)
+            block_ids: Liste des IDs de blocs à rechercher
+            y_min: Hauteur minimale
+            y_max: Hauteur maximale
+
+        Returns:
+            Liste des blocs trouvés, triée par distance croissante
+        """
+        hits = []
+        self.chunks_scanned = 0
+        radius_sq = radius * radius
+
+        for nbt_data, chunk_x, chunk_z in self.iterate_chunks(center_x, center_z, radius):
+            self.chunks_scanned += 1
+            found = self.reader.scan_chunk_for_blocks(nbt_data, block_ids, y_min, y_max)
+
+            for x_local, y, z_local, block_id in found:
+                abs_x = chunk_x * 16 + x_local
+                abs_z = chunk_z * 16 + z_local
+                distance_sq = (abs_x - center_x) ** 2 + (abs_z - center_z) ** 2
+
+                if distance_sq <= radius_sq:
+                    hits.append(RadiusHit(
+                        x=abs_x,
+                        y=y,
+                        z=abs_z,
+                        block_id=block_id,
+                        distance=math.sqrt(distance_sq)
+                    ))
+
+        hits.sort(key=lambda h: h.distance)
+        return hits
+
+
+if __name__ == "__main__":
+    print("Module radius_query chargé avec succès ✓")
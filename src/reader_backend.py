@@ -0,0 +1,234 @@
+"""
+Interface commune des lecteurs de région et registre des backends disponibles.
+
+Un backend sait lister les régions, itérer sur les chunks, y chercher des blocs
+et donner accès aux sections décodées. ResourceFinder et `main.py --backend`
+choisissent le backend par son nom.
+"""
+
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Generator, List, Optional, Tuple
+
+from .config import APP_CONFIG, DIMENSIONS
+
+
+def region_directory(world_path: str, dimension: str = "overworld") -> Path:
+    """
+    Retourne le dossier des fichiers de région d'une dimension.
+
+    Args:
+        world_path: Chemin vers le monde Minecraft
+        dimension: "overworld", "nether" ou "end"
+
+    Returns:
+        Chemin du dossier (region, DIM-1/region ou DIM1/region)
+
+    Raises:
+        ValueError: Si la dimension est inconnue
+    """
+    if dimension not in DIMENSIONS:
+        raise ValueError(f"Dimension inconnue: {dimension} (disponibles: {', '.join(DIMENSIONS)})")
+    return Path(world_path) / DIMENSIONS[dimension]
+
+
+def parse_region_header(header: bytes) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Décode l'en-tête (8 Ko) d'un fichier de région.
+    
+    Args:
+        header: Premiers octets du fichier
+    
+    Returns:
+        Tuple (locations, timestamps) de 1024 entrées chacun (zéros si l'en-tête est incomplet)
+    """
+    if len(header) < 8192:
+        empty = (0,) * 1024
+        return empty, empty
+    
+    return struct.unpack('>1024I', header[:4096]), struct.unpack('>1024I', header[4096:8192])
+
+
+class ReaderBackend:
+    """
+    Interface d'un lecteur de région (à implémenter par chaque backend).
+
+    Les sous-classes définissent `region_path` (dossier des fichiers .mca,
+    voir region_directory()) et `dimension`.
+    """
+
+    region_path: Path
+    dimension: str = "overworld"
+
+    def list_region_files(self) -> List[Path]:
+        """Liste tous les fichiers de région (.mca), triés."""
+        return sorted(self.region_path.glob("*.mca"))
+
+    def get_region_coordinates(self, region_file: Path) -> Tuple[int, int]:
+        """Extrait les coordonnées d'une région depuis son nom (r.X.Z.mca)."""
+        parts = region_file.stem.split('.')
+        return int(parts[1]), int(parts[2])
+
+    def get_region_file(self, region_x: int, region_z: int) -> Path:
+        """Retourne le chemin du fichier de région r.X.Z.mca."""
+        return self.region_path / f"r.{region_x}.{region_z}.mca"
+    
+    def has_region(self, region_file: Path) -> bool:
+        """Indique si une région existe (chemin renvoyé par get_region_file())."""
+        return region_file.exists()
+    
+    def open_region(self, region_file: Path) -> BinaryIO:
+        """Ouvre un fichier de région en lecture binaire (avec accès direct)."""
+        return open(region_file, 'rb')
+    
+    def region_stat(self, region_file: Path) -> Tuple[int, float]:
+        """Taille et date de modification d'un fichier de région."""
+        stat = region_file.stat()
+        return stat.st_size, stat.st_mtime
+    
+    def read_header(self, region_file: Path) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Lit l'offset table et la table des timestamps d'un fichier de région.
+        
+        Returns:
+            Tuple (locations, timestamps) de 1024 entrées chacun
+        """
+        with self.open_region(region_file) as f:
+            return parse_region_header(f.read(8192))
+
+    def iterate_chunks(
+        self,
+        region_file: Optional[Path] = None,
+        show_progress: bool = True
+    ) -> Generator[Tuple[Any, int, int], None, None]:
+        """
+        Itère sur les chunks générés.
+
+        Args:
+            region_file: Fichier de région spécifique ou None pour tous
+            show_progress: Afficher la progression
+
+        Yields:
+            Tuple (chunk, chunk_x_abs, chunk_z_abs) ; le type de chunk dépend du backend
+        """
+        raise NotImplementedError
+
+    def scan_chunk_for_blocks(
+        self,
+        chunk: Any,
+        block_ids: Any,
+        y_min: int = -64,
+        y_max: int = 320
+    ) -> List[Tuple[int, int, int, str]]:
+        """
+        Cherche des blocs dans un chunk renvoyé par iterate_chunks().
+
+        Args:
+            chunk: Chunk du backend
+            block_ids: IDs de blocs, motifs ou BlockMatcher
+            y_min: Hauteur minimale
+            y_max: Hauteur maximale
+
+        Returns:
+            Liste de tuples (x_local, y, z_local, block_id)
+        """
+        raise NotImplementedError
+
+    def chunk_nbt(self, chunk: Any) -> Any:
+        """
+        Retourne les données NBT brutes (racine, avec DataVersion) d'un chunk
+        renvoyé par iterate_chunks() ; utilisé par l'analyse d'exposition.
+
+        Args:
+            chunk: Chunk du backend
+
+        Returns:
+            Compound NBT racine du chunk
+        """
+        return chunk
+
+    def get_section(self, chunk_x: int, chunk_z: int, section_y: int) -> Optional[Any]:
+        """
+        Retourne une section décodée (DecodedSection : indices + palette).
+
+        Args:
+            chunk_x: Coordonnée X absolue du chunk
+            chunk_z: Coordonnée Z absolue du chunk
+            section_y: Index Y de la section (y // 16)
+
+        Returns:
+            Section décodée ou None si le chunk ou la section n'existe pas
+        """
+        raise NotImplementedError
+
+
+# Nom -> fabrique (chemin du monde, dimension=... -> backend)
+_BACKENDS: Dict[str, Callable[..., ReaderBackend]] = {}
+_builtin_registered = False
+
+
+def register_backend(name: str, factory: Callable[..., ReaderBackend]):
+    """
+    Enregistre un backend de lecture.
+
+    Args:
+        name: Nom du backend (option --backend)
+        factory: Fabrique appelée avec le chemin du monde (et dimension=...)
+    """
+    _BACKENDS[name] = factory
+
+
+def _register_builtin_backends():
+    """Enregistre les backends fournis (import différé : les lecteurs importent ce module)."""
+    global _builtin_registered
+    if _builtin_registered:
+        return
+    _builtin_registered = True
+    from .modern_region_reader import ModernRegionReader
+    from .region_reader import RegionReader
+
+    _BACKENDS.setdefault("modern", ModernRegionReader)
+    _BACKENDS.setdefault(
+        "anvil", lambda world_path, **options: RegionReader(world_path, decoder="numpy", **options)
+    )
+    _BACKENDS.setdefault(
+        "anvil-slow", lambda world_path, **options: RegionReader(world_path, decoder="anvil", **options)
+    )
+
+
+def available_backends() -> List[str]:
+    """Retourne les noms des backends enregistrés."""
+    _register_builtin_backends()
+    return list(_BACKENDS)
+
+
+def create_backend(
+    name: Optional[str],
+    world_path: str,
+    dimension: str = "overworld"
+) -> ReaderBackend:
+    """
+    Crée un backend de lecture par son nom.
+
+    Args:
+        name: Nom du backend (défaut: APP_CONFIG["reader_backend"])
+        world_path: Chemin vers le monde Minecraft
+        dimension: Dimension lue ("overworld", "nether" ou "end")
+
+    Returns:
+        Lecteur de région
+
+    Raises:
+        ValueError: Si le backend est inconnu
+    """
+    _register_builtin_backends()
+    if name is None:
+        name = APP_CONFIG["reader_backend"]
+    factory = _BACKENDS.get(name)
+    if factory is None:
+        raise ValueError(f"Backend inconnu: {name} (disponibles: {', '.join(_BACKENDS)})")
+    return factory(world_path, dimension=dimension)
+
+
+if __name__ == "__main__":
+    print("Module reader_backend chargé avec succès ✓")
@@ -0,0 +1,304 @@
+"""
+Lecture des fichiers de région directement dans une sauvegarde (.zip, .tar,
+.tar.gz, .tgz...) sans extraction sur le disque.
+
+- zip non compressé et tar simple : accès direct (seules l'en-tête et les
+  secteurs demandés sont lus) ;
+- zip compressé : le membre est décompressé en mémoire à la demande ;
+- tar compressé (gzip, bz2, xz) : pas d'accès direct possible, l'archive est
+  lue en flux dans l'ordre de ses membres (list_regions() suit cet ordre). Ses
+  membres ne sont listés qu'au premier besoin, puis la liste est gardée sur le
+  disque (APP_CONFIG["archive_index_dir"]) tant que l'archive ne change pas.
+
+Une seule région décompressée est gardée en mémoire à la fois.
+"""
+
+import hashlib
+import io
+import json
+import tarfile
+import threading
+import time
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from .config import APP_CONFIG, DIMENSIONS
+
+
+# Extensions reconnues comme archives
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+
+def is_archive(path: str) -> bool:
+    """Indique si un chemin désigne une archive de sauvegarde (et non un dossier de monde)."""
+    path = Path(path)
+    return path.is_file() and path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+# Signatures des compressions gzip, bzip2 et xz
+_COMPRESSED_MAGIC = (b"\x1f\x8b", b"BZh", b"\xfd7zXZ\x00")
+
+
+def _is_plain_tar(path: Path) -> bool:
+    """Indique si un tar n'est pas compressé (accès direct aux membres possible)."""
+    with open(path, 'rb') as f:
+        head = f.read(6)
+    return not head.startswith(_COMPRESSED_MAGIC)
+
+
+def _is_region_member(member: str, dimension: str) -> bool:
+    """Indique si un membre d'archive est un fichier de région de la dimension."""
+    parts = PurePosixPath(member).parts
+    if not parts or not (parts[-1].startswith("r.") and parts[-1].endswith(".mca")):
+        return False
+
+    region_dir = PurePosixPath(DIMENSIONS[dimension]).parts
+    parents = parts[:-1]
+    if parents[-len(region_dir):] == region_dir:
+        # L'Overworld ne doit pas capter DIM-1/region ni DIM1/region
+        return dimension != "overworld" or parents[-2:-1] not in (("DIM-1",), ("DIM1",))
+    # Archive du seul contenu du dossier region/
+    return dimension == "overworld" and len(parents) == 0
+
+
+# Version du format des listes de membres gardées sur disque
+INDEX_VERSION = 1
+
+
+def _index_file(path: Path) -> Path:
+    """Fichier de la liste des membres d'un tar compressé."""
+    digest = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:12]
+    return Path(APP_CONFIG["archive_index_dir"]) / f"{path.name}-{digest}.json"
+
+
+def _load_stream_index(path: Path) -> Optional[List[Tuple[str, int, float]]]:
+    """Relit la liste des fichiers .mca d'un tar compressé (None si absente ou périmée)."""
+    try:
+        with open(_index_file(path), encoding='utf-8') as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    stat = path.stat()
+    if payload.get("version") != INDEX_VERSION or payload.get("archive") != [stat.st_size, stat.st_mtime]:
+        return None
+    return [tuple(entry) for entry in payload["membres"]]
+
+
+def _save_stream_index(path: Path, entries: List[Tuple[str, int, float]]):
+    """Enregistre la liste des fichiers .mca d'un tar compressé (écriture atomique)."""
+    stat = path.stat()
+    index_file = _index_file(path)
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = index_file.with_name(index_file.name + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": INDEX_VERSION, "archive": [stat.st_size, stat.st_mtime],
+                       "membres": entries}, f)
+        tmp_file.replace(index_file)
+    except OSError:
+        pass  # Dossier en lecture seule : la liste sera refaite au prochain lancement
+
+
+class _TarMemberFile(io.RawIOBase):
+    """
+    Membre d'un tar simple lu par son propre descripteur (accès direct, sans
+    position partagée avec les autres membres ouverts en même temps).
+    """
+
+    def __init__(self, path: Path, offset: int, size: int):
+        self._file = open(path, 'rb')
+        self._offset = offset
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, position: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            position += self._position
+        elif whence == io.SEEK_END:
+            position += self._size
+        self._position = max(0, position)
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        count = max(0, min(len(buffer), self._size - self._position))
+        if not count:
+            return 0
+        self._file.seek(self._offset + self._position)
+        data = self._file.read(count)
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+class RegionArchive:
+    """
+    Fichiers de région d'une dimension contenus dans une archive.
+    """
+
+    def __init__(self, archive_path: str, dimension: str = "overworld"):
+        """
+        Ouvre l'archive et liste ses fichiers de région (plus tard pour un tar compressé).
+
+        Args:
+            archive_path: Chemin de l'archive (.zip, .tar, .tar.gz...)
+            dimension: Dimension lue ("overworld", "nether" ou "end")
+
+        Raises:
+            ValueError: Si le format n'est pas reconnu
+        """
+        self.path = Path(archive_path)
+        self.dimension = dimension
+        self._lock = threading.Lock()
+        self._cached: Optional[Tuple[str, bytes]] = None  # Dernière région décompressée
+        self._stream = None  # Lecture en flux (tar compressé)
+        self._stream_iter = None
+
+        # Nom de région (r.X.Z.mca) -> membre (nom complet pour un tar compressé),
+        # taille, date de modification
+        self._members: Dict[str, object] = {}
+        self._stats: Dict[str, Tuple[int, float]] = {}
+        self._indexed = True
+
+        if zipfile.is_zipfile(self.path):
+            self.kind = "zip"
+            self._zip = zipfile.ZipFile(self.path)
+            for info in self._zip.infolist():
+                if _is_region_member(info.filename, dimension):
+                    name = PurePosixPath(info.filename).name
+                    self._members[name] = info
+                    self._stats[name] = (info.file_size, time.mktime(info.date_time + (0, 0, -1)))
+        elif tarfile.is_tarfile(self.path):
+            # Un tar non compressé permet l'accès direct aux membres
+            self.kind = "tar" if _is_plain_tar(self.path) else "tar-stream"
+            if self.kind == "tar":
+                self._tar = tarfile.open(self.path, "r:")
+                for member in self._tar.getmembers():
+                    if member.isfile() and _is_region_member(member.name, dimension):
+                        name = PurePosixPath(member.name).name
+                        self._members[name] = member
+                        self._stats[name] = (member.size, float(member.mtime))
+            else:
+                # Lister les membres demande de tout décompresser : au premier besoin
+                self._indexed = False
+        else:
+            raise ValueError(f"Archive non reconnue: {archive_path} (formats: {', '.join(ARCHIVE_SUFFIXES)})")
+
+    def _ensure_index(self):
+        """
+        Liste les membres d'un tar compressé s'ils ne sont pas encore connus : relus sur
+        le disque, ou une passe de décompression puis enregistrés pour les lancements suivants.
+        """
+        if self._indexed:
+            return
+        with self._lock:
+            if self._indexed:
+                return
+            entries = _load_stream_index(self.path)
+            if entries is None:
+                # Tous les .mca (toutes dimensions) : une seule liste par archive
+                with tarfile.open(self.path, "r|*") as stream:
+                    entries = [
+                        (entry.name, entry.size, float(entry.mtime)) for entry in stream
+                        if entry.isfile() and entry.name.endswith(".mca")
+                    ]
+                _save_stream_index(self.path, entries)
+            for member_name, size, mtime in entries:
+                if _is_region_member(member_name, self.dimension):
+                    name = PurePosixPath(member_name).name
+                    self._members[name] = member_name
+                    self._stats[name] = (size, mtime)
+            self._indexed = True
+
+    def list_regions(self) -> List[str]:
+        """
+        Liste les noms des fichiers de région (r.X.Z.mca).
+
+        Triés par nom, sauf pour les tar compressés : ordre de l'archive (lecture en un seul flux).
+        """
+        self._ensure_index()
+        if self.kind == "tar-stream":
+            return list(self._members)
+        return sorted(self._members)
+
+    def __contains__(self, name: str) -> bool:
+        self._ensure_index()
+        return name in self._members
+
+    def stat(self, name: str) -> Tuple[int, float]:
+        """Taille et date de modification d'un fichier de région dans l'archive."""
+        self._ensure_index()
+        return self._stats[name]
+
+    def open(self, name: str) -> BinaryIO:
+        """
+        Ouvre un fichier de région de l'archive en lecture binaire.
+
+        Args:
+            name: Nom du fichier de région (r.X.Z.mca)
+
+        Returns:
+            Fichier binaire avec accès direct (seek)
+
+        Raises:
+            FileNotFoundError: Si la région n'est pas dans l'archive
+        """
+        self._ensure_index()
+        member = self._members.get(name)
+        if member is None:
+            raise FileNotFoundError(f"{name} absent de {self.path}")
+
+        with self._lock:
+            if self.kind == "zip" and member.compress_type == zipfile.ZIP_STORED:
+                return self._zip.open(member)
+            if self.kind == "tar":
+                # extractfile() partagerait le descripteur du tar entre les threads
+                return _TarMemberFile(self.path, member.offset_data, member.size)
+
+            if self._cached is None or self._cached[0] != name:
+                self._cached = (name, self._read_member(name, member))
+            return io.BytesIO(self._cached[1])
+
+    def _read_member(self, name: str, member) -> bytes:
+        """Décompresse entièrement un membre (zip compressé ou tar en flux)."""
+        if self.kind == "zip":
+            return self._zip.read(member)
+
+        # Flux : avancer jusqu'au membre, en repartant du début s'il est déjà passé
+        for attempt in range(2):
+            if self._stream is None or attempt:
+                if self._stream is not None:
+                    self._stream.close()
+                self._stream = tarfile.open(self.path, "r|*")
+                self._stream_iter = iter(self._stream)
+            for entry in self._stream_iter:
+                if entry.isfile() and entry.name == member:
+                    return self._stream.extractfile(entry).read()
+        raise FileNotFoundError(f"{name} absent de {self.path}")
+
+    def close(self):
+        """Ferme l'archive."""
+        if self.kind == "zip":
+            self._zip.close()
+        elif self.kind == "tar":
+            self._tar.close()
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+if __name__ == "__main__":
+    print("Module region_archive chargé avec succès ✓")
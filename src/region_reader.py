@@ -5,37 +5,71 @@ Utilise la bibliothèque anvil-parser pour lire les fichiers .mca
 
 import os
 from pathlib import Path
-from typing import List, Generator, Tuple, Optional
+from typing import List, Generator, Tuple, Optional, Union
 import anvil
+from anvil.errors import ChunkNotFound
+from nbt import nbt
 from tqdm import tqdm
 
+from .block_matcher import BlockMatcher, compile_matcher
+from .config import DIMENSION_Y_RANGES
+from .modern_region_reader import decode_section_indices, iter_chunk_sections, scan_legacy_sections
+from .reader_backend import ReaderBackend, region_directory
+from .section_cache import DecodedSection, SectionCache
 
-class RegionReader:
+
+# Décodeurs disponibles pour scan_chunk_for_blocks
+DECODERS = ("numpy", "anvil")
+
+# DataVersion de 17w47a (1.13, "The Flattening") : palettes de blocs nommés
+_VERSION_FLATTENING = 1451
+
+
+class RegionReader(ReaderBackend):
     """
     Classe pour lire les fichiers de région Minecraft (.mca).
     """
     
-    def __init__(self, world_path: str):
+    def __init__(
+        self,
+        world_path: str,
+        decoder: str = "numpy",
+        dimension: str = "overworld",
+        section_cache: Optional[SectionCache] = None
+    ):
         """
         Initialise le lecteur de région.
         
         Args:
             world_path: Chemin vers le dossier du monde Minecraft
+            decoder: "numpy" (palette puis décodage vectorisé des sections)
+                ou "anvil" (chunk.get_block bloc par bloc, référence lente)
+            dimension: Dimension lue ("overworld", "nether" ou "end")
+            section_cache: Cache des sections décodées par get_section() (défaut: un cache
+                propre au lecteur)
         
         Raises:
             FileNotFoundError: Si le chemin n'existe pas
-            ValueError: Si le dossier region n'existe pas
+            ValueError: Si le dossier region n'existe pas ou si le décodeur est inconnu
         """
+        if decoder not in DECODERS:
+            raise ValueError(f"Décodeur inconnu: {decoder} (disponibles: {', '.join(DECODERS)})")
+        self.decoder = decoder
         self.world_path = Path(world_path)
+        self.section_cache = section_cache if section_cache is not None else SectionCache()
+        # Dernière région chargée par get_section() : (fichier, (taille, date), région)
+        self._last_region: Optional[Tuple[Path, Tuple[int, int], anvil.Region]] = None
         
         if not self.world_path.exists():
             raise FileNotFoundError(f"Le chemin {world_path} n'existe pas")
         
-        # Chemin vers le dossier region
-        self.region_path = self.world_path / "region"
+        # Chemin vers le dossier region de la dimension
+        self.dimension = dimension
+        self.region_path = region_directory(world_path, dimension)
         
         if not self.region_path.exists():
-            raise ValueError(f"Le dossier 'region' n'existe pas dans {world_path}")
+            raise ValueError(f"Le dossier '{self.region_path.relative_to(self.world_path)}' "
+                             f"n'existe pas dans {world_path}")
     
     def list_region_files(self) -> List[Path]:
         """
@@ -116,8 +150,8 @@ class RegionReader:
                             
                             yield chunk, absolute_chunk_x, absolute_chunk_z
                             
-                        except anvil.EmptyChunk:
-                            # Chunk vide, on continue
+                        except ChunkNotFound:
+                            # Chunk non généré, on continue
                             continue
                         except Exception as e:
                             # Erreur sur un chunk spécifique, on continue
@@ -130,6 +164,85 @@ class RegionReader:
                     tqdm.write(f"Erreur région {region_path.name}: {e}")
                 continue
     
+    def get_section(self, chunk_x: int, chunk_z: int, section_y: int) -> Optional[DecodedSection]:
+        """
+        Retourne une section décodée (format 1.13-1.17), depuis le cache si possible.
+        
+        Lors d'un défaut de cache, toutes les sections du chunk sont décodées et mises en
+        cache, et la région chargée est gardée pour les chunks voisins : les accès
+        proches ne relisent pas le fichier .mca.
+        
+        Args:
+            chunk_x: Coordonnée X absolue du chunk
+            chunk_z: Coordonnée Z absolue du chunk
+            section_y: Index Y de la section (y // 16)
+        
+        Returns:
+            Section décodée ou None si le chunk ou la section n'existe pas
+        """
+        region_key, chunk_key = (chunk_x // 32, chunk_z // 32), (chunk_x % 32, chunk_z % 32)
+        key = (region_key, chunk_key, section_y)
+        
+        found, section = self.section_cache.get(key)
+        if found:
+            return section
+        
+        chunk = None
+        region = self._load_region_cached(self.get_region_file(*region_key))
+        if region is not None:
+            try:
+                chunk = region.get_chunk(*chunk_key)
+            except ChunkNotFound:
+                chunk = None
+        
+        decoded = {}
+        if chunk is not None:
+            for y, names, data_array, spanning in iter_chunk_sections(self.chunk_nbt(chunk)):
+                decoded[y] = DecodedSection(
+                    indices=decode_section_indices(data_array, len(names), spanning),
+                    palette=names
+                )
+                self.section_cache.put((region_key, chunk_key, y), decoded[y])
+        
+        # Mémoriser l'absence des autres sections (et de celle demandée)
+        y_min, y_max = DIMENSION_Y_RANGES[self.dimension]
+        for y in list(range(y_min >> 4, (y_max >> 4) + 1)) + [section_y]:
+            if y not in decoded:
+                self.section_cache.put((region_key, chunk_key, y), None)
+        
+        return decoded.get(section_y)
+    
+    def _load_region_cached(self, region_file: Path) -> Optional[anvil.Region]:
+        """Charge une région, en réutilisant la dernière chargée si son fichier n'a pas changé."""
+        try:
+            stat = region_file.stat()
+        except OSError:
+            return None
+        signature = (stat.st_size, stat.st_mtime_ns)
+        
+        last = self._last_region
+        if last is not None and last[0] == region_file and last[1] == signature:
+            return last[2]
+        
+        region = self.load_region(region_file)
+        self._last_region = (region_file, signature, region)
+        return region
+    
+    def chunk_nbt(self, chunk: anvil.Chunk) -> nbt.TAG_Compound:
+        """
+        Reconstitue la racine NBT d'un chunk (anvil ne garde que le compound Level).
+        
+        Args:
+            chunk: Le chunk Minecraft
+        
+        Returns:
+            Compound racine avec DataVersion et Level
+        """
+        root = nbt.TAG_Compound()
+        root.tags.append(nbt.TAG_Int(name='DataVersion', value=chunk.version))
+        root.tags.append(chunk.data)  # Compound nommé "Level"
+        return root
+    
     def get_block_at(
         self,
         chunk: anvil.Chunk,
@@ -150,23 +263,62 @@ class RegionReader:
             Objet Block ou None si le bloc n'existe pas
         """
         try:
-            return chunk.get_block(x, y, z)
+            # force_new : blocs pré-1.13 convertis en noms "minecraft:..."
+            return chunk.get_block(x, y, z, force_new=True)
         except Exception:
             return None
     
     def scan_chunk_for_blocks(
         self,
         chunk: anvil.Chunk,
-        block_ids: List[str],
+        block_ids: Union[List[str], BlockMatcher],
         y_min: int = -64,
         y_max: int = 320
     ) -> List[Tuple[int, int, int, str]]:
         """
         Scanne un chunk pour trouver des blocs spécifiques.
         
+        Avec le décodeur "numpy", seules les sections dont la palette contient un
+        bloc recherché sont décodées (format 1.13-1.17 `Level/Sections`, indices
+        chevauchants avant 1.16). Les chunks antérieurs à 1.13 (identifiants
+        numériques) passent toujours par anvil.
+        
+        Args:
+            chunk: Le chunk à scanner
+            block_ids: IDs de blocs ou motifs à rechercher, ou BlockMatcher déjà compilé
+            y_min: Hauteur minimale de recherche
+            y_max: Hauteur maximale de recherche
+        
+        Returns:
+            Liste de tuples (x_local, y, z_local, block_id) pour chaque bloc trouvé,
+            dans l'ordre X, Z puis Y
+        """
+        matcher = compile_matcher(block_ids)
+        
+        if self.decoder == "anvil" or chunk.version < _VERSION_FLATTENING:
+            return self._scan_chunk_blocks(chunk, matcher, y_min, y_max)
+        
+        found_blocks = scan_legacy_sections(
+            chunk.data.get('Sections'), chunk.version, matcher, y_min, y_max
+        )
+        
+        # Même ordre que le parcours bloc par bloc
+        found_blocks.sort(key=lambda block: (block[0], block[2], block[1]))
+        return found_blocks
+    
+    def _scan_chunk_blocks(
+        self,
+        chunk: anvil.Chunk,
+        matcher: BlockMatcher,
+        y_min: int,
+        y_max: int
+    ) -> List[Tuple[int, int, int, str]]:
+        """
+        Scanne un chunk bloc par bloc avec anvil (lent, mais couvre tous les formats).
+        
         Args:
             chunk: Le chunk à scanner
-            block_ids: Liste des IDs de blocs à rechercher
+            matcher: Blocs recherchés
             y_min: Hauteur minimale de recherche
             y_max: Hauteur maximale de recherche
         
@@ -182,8 +334,8 @@ class RegionReader:
                 for y in range(y_min, y_max + 1):
                     block = self.get_block_at(chunk, x, y, z)
                     
-                    if block and block.id in block_ids:
-                        found_blocks.append((x, y, z, block.id))
+                    if block is not None and matcher.matches(block.name()):
+                        found_blocks.append((x, y, z, block.name()))
         
         return found_blocks
 
@@ -0,0 +1,343 @@
+"""
+Résumés compacts par région : nombre de blocs de chaque ressource par chunk,
+Y min/max, et timestamps de l'en-tête de la région au moment du scan.
+
+Produits en passant pendant les scans complets, ils permettent d'afficher une vue
+d'ensemble du monde (heatmap, rapport) sans relire un seul chunk.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .config import APP_CONFIG, DIMENSION_RESOURCES, DIMENSION_Y_RANGES, RESOURCE_GROUPS
+from .modern_region_reader import ModernRegionReader, read_region_header
+from .reader_backend import ReaderBackend
+
+
+# Version du format de fichier
+SUMMARY_VERSION = 1
+
+# Bornes "vides" des tableaux Y min / Y max
+_NO_Y_MIN = np.iinfo(np.int16).max
+_NO_Y_MAX = np.iinfo(np.int16).min
+
+
+class RegionSummary:
+    """
+    Résumé d'une région : tableaux (ressource, chunk_z local, chunk_x local).
+    """
+
+    def __init__(
+        self,
+        region_x: int,
+        region_z: int,
+        timestamps: Tuple[int, ...],
+        resources: Optional[List[str]] = None
+    ):
+        """
+        Initialise un résumé vide.
+
+        Args:
+            region_x: Coordonnée X de la région
+            region_z: Coordonnée Z de la région
+            timestamps: Table des timestamps de l'en-tête au moment du scan
+            resources: Ressources résumées (défaut: celles de l'Overworld)
+        """
+        self.region_x = region_x
+        self.region_z = region_z
+        self.timestamps = np.asarray(timestamps, dtype=np.uint32)
+        self.resources = list(resources or DIMENSION_RESOURCES["overworld"])
+
+        shape = (len(self.resources), 32, 32)
+        self.counts = np.zeros(shape, dtype=np.uint32)
+        self.y_min = np.full(shape, _NO_Y_MIN, dtype=np.int16)
+        self.y_max = np.full(shape, _NO_Y_MAX, dtype=np.int16)
+
+        # Bloc -> indice de ressource
+        self._block_resource: Dict[str, int] = {
+            block_id: i
+            for i, resource_name in enumerate(self.resources)
+            for block_id in RESOURCE_GROUPS[resource_name]
+        }
+
+    @property
+    def chunks_present(self) -> np.ndarray:
+        """Masque (z, x) des chunks générés, d'après l'en-tête."""
+        return (self.timestamps != 0).reshape(32, 32)
+
+    def add_chunk(self, local_x: int, local_z: int, hits: Iterable[Tuple[int, int, int, str]]):
+        """
+        Enregistre les minerais trouvés dans un chunk.
+
+        Args:
+            local_x: Coordonnée X du chunk dans la région (0-31)
+            local_z: Coordonnée Z du chunk dans la région (0-31)
+            hits: Blocs (x, y, z, block_id) trouvés dans le chunk
+        """
+        for _, y, _, block_id in hits:
+            resource = self._block_resource.get(block_id)
+            if resource is None:
+                continue
+            self.counts[resource, local_z, local_x] += 1
+            if y < self.y_min[resource, local_z, local_x]:
+                self.y_min[resource, local_z, local_x] = y
+            if y > self.y_max[resource, local_z, local_x]:
+                self.y_max[resource, local_z, local_x] = y
+
+    def resource_index(self, resource_name: str) -> int:
+        """Retourne l'indice d'une ressource dans les tableaux."""
+        return self.resources.index(resource_name)
+
+    def total(self, resource_name: str) -> int:
+        """Nombre total de blocs d'une ressource dans la région."""
+        return int(self.counts[self.resource_index(resource_name)].sum())
+
+    def y_range(self, resource_name: str) -> Optional[Tuple[int, int]]:
+        """Plage Y (min, max) d'une ressource dans la région, ou None si absente."""
+        i = self.resource_index(resource_name)
+        if not self.counts[i].any():
+            return None
+        present = self.counts[i] > 0
+        return int(self.y_min[i][present].min()), int(self.y_max[i][present].max())
+
+    def is_current(self, region_file: Path, reader: Optional[ReaderBackend] = None) -> bool:
+        """
+        Indique si le résumé correspond encore au fichier de région.
+
+        Args:
+            region_file: Fichier de région
+            reader: Lecteur du fichier (défaut: lecture directe sur le disque)
+
+        Returns:
+            True si la table des timestamps n'a pas changé depuis le scan
+        """
+        try:
+            _, timestamps = reader.read_header(region_file) if reader else read_region_header(region_file)
+        except OSError:
+            return False
+        return np.array_equal(self.timestamps, np.asarray(timestamps, dtype=np.uint32))
+
+    def save(self, path: Path):
+        """Écrit le résumé (.npz compressé), de façon atomique."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_name(path.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            np.savez_compressed(
+                f,
+                version=np.int32(SUMMARY_VERSION),
+                region=np.array([self.region_x, self.region_z], dtype=np.int32),
+                resources=np.array(self.resources, dtype=str),
+                timestamps=self.timestamps,
+                counts=self.counts,
+                y_min=self.y_min,
+                y_max=self.y_max
+            )
+        tmp_file.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["RegionSummary"]:
+        """
+        Relit un résumé écrit par save().
+
+        Args:
+            path: Fichier du résumé
+
+        Returns:
+            Résumé ou None si le fichier est absent, illisible ou d'une autre version
+        """
+        try:
+            with np.load(path) as data:
+                if int(data["version"]) != SUMMARY_VERSION:
+                    return None
+                region_x, region_z = (int(v) for v in data["region"])
+                summary = cls(region_x, region_z, data["timestamps"],
+                              [str(r) for r in data["resources"]])
+                summary.counts = data["counts"]
+                summary.y_min = data["y_min"]
+                summary.y_max = data["y_max"]
+            return summary
+        except (OSError, KeyError, ValueError):
+            return None
+
+
+class RegionSummaryStore:
+    """
+    Emplacement des résumés d'un monde (un fichier par région).
+    """
+
+    def __init__(
+        self,
+        world_path: str,
+        summary_dir: Optional[str] = None,
+        reader: Optional[ReaderBackend] = None,
+        dimension: Optional[str] = None
+    ):
+        """
+        Initialise le stockage.
+
+        Args:
+            world_path: Chemin vers le monde Minecraft
+            summary_dir: Dossier des résumés (défaut: APP_CONFIG["summary_dir"]/<nom du monde>,
+                plus un sous-dossier DIM-1 ou DIM1 pour le Nether et l'End)
+            reader: Lecteur utilisé pour lister et scanner les régions (défaut: ModernRegionReader)
+            dimension: Dimension résumée (défaut: celle du lecteur, sinon l'Overworld)
+        """
+        if dimension is None:
+            dimension = reader.dimension if reader is not None else "overworld"
+        self.dimension = dimension
+        self.reader = reader if reader is not None else ModernRegionReader(world_path, dimension=dimension)
+        if summary_dir is None:
+            summary_dir = Path(APP_CONFIG["summary_dir"]) / Path(world_path).resolve().name
+            region_dir = self.reader.region_path.relative_to(Path(world_path))
+            summary_dir = str(summary_dir / region_dir.parent)
+        self.summary_dir = Path(summary_dir)
+        self.resources = DIMENSION_RESOURCES[dimension]
+
+    @property
+    def block_ids(self) -> List[str]:
+        """Blocs de toutes les ressources résumées dans cette dimension."""
+        return [block for resource in self.resources for block in RESOURCE_GROUPS[resource]]
+
+    def path_for(self, region_x: int, region_z: int) -> Path:
+        """Chemin du résumé d'une région."""
+        return self.summary_dir / f"r.{region_x}.{region_z}.npz"
+
+    def start_region(self, region_file: Path) -> RegionSummary:
+        """
+        Crée le résumé d'une région avant de la scanner (timestamps lus avant le scan).
+
+        Args:
+            region_file: Fichier de région
+
+        Returns:
+            Résumé vide à remplir avec add_chunk()
+        """
+        region_x, region_z = self.reader.get_region_coordinates(region_file)
+        try:
+            _, timestamps = self.reader.read_header(region_file)
+        except OSError:
+            timestamps = (0,) * 1024
+        return RegionSummary(region_x, region_z, timestamps, self.resources)
+
+    def save(self, summary: RegionSummary) -> bool:
+        """
+        Enregistre un résumé (sans erreur si le dossier n'est pas accessible en écriture).
+
+        Returns:
+            True si le résumé a été écrit
+        """
+        try:
+            summary.save(self.path_for(summary.region_x, summary.region_z))
+            return True
+        except OSError:
+            return False
+
+    def load(self, region_file: Path) -> Optional[RegionSummary]:
+        """
+        Charge le résumé d'une région s'il est toujours à jour.
+
+        Args:
+            region_file: Fichier de région
+
+        Returns:
+            Résumé ou None s'il est absent ou périmé
+        """
+        region_x, region_z = self.reader.get_region_coordinates(region_file)
+        summary = RegionSummary.load(self.path_for(region_x, region_z))
+        if summary is None or not summary.is_current(region_file, self.reader):
+            return None
+        if summary.resources != self.resources:
+            return None  # Ressources ajoutées depuis le scan
+        return summary
+
+    def load_all(self) -> Tuple[List[RegionSummary], List[Path]]:
+        """
+        Charge les résumés à jour de toutes les régions.
+
+        Returns:
+            Tuple (résumés à jour, fichiers de région sans résumé valide)
+        """
+        summaries, missing = [], []
+        for region_file in self.reader.list_region_files():
+            summary = self.load(region_file)
+            if summary is None:
+                missing.append(region_file)
+            else:
+                summaries.append(summary)
+        return summaries, missing
+
+    def build(self, region_files: List[Path], show_progress: bool = True) -> List[RegionSummary]:
+        """
+        Scanne des régions (tous les minerais) uniquement pour produire leurs résumés.
+
+        Args:
+            region_files: Régions à résumer
+            show_progress: Afficher la progression
+
+        Returns:
+            Résumés produits
+        """
+        block_ids = self.block_ids
+        y_min, y_max = DIMENSION_Y_RANGES[self.dimension]
+        summaries = []
+        for region_file in region_files:
+            summary = self.start_region(region_file)
+            for nbt_data, chunk_x, chunk_z in self.reader.iterate_chunks(region_file, show_progress):
+                hits = self.reader.scan_chunk_for_blocks(nbt_data, block_ids, y_min, y_max)
+                summary.add_chunk(chunk_x % 32, chunk_z % 32, hits)
+            self.save(summary)
+            summaries.append(summary)
+        return summaries
+
+    def load_or_build(self, show_progress: bool = True) -> List[RegionSummary]:
+        """
+        Retourne les résumés de tout le monde, en ne scannant que les régions
+        sans résumé à jour.
+
+        Args:
+            show_progress: Afficher la progression
+
+        Returns:
+            Résumés de toutes les régions
+        """
+        summaries, missing = self.load_all()
+        if missing:
+            summaries += self.build(missing, show_progress)
+        return summaries
+
+
+def summary_chunk_counts(
+    summaries: List[RegionSummary],
+    resource_name: str
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Assemble les comptes par chunk d'une ressource en une grille couvrant les régions.
+
+    Args:
+        summaries: Résumés de régions
+        resource_name: Nom de la ressource
+
+    Returns:
+        Tuple (grille (z, x) de comptes par chunk, (chunk_x, chunk_z) du coin minimal)
+    """
+    if not summaries:
+        return np.zeros((0, 0), dtype=np.uint32), (0, 0)
+
+    region_xs = [s.region_x for s in summaries]
+    region_zs = [s.region_z for s in summaries]
+    origin_x, origin_z = min(region_xs), min(region_zs)
+    grid = np.zeros(((max(region_zs) - origin_z + 1) * 32, (max(region_xs) - origin_x + 1) * 32),
+                    dtype=np.uint32)
+
+    for summary in summaries:
+        z0 = (summary.region_z - origin_z) * 32
+        x0 = (summary.region_x - origin_x) * 32
+        grid[z0:z0 + 32, x0:x0 + 32] = summary.counts[summary.resource_index(resource_name)]
+
+    return grid, (origin_x * 32, origin_z * 32)
+
+
+if __name__ == "__main__":
+    print("Module region_summary chargé avec succès ✓")
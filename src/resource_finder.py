@@ -2,12 +2,30 @@
 Module de détection des ressources dans les chunks Minecraft.
 """
 
-from typing import List, Dict, Tuple
-from collections import defaultdict
+import asyncio
+import heapq
+import itertools
+import math
+import threading
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Generator, Iterator, List, Dict, Tuple, Optional
+from collections import defaultdict, deque
 from dataclasses import dataclass
+from pathlib import Path
 
-from .config import get_resource_blocks, RESOURCE_Y_DISTRIBUTION, APP_CONFIG
-from .modern_region_reader import ModernRegionReader
+import numpy as np
+from tqdm import tqdm
+
+from .config import get_resource_blocks, RESOURCE_Y_DISTRIBUTION, DIMENSION_Y_RANGES, APP_CONFIG
+from .reader_backend import create_backend
+from .chunk_cache import CACHE_BLOCK_IDS, ChunkResultCache
+from .region_summary import RegionSummaryStore
+from .exposure import ExposureTracker
+from .veins import Vein, find_veins
+from .clustering import Cluster, find_clusters, clusters_to_hotspots
+
+if TYPE_CHECKING:
+    from .checkpoint import ScanCheckpoint
 
 
 @dataclass
@@ -20,6 +38,7 @@ class ResourceLocation:
     z: int  # Coordonnée Z absolue (en blocs)
     block_id: str  # ID du bloc (ex: "minecraft:diamond_ore")
     resource_type: str  # Type de ressource (ex: "diamond")
+    exposed: bool = False  # Voisin d'air/eau (rempli par l'analyse d'exposition)
 
 
 @dataclass
@@ -32,6 +51,30 @@ class ResourceStats:
     locations: List[ResourceLocation]
     y_distribution: Dict[int, int]  # Y-level -> count
     hotspots: List[Tuple[int, int, int, int]]  # (x, z, count, radius)
+    exposed_count: Optional[int] = None  # Blocs exposés (None si non analysé)
+    veins: Optional[List[Vein]] = None  # Filons 3D (None si non analysé)
+    clusters: Optional[List[Cluster]] = None  # Zones denses (mode "dbscan" uniquement)
+
+
+@dataclass
+class HitBatch:
+    """
+    Lot de blocs trouvés, produit au fil du scan (voir ResourceFinder.iter_hit_batches()).
+    """
+    resource_type: str  # Type de ressource (ex: "diamond")
+    coords: np.ndarray  # Tableau (N, 3) int32 : x, y, z absolus
+    block_ids: List[str]  # ID du bloc de chaque ligne
+    distance: Optional[np.ndarray] = None  # Distance horizontale à l'origine (mode trié)
+    
+    def __len__(self) -> int:
+        return len(self.block_ids)
+    
+    def to_locations(self) -> List[ResourceLocation]:
+        """Convertit le lot en emplacements."""
+        return [
+            ResourceLocation(x=x, y=y, z=z, block_id=block_id, resource_type=self.resource_type)
+            for (x, y, z), block_id in zip(self.coords.tolist(), self.block_ids)
+        ]
 
 
 class ResourceFinder:
@@ -39,14 +82,37 @@ class ResourceFinder:
     Classe pour détecter et analyser les ressources dans le monde Minecraft.
     """
     
-    def __init__(self, world_path: str):
+    def __init__(
+        self,
+        world_path: str,
+        hotspot_method: Optional[str] = None,
+        write_summaries: bool = True,
+        backend: Optional[str] = None,
+        dimension: str = "overworld",
+        chunk_cache: Optional[ChunkResultCache] = None
+    ):
         """
         Initialise le détecteur de ressources.
         
         Args:
             world_path: Chemin vers le monde Minecraft
+            hotspot_method: "grid" ou "dbscan" (défaut: APP_CONFIG["hotspot_method"])
+            write_summaries: Écrire les résumés par région lors des scans complets
+            backend: Lecteur de région (voir available_backends(), défaut: APP_CONFIG["reader_backend"])
+            dimension: Dimension analysée ("overworld", "nether" ou "end")
+            chunk_cache: Cache des minerais par contenu de chunk, utilisé par les scans
+                complets sans exposition (les chunks déjà vus ne sont pas décodés)
         """
-        self.reader = ModernRegionReader(world_path)
+        if hotspot_method is None:
+            hotspot_method = APP_CONFIG["hotspot_method"]
+        if hotspot_method not in ("grid", "dbscan"):
+            raise ValueError(f"Méthode de zones riches inconnue: {hotspot_method}")
+        
+        self.hotspot_method = hotspot_method
+        self.dimension = dimension
+        self.reader = create_backend(backend, world_path, dimension)
+        self.summary_store = RegionSummaryStore(world_path, reader=self.reader) if write_summaries else None
+        self.chunk_cache = chunk_cache
         self.resource_locations: Dict[str, List[ResourceLocation]] = defaultdict(list)
     
     def find_resources(
@@ -55,7 +121,11 @@ class ResourceFinder:
         x_range: Tuple[int, int] = None,
         z_range: Tuple[int, int] = None,
         y_range: Tuple[int, int] = None,
-        show_progress: bool = True
+        show_progress: bool = True,
+        exposure: bool = False,
+        veins: bool = False,
+        region_files: Optional[List[Path]] = None,
+        checkpoint: Optional["ScanCheckpoint"] = None
     ) -> ResourceStats:
         """
         Recherche une ressource spécifique dans le monde.
@@ -66,10 +136,60 @@ class ResourceFinder:
             z_range: Plage de chunks en Z (min, max) ou None pour tout
             y_range: Plage de Y-levels (min, max) ou None pour utiliser la distribution naturelle
             show_progress: Afficher la progression
+            exposure: Marquer les blocs exposés à l'air/l'eau (dans la même passe)
+            veins: Regrouper les blocs en filons 3D (composantes connexes)
+            region_files: Régions à scanner (défaut: toutes, voir partition_regions())
+            checkpoint: Point de reprise (régions terminées sautées, chaque région finie enregistrée)
         
         Returns:
             Statistiques sur les ressources trouvées
         """
+        self.collect_locations(resource_name, x_range, z_range, y_range, show_progress,
+                               exposure, region_files, checkpoint)
+        
+        # Générer les statistiques
+        stats = self._generate_stats(resource_name)
+        if exposure:
+            stats.exposed_count = sum(1 for loc in stats.locations if loc.exposed)
+        if veins:
+            stats.veins = find_veins(stats.locations)
+        return stats
+    
+    def collect_locations(
+        self,
+        resource_name: str,
+        x_range: Tuple[int, int] = None,
+        z_range: Tuple[int, int] = None,
+        y_range: Tuple[int, int] = None,
+        show_progress: bool = True,
+        exposure: bool = False,
+        region_files: Optional[List[Path]] = None,
+        checkpoint: Optional["ScanCheckpoint"] = None
+    ) -> List[ResourceLocation]:
+        """
+        Scanne le monde et enregistre les emplacements d'une ressource, sans statistiques.
+        
+        Args:
+            resource_name: Nom de la ressource à chercher (ex: "diamond")
+            x_range: Plage de chunks en X (min, max) ou None pour tout
+            z_range: Plage de chunks en Z (min, max) ou None pour tout
+            y_range: Plage de Y-levels (min, max) ou None pour utiliser la distribution naturelle
+            show_progress: Afficher la progression
+            exposure: Marquer les blocs exposés à l'air/l'eau (dans la même passe)
+            region_files: Régions à scanner (défaut: toutes)
+            checkpoint: Point de reprise (régions terminées sautées, chaque région finie enregistrée ;
+                incompatible avec exposure)
+        
+        Returns:
+            Emplacements trouvés
+        
+        Raises:
+            ValueError: Si checkpoint et exposure sont demandés ensemble
+        """
+        if checkpoint and exposure:
+            # Les régions reprises ne fourniraient pas leurs faces à leurs voisines
+            raise ValueError("Un point de reprise ne se combine pas avec l'exposition")
+        
         # Récupérer les IDs de blocs pour cette ressource
         block_ids = get_resource_blocks(resource_name)
         
@@ -81,21 +201,78 @@ class ResourceFinder:
         
         # Réinitialiser les emplacements pour cette ressource
         self.resource_locations[resource_name] = []
+        locations = self.resource_locations[resource_name]
+        
+        # Reprise : emplacements des régions déjà terminées, les autres restent à scanner
+        on_region_done = None
+        if checkpoint:
+            if region_files is None:
+                region_files = self.reader.list_region_files()
+            done = [f for f in region_files if checkpoint.is_complete(f)]
+            locations.extend(checkpoint.completed_locations(done, resource_name))
+            region_files = [f for f in region_files if f not in done]
+            region_start = [len(locations)]
+            
+            def on_region_done(region_file: Path):
+                checkpoint.complete_region(region_file, locations[region_start[0]:])
+                region_start[0] = len(locations)
+        
+        world_y_min, world_y_max = DIMENSION_Y_RANGES[self.dimension]
+        tracker = ExposureTracker(world_y_min, world_y_max) if exposure else None
+        
+        # Scan complet : tous les minerais sur toute la hauteur, pour les résumés par région
+        store = self.summary_store if x_range is None and z_range is None else None
+        if store:
+            wanted_blocks = set(block_ids)
+            scan_blocks = store.block_ids + block_ids
+            scan_y_min = min(y_min, world_y_min)
+            scan_y_max = max(y_max, world_y_max)
+        else:
+            scan_blocks, scan_y_min, scan_y_max = block_ids, y_min, y_max
+        summary = None
+        
+        # Scan complet sans exposition : minerais lus dans le cache (aucune donnée NBT nécessaire)
+        iterate_region = None
+        if (self.chunk_cache and x_range is None and z_range is None and not tracker
+                and hasattr(self.reader, "iterate_chunk_payloads") and set(scan_blocks) <= set(CACHE_BLOCK_IDS)):
+            def iterate_region(region_file: Path):
+                return self.chunk_cache.iterate_region(self.reader, region_file)
         
         # Parcourir tous les chunks
-        for chunk, chunk_x, chunk_z in self.reader.iterate_chunks(show_progress=show_progress):
+        for chunk, chunk_x, chunk_z in self._iterate_chunks(region_files, show_progress, on_region_done,
+                                                            iterate_region):
             # Filtrer par coordonnées de chunks si spécifié
-            if x_range and not (x_range[0] <= chunk_x <= x_range[1]):
-                continue
-            if z_range and not (z_range[0] <= chunk_z <= z_range[1]):
+            outside_x = x_range and not (x_range[0] <= chunk_x <= x_range[1])
+            outside_z = z_range and not (z_range[0] <= chunk_z <= z_range[1])
+            if outside_x or outside_z:
+                # Les chunks bordant la zone servent de voisins pour l'exposition
+                if tracker and self._borders_range(chunk_x, chunk_z, x_range, z_range):
+                    tracker.process_chunk(chunk_x, chunk_z, self.reader.chunk_nbt(chunk), [])
                 continue
             
             # Scanner le chunk pour les blocs recherchés
-            found_blocks = self.reader.scan_chunk_for_blocks(
-                chunk, block_ids, y_min, y_max
-            )
+            if iterate_region:
+                found_blocks = chunk.find_blocks(scan_blocks, scan_y_min, scan_y_max)
+            else:
+                found_blocks = self.reader.scan_chunk_for_blocks(
+                    chunk, scan_blocks, scan_y_min, scan_y_max
+                )
+            
+            if store:
+                # Nouvelle région : enregistrer le résumé de la précédente
+                region = (chunk_x >> 5, chunk_z >> 5)
+                if summary is None or (summary.region_x, summary.region_z) != region:
+                    if summary:
+                        store.save(summary)
+                    summary = store.start_region(self.reader.get_region_file(*region))
+                summary.add_chunk(chunk_x & 31, chunk_z & 31, found_blocks)
+                found_blocks = [
+                    block for block in found_blocks
+                    if block[3] in wanted_blocks and y_min <= block[1] <= y_max
+                ]
             
             # Convertir en coordonnées absolues et enregistrer
+            chunk_locations = []
             for x_local, y, z_local, block_id in found_blocks:
                 absolute_x = chunk_x * 16 + x_local
                 absolute_z = chunk_z * 16 + z_local
@@ -108,22 +285,506 @@ class ResourceFinder:
                     resource_type=resource_name
                 )
                 
-                self.resource_locations[resource_name].append(location)
+                chunk_locations.append(location)
+            
+            if tracker:
+                tracker.process_chunk(chunk_x, chunk_z, self.reader.chunk_nbt(chunk), chunk_locations)
+            locations.extend(chunk_locations)
         
-        # Générer les statistiques
-        return self._generate_stats(resource_name)
+        if summary:
+            store.save(summary)
+        if tracker:
+            tracker.finish()
+        
+        return locations
+    
+    def iter_locations(
+        self,
+        resource_name: str,
+        x_range: Tuple[int, int] = None,
+        z_range: Tuple[int, int] = None,
+        y_range: Tuple[int, int] = None,
+        origin: Optional[Tuple[int, int]] = None,
+        limit: Optional[int] = None,
+        show_progress: bool = False
+    ) -> Generator[ResourceLocation, None, None]:
+        """
+        Itère sur les emplacements d'une ressource au fur et à mesure du scan
+        (voir iter_hit_batches()).
+        
+        Args:
+            resource_name: Nom de la ressource à chercher (ex: "diamond")
+            x_range: Plage de chunks en X (min, max) ou None pour tout
+            z_range: Plage de chunks en Z (min, max) ou None pour tout
+            y_range: Plage de Y-levels (min, max) ou None pour utiliser la distribution naturelle
+            origin: Position (x, z) en blocs pour un ordre par distance horizontale, ou None
+            limit: Nombre maximal d'emplacements produits (le scan s'arrête au-delà)
+            show_progress: Afficher la progression
+        
+        Yields:
+            Emplacements trouvés (par distance croissante si origin est donné)
+        """
+        for batch in self.iter_hit_batches(resource_name, x_range, z_range, y_range,
+                                           origin, limit, show_progress):
+            yield from batch.to_locations()
+    
+    def iter_hit_batches(
+        self,
+        resource_name: str,
+        x_range: Tuple[int, int] = None,
+        z_range: Tuple[int, int] = None,
+        y_range: Tuple[int, int] = None,
+        origin: Optional[Tuple[int, int]] = None,
+        limit: Optional[int] = None,
+        show_progress: bool = False
+    ) -> Generator[HitBatch, None, None]:
+        """
+        Scanne le monde et produit les blocs trouvés par lots, dès qu'ils sont connus,
+        sans garder les résultats en mémoire.
+        
+        Sans origine, un lot par chunk contenant la ressource. Avec une origine, les
+        chunks sont lus du plus proche au plus lointain et chaque lot contient les blocs
+        dont la distance est définitive : la concaténation des lots est triée par
+        distance, et les plus proches arrivent après la lecture de quelques chunks.
+        
+        Args:
+            resource_name: Nom de la ressource à chercher (ex: "diamond")
+            x_range: Plage de chunks en X (min, max) ou None pour tout
+            z_range: Plage de chunks en Z (min, max) ou None pour tout
+            y_range: Plage de Y-levels (min, max) ou None pour utiliser la distribution naturelle
+            origin: Position (x, z) en blocs pour un ordre par distance horizontale, ou None
+            limit: Nombre maximal de blocs produits (le scan s'arrête au-delà)
+            show_progress: Afficher la progression
+        
+        Yields:
+            Lots de blocs trouvés
+        """
+        block_ids = get_resource_blocks(resource_name)
+        y_min, y_max = y_range or RESOURCE_Y_DISTRIBUTION.get(resource_name, (-64, 320))
+        region_files = [
+            f for f in self.reader.list_region_files() if self._region_in_range(f, x_range, z_range)
+        ]
+        
+        if origin is None:
+            batches = self._chunk_batches(resource_name, region_files, block_ids, y_min, y_max,
+                                          x_range, z_range, show_progress)
+        else:
+            batches = self._ordered_batches(resource_name, region_files, block_ids, y_min, y_max,
+                                            x_range, z_range, origin, show_progress)
+        
+        remaining = limit
+        for batch in batches:
+            if remaining is not None and len(batch) >= remaining:
+                if remaining:
+                    yield HitBatch(batch.resource_type, batch.coords[:remaining], batch.block_ids[:remaining],
+                                   None if batch.distance is None else batch.distance[:remaining])
+                batches.close()
+                return
+            if remaining is not None:
+                remaining -= len(batch)
+            yield batch
+    
+    def _chunk_batches(
+        self,
+        resource_name: str,
+        region_files: List[Path],
+        block_ids: List[str],
+        y_min: int,
+        y_max: int,
+        x_range: Optional[Tuple[int, int]],
+        z_range: Optional[Tuple[int, int]],
+        show_progress: bool
+    ) -> Generator[HitBatch, None, None]:
+        """Un lot par chunk contenant la ressource, dans l'ordre des régions."""
+        for chunk, chunk_x, chunk_z in self._iterate_chunks(region_files, show_progress):
+            outside_x = x_range and not (x_range[0] <= chunk_x <= x_range[1])
+            outside_z = z_range and not (z_range[0] <= chunk_z <= z_range[1])
+            if outside_x or outside_z:
+                continue
+            found = self.reader.scan_chunk_for_blocks(chunk, block_ids, y_min, y_max)
+            if found:
+                yield self._hits_to_batch(resource_name, found, chunk_x, chunk_z)
+    
+    def _ordered_batches(
+        self,
+        resource_name: str,
+        region_files: List[Path],
+        block_ids: List[str],
+        y_min: int,
+        y_max: int,
+        x_range: Optional[Tuple[int, int]],
+        z_range: Optional[Tuple[int, int]],
+        origin: Tuple[int, int],
+        show_progress: bool
+    ) -> Generator[HitBatch, None, None]:
+        """
+        Lots triés par distance à origin (chunks lus du plus proche au plus lointain).
+        
+        Les blocs de chaque chunk, triés par distance, attendent dans un tas indexé par
+        leur distance minimale : seuls les chunks ayant des blocs prêts sont touchés.
+        Les chunks consécutifs d'une même région sont lus en ouvrant le fichier une fois.
+        """
+        origin_x, origin_z = origin
+        
+        # Chunks présents (d'après les en-têtes) avec leur distance minimale à l'origine
+        units = []
+        for region_file in region_files:
+            region_x, region_z = self.reader.get_region_coordinates(region_file)
+            try:
+                entries, _ = self.reader.read_header(region_file)
+            except OSError:
+                continue
+            slots = []
+            for slot, entry in enumerate(entries):
+                chunk_x, chunk_z = region_x * 32 + slot % 32, region_z * 32 + slot // 32
+                outside_x = x_range and not (x_range[0] <= chunk_x <= x_range[1])
+                outside_z = z_range and not (z_range[0] <= chunk_z <= z_range[1])
+                if entry and not (outside_x or outside_z):
+                    nearest_x = min(max(origin_x, chunk_x * 16), chunk_x * 16 + 15)
+                    nearest_z = min(max(origin_z, chunk_z * 16), chunk_z * 16 + 15)
+                    slots.append((math.hypot(nearest_x - origin_x, nearest_z - origin_z), slot % 32, slot // 32))
+            if not slots:
+                continue
+            if hasattr(self.reader, "read_chunks"):
+                units.extend((bound, region_file, (local_x, local_z)) for bound, local_x, local_z in slots)
+            else:
+                # Lecteur sans accès chunk par chunk : une région à la fois
+                units.append((min(slots)[0], region_file, None))
+        units.sort(key=lambda unit: unit[0])
+        
+        # (distance minimale, ordre de lecture, distances, coordonnées, blocs) par chunk
+        pending: List[Tuple[float, int, np.ndarray, np.ndarray, np.ndarray]] = []
+        read_order = itertools.count()
+        
+        def ready_batch(bound: float) -> Optional[HitBatch]:
+            """Retire du tas les blocs à bound ou moins, triés par distance."""
+            parts = []
+            while pending and pending[0][0] <= bound:
+                _, order, distance, coords, names = heapq.heappop(pending)
+                split = int(np.searchsorted(distance, bound, side="right"))
+                parts.append((order, distance[:split], coords[:split], names[:split]))
+                if split < len(distance):
+                    heapq.heappush(pending, (distance[split], order, distance[split:],
+                                             coords[split:], names[split:]))
+            if not parts:
+                return None
+            # Ordre de lecture puis tri stable : mêmes égalités qu'un tri de tous les blocs
+            parts.sort(key=lambda part: part[0])
+            distance = np.concatenate([part[1] for part in parts])
+            order = np.argsort(distance, kind="stable")
+            coords = np.concatenate([part[2] for part in parts])[order]
+            names = np.concatenate([part[3] for part in parts])[order]
+            return HitBatch(resource_name, coords, names.tolist(), distance[order])
+        
+        progress = tqdm(total=len(units), desc="Chunks analysés", disable=not show_progress,
+                        unit="chunks" if units and units[0][2] else "régions")
+        for region_file, run in itertools.groupby(units, key=lambda unit: unit[1]):
+            run = list(run)
+            if run[0][2] is None:
+                bounds = None
+                chunks = self.reader.iterate_chunks(region_file, show_progress=False)
+            else:
+                bounds = {slot: bound for bound, _, slot in run}
+                region_x, region_z = self.reader.get_region_coordinates(region_file)
+                chunks = (
+                    (chunk, region_x * 32 + local_x, region_z * 32 + local_z)
+                    for chunk, local_x, local_z in self.reader.read_chunks(region_file, list(bounds))
+                )
+            
+            # Les chunks suivants sont tous à bound ou plus : les blocs plus proches sont définitifs
+            batch = ready_batch(run[0][0])
+            if batch:
+                yield batch
+            
+            for chunk, chunk_x, chunk_z in chunks:
+                if bounds is not None:
+                    batch = ready_batch(bounds[(chunk_x % 32, chunk_z % 32)])
+                    if batch:
+                        yield batch
+                outside_x = x_range and not (x_range[0] <= chunk_x <= x_range[1])
+                outside_z = z_range and not (z_range[0] <= chunk_z <= z_range[1])
+                if outside_x or outside_z:
+                    continue
+                found = self.reader.scan_chunk_for_blocks(chunk, block_ids, y_min, y_max)
+                if not found:
+                    continue
+                batch = self._hits_to_batch(resource_name, found, chunk_x, chunk_z)
+                distance = np.hypot(batch.coords[:, 0] - origin_x, batch.coords[:, 2] - origin_z)
+                order = np.argsort(distance, kind="stable")
+                heapq.heappush(pending, (distance[order[0]], next(read_order), distance[order],
+                                         batch.coords[order], np.array(batch.block_ids, dtype=object)[order]))
+            progress.update(len(run))
+        progress.close()
+        
+        batch = ready_batch(math.inf)
+        if batch:
+            yield batch
+    
+    @staticmethod
+    def _hits_to_batch(
+        resource_name: str,
+        found: List[Tuple[int, int, int, str]],
+        chunk_x: int,
+        chunk_z: int
+    ) -> HitBatch:
+        """Convertit les blocs d'un chunk (coordonnées locales) en lot."""
+        coords = np.array([hit[:3] for hit in found], dtype=np.int32)
+        coords[:, 0] += chunk_x * 16
+        coords[:, 2] += chunk_z * 16
+        return HitBatch(resource_name, coords, [hit[3] for hit in found])
+    
+    def _iterate_chunks(
+        self,
+        region_files: Optional[List[Path]],
+        show_progress: bool,
+        on_region_done: Optional[Callable[[Path], None]] = None,
+        iterate_region: Optional[Callable[[Path], Iterator[Tuple[Any, int, int]]]] = None
+    ) -> Generator[Tuple[Any, int, int], None, None]:
+        """
+        Itère sur les chunks de toutes les régions ou d'une liste de régions.
+        
+        on_region_done(region_file) est appelé une fois tous les chunks de la région traités ;
+        iterate_region(region_file) remplace la lecture des chunks d'une région (cache).
+        """
+        if region_files is None and iterate_region is None:
+            yield from self.reader.iterate_chunks(show_progress=show_progress)
+            return
+        if region_files is None:
+            region_files = self.reader.list_region_files()
+        if iterate_region is None:
+            def iterate_region(region_file: Path):
+                return self.reader.iterate_chunks(region_file, show_progress=False)
+        
+        for region_file in tqdm(region_files, desc="Régions analysées", disable=not show_progress,
+                                unit="régions"):
+            yield from iterate_region(region_file)
+            if on_region_done:
+                on_region_done(region_file)
+    
+    @staticmethod
+    def _borders_range(
+        chunk_x: int,
+        chunk_z: int,
+        x_range: Optional[Tuple[int, int]],
+        z_range: Optional[Tuple[int, int]]
+    ) -> bool:
+        """Indique si un chunk hors zone est adjacent à la zone analysée."""
+        x_min, x_max = (x_range[0] - 1, x_range[1] + 1) if x_range else (chunk_x, chunk_x)
+        z_min, z_max = (z_range[0] - 1, z_range[1] + 1) if z_range else (chunk_z, chunk_z)
+        return x_min <= chunk_x <= x_max and z_min <= chunk_z <= z_max
+    
+    async def find_resources_async(
+        self,
+        resource_name: str,
+        x_range: Tuple[int, int] = None,
+        z_range: Tuple[int, int] = None,
+        y_range: Tuple[int, int] = None,
+        veins: bool = False,
+        executor: Optional[Executor] = None,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> ResourceStats:
+        """
+        Version asynchrone de find_resources() : la lecture, la décompression et les
+        statistiques tournent dans un executor, la boucle d'événements reste libre.
+        
+        Plusieurs requêtes peuvent partager le même finder (et le même executor) en
+        parallèle : les emplacements ne sont renvoyés que dans les statistiques de la
+        requête (get_locations() n'est pas modifié). Sans résumés, point de reprise ni
+        analyse d'exposition (voir find_resources() pour ces options).
+        
+        Args:
+            resource_name: Nom de la ressource à chercher (ex: "diamond")
+            x_range: Plage de chunks en X (min, max) ou None pour tout
+            z_range: Plage de chunks en Z (min, max) ou None pour tout
+            y_range: Plage de Y-levels (min, max) ou None pour utiliser la distribution naturelle
+            veins: Regrouper les blocs en filons 3D (composantes connexes)
+            executor: Executor de threads (défaut: celui de la boucle)
+            max_pending: Régions scannées à l'avance au plus (défaut: APP_CONFIG["async_max_pending"])
+            timeout: Durée maximale en secondes (asyncio.TimeoutError au-delà, scan arrêté)
+        
+        Returns:
+            Statistiques sur les ressources trouvées (emplacements dans stats.locations)
+        """
+        async def scan() -> ResourceStats:
+            loop = asyncio.get_running_loop()
+            locations = [
+                location async for location in self.iter_locations_async(
+                    resource_name, x_range, z_range, y_range, executor, max_pending
+                )
+            ]
+            stats = await loop.run_in_executor(executor, self._generate_stats, resource_name, locations)
+            if veins:
+                stats.veins = await loop.run_in_executor(executor, find_veins, stats.locations)
+            return stats
+        
+        return await asyncio.wait_for(scan(), timeout)
+    
+    async def iter_locations_async(
+        self,
+        resource_name: str,
+        x_range: Tuple[int, int] = None,
+        z_range: Tuple[int, int] = None,
+        y_range: Tuple[int, int] = None,
+        executor: Optional[Executor] = None,
+        max_pending: Optional[int] = None
+    ) -> AsyncIterator[ResourceLocation]:
+        """
+        Itère de façon asynchrone sur les emplacements d'une ressource, région par région.
+        
+        Au plus max_pending régions sont scannées à l'avance : un consommateur lent
+        ralentit le scan au lieu d'accumuler les résultats. Annuler la tâche ou fermer
+        l'itérateur (ex: contextlib.aclosing) arrête les régions en cours au chunk suivant.
+        
+        Args:
+            resource_name: Nom de la ressource à chercher (ex: "diamond")
+            x_range: Plage de chunks en X (min, max) ou None pour tout
+            z_range: Plage de chunks en Z (min, max) ou None pour tout
+            y_range: Plage de Y-levels (min, max) ou None pour utiliser la distribution naturelle
+            executor: Executor de threads (défaut: celui de la boucle)
+            max_pending: Régions scannées à l'avance au plus (défaut: APP_CONFIG["async_max_pending"])
+        
+        Yields:
+            Emplacements trouvés, dans l'ordre des régions
+        """
+        block_ids = get_resource_blocks(resource_name)
+        if y_range is None:
+            y_range = RESOURCE_Y_DISTRIBUTION.get(resource_name, (-64, 320))
+        max_pending = max(1, max_pending or APP_CONFIG["async_max_pending"])
+        
+        loop = asyncio.get_running_loop()
+        region_files = await loop.run_in_executor(executor, self.reader.list_region_files)
+        queued = iter([
+            f for f in region_files if self._region_in_range(f, x_range, z_range)
+        ])
+        
+        cancelled = threading.Event()
+        pending = deque()
+        try:
+            while True:
+                # Ne lancer de nouvelles régions que si le consommateur suit
+                while len(pending) < max_pending:
+                    region_file = next(queued, None)
+                    if region_file is None:
+                        break
+                    pending.append(loop.run_in_executor(
+                        executor, self._scan_region_locations, region_file, resource_name,
+                        block_ids, y_range, x_range, z_range, cancelled
+                    ))
+                if not pending:
+                    break
+                for location in await pending.popleft():
+                    yield location
+        finally:
+            # Annulation, délai dépassé ou itérateur fermé : arrêter les régions lancées
+            cancelled.set()
+            for future in pending:
+                future.cancel()
+    
+    def block_bounds(
+        self,
+        x_range: Tuple[int, int] = None,
+        z_range: Tuple[int, int] = None
+    ) -> Tuple[int, int, int, int]:
+        """
+        Zone couverte par les régions du monde, réduite aux plages de chunks données.
+        
+        Args:
+            x_range: Plage de chunks en X (min, max) ou None pour tout
+            z_range: Plage de chunks en Z (min, max) ou None pour tout
+        
+        Returns:
+            Tuple (x_min, z_min, x_max, z_max) en blocs
+        """
+        regions = [self.reader.get_region_coordinates(f) for f in self.reader.list_region_files()]
+        x_min, x_max = min(r[0] for r in regions) * 512, max(r[0] for r in regions) * 512 + 511
+        z_min, z_max = min(r[1] for r in regions) * 512, max(r[1] for r in regions) * 512 + 511
+        if x_range:
+            x_min, x_max = max(x_min, x_range[0] * 16), min(x_max, x_range[1] * 16 + 15)
+        if z_range:
+            z_min, z_max = max(z_min, z_range[0] * 16), min(z_max, z_range[1] * 16 + 15)
+        return x_min, z_min, x_max, z_max
+    
+    def _region_in_range(
+        self,
+        region_file: Path,
+        x_range: Optional[Tuple[int, int]],
+        z_range: Optional[Tuple[int, int]]
+    ) -> bool:
+        """Indique si une région contient des chunks de la zone analysée."""
+        region_x, region_z = self.reader.get_region_coordinates(region_file)
+        inside_x = not x_range or (x_range[0] <= region_x * 32 + 31 and region_x * 32 <= x_range[1])
+        inside_z = not z_range or (z_range[0] <= region_z * 32 + 31 and region_z * 32 <= z_range[1])
+        return inside_x and inside_z
+    
+    def _scan_region_locations(
+        self,
+        region_file: Path,
+        resource_name: str,
+        block_ids: List[str],
+        y_range: Tuple[int, int],
+        x_range: Optional[Tuple[int, int]],
+        z_range: Optional[Tuple[int, int]],
+        cancelled: threading.Event
+    ) -> List[ResourceLocation]:
+        """Tâche de l'executor : emplacements d'une ressource dans une région (arrêt si cancelled)."""
+        locations = []
+        for chunk, chunk_x, chunk_z in self.reader.iterate_chunks(region_file, show_progress=False):
+            if cancelled.is_set():
+                break
+            outside_x = x_range and not (x_range[0] <= chunk_x <= x_range[1])
+            outside_z = z_range and not (z_range[0] <= chunk_z <= z_range[1])
+            if outside_x or outside_z:
+                continue
+            for x_local, y, z_local, block_id in self.reader.scan_chunk_for_blocks(chunk, block_ids, *y_range):
+                locations.append(ResourceLocation(
+                    x=chunk_x * 16 + x_local,
+                    y=y,
+                    z=chunk_z * 16 + z_local,
+                    block_id=block_id,
+                    resource_type=resource_name
+                ))
+        return locations
+    
+    def stats_from_locations(
+        self,
+        resource_name: str,
+        locations: List[ResourceLocation],
+        hotspots: bool = True
+    ) -> ResourceStats:
+        """
+        Génère les statistiques d'une ressource à partir d'emplacements déjà connus.
+        
+        Args:
+            resource_name: Nom de la ressource
+            locations: Emplacements trouvés (ex: depuis un index en mémoire)
+            hotspots: Détecter les zones riches (sinon liste vide, ex: carte composite)
+        
+        Returns:
+            Objet ResourceStats avec les statistiques
+        """
+        self.resource_locations[resource_name] = list(locations)
+        return self._generate_stats(resource_name, hotspots=hotspots)
     
-    def _generate_stats(self, resource_name: str) -> ResourceStats:
+    def _generate_stats(
+        self,
+        resource_name: str,
+        locations: Optional[List[ResourceLocation]] = None,
+        hotspots: bool = True
+    ) -> ResourceStats:
         """
         Génère les statistiques pour une ressource.
         
         Args:
             resource_name: Nom de la ressource
+            locations: Emplacements (défaut: ceux du dernier scan de la ressource)
+            hotspots: Détecter les zones riches
         
         Returns:
             Objet ResourceStats avec les statistiques
         """
-        locations = self.resource_locations[resource_name]
+        if locations is None:
+            locations = self.resource_locations[resource_name]
         
         # Distribution par Y-level
         y_distribution = defaultdict(int)
@@ -131,14 +792,22 @@ class ResourceFinder:
             y_distribution[loc.y] += 1
         
         # Détection des zones riches (hotspots)
-        hotspots = self._find_hotspots(locations)
+        clusters = None
+        if not hotspots:
+            hotspots = []
+        elif self.hotspot_method == "dbscan":
+            clusters = find_clusters(locations)
+            hotspots = clusters_to_hotspots(clusters)
+        else:
+            hotspots = self._find_hotspots(locations)
         
         return ResourceStats(
             resource_type=resource_name,
             total_count=len(locations),
             locations=locations,
             y_distribution=dict(y_distribution),
-            hotspots=hotspots
+            hotspots=hotspots,
+            clusters=clusters
         )
     
     def _find_hotspots(
@@ -0,0 +1,148 @@
+"""
+Cache LRU des sections décodées (indices de palette + palette), borné en octets.
+Évite de relire, décompresser et re-parser un chunk à chaque accès aléatoire.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from .config import APP_CONFIG
+
+
+# Coût fixe estimé d'une entrée (clé, objets Python) en plus des données
+_ENTRY_OVERHEAD = 256
+
+
+@dataclass
+class DecodedSection:
+    """
+    Section de 16x16x16 blocs décodée.
+    """
+    indices: np.ndarray  # 4096 indices de palette (uint16), ordre x + z*16 + y*256
+    palette: List[str]  # Noms des blocs de la palette
+
+    @property
+    def nbytes(self) -> int:
+        """Taille mémoire approximative de la section."""
+        return self.indices.nbytes + sum(len(name) + 49 for name in self.palette)
+
+    def block_at(self, x: int, y: int, z: int) -> str:
+        """
+        Retourne le nom du bloc à une position locale de la section.
+
+        Args:
+            x: Coordonnée X locale (0-15)
+            y: Coordonnée Y locale (0-15)
+            z: Coordonnée Z locale (0-15)
+
+        Returns:
+            ID du bloc (ex: "minecraft:stone")
+        """
+        return self.palette[self.indices[x + z * 16 + y * 256]]
+
+
+class SectionCache:
+    """
+    Cache LRU de sections décodées, clé (région, chunk, section Y), borné en octets.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Initialise le cache.
+
+        Args:
+            max_bytes: Budget mémoire en octets (défaut: depuis APP_CONFIG)
+        """
+        if max_bytes is None:
+            max_bytes = APP_CONFIG["section_cache_bytes"]
+
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # clé -> (section ou None si absente, taille en octets)
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[DecodedSection], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Optional[DecodedSection]]:
+        """
+        Cherche une section dans le cache.
+
+        Args:
+            key: Clé (région, chunk, section Y)
+
+        Returns:
+            Tuple (trouvé, section). Une section absente du monde est mémorisée
+            comme (True, None) pour éviter de relire le chunk.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def put(self, key: Hashable, section: Optional[DecodedSection]):
+        """
+        Ajoute une section (ou l'absence de section) au cache.
+
+        Args:
+            key: Clé (région, chunk, section Y)
+            section: Section décodée ou None si la section n'existe pas
+        """
+        size = _ENTRY_OVERHEAD + (section.nbytes if section is not None else 0)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (section, size)
+            self.current_bytes += size
+
+            # Éviction des entrées les moins récemment utilisées
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Vide le cache (les compteurs sont conservés)."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne les compteurs du cache."""
+        total = self.hits + self.misses
+        return {
+            "sections": len(self._entries),
+            "octets": self.current_bytes,
+            "budget_octets": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "taux_hits": round(self.hits / total, 4) if total else 0.0
+        }
+
+
+if __name__ == "__main__":
+    print("Module section_cache chargé avec succès ✓")
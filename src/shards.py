@@ -0,0 +1,290 @@
+"""
+Scan distribué par shards : chaque machine scanne une partie des régions
+(`main.py --shard i/N`) et écrit un résultat partiel ; `main.py --merge`
+rassemble les résultats partiels en une seule ResourceStats.
+
+Le partage des régions ne dépend que des noms et des tailles des fichiers :
+toutes les machines qui voient le même monde (ex: via NFS) calculent la même
+partition, sans coordination.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .resource_finder import ResourceFinder, ResourceLocation, ResourceStats
+from .veins import find_veins
+
+
+# Version du format des fichiers de shard
+SHARD_VERSION = 1
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Lit une spécification de shard "i/N" (i de 1 à N).
+
+    Args:
+        spec: Spécification (ex: "2/4")
+
+    Returns:
+        Tuple (i, N)
+
+    Raises:
+        ValueError: Si la spécification est invalide
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard invalide: {spec} (format attendu: i/N, ex: 2/4)")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard invalide: {spec} (i doit être compris entre 1 et N)")
+    return index, count
+
+
+def partition_regions(
+    region_files: List[Path],
+    count: int,
+    region_size: Optional[Callable[[Path], int]] = None
+) -> List[List[Path]]:
+    """
+    Répartit les régions en shards de tailles équilibrées.
+
+    Les régions sont attribuées de la plus grosse à la plus petite au shard le
+    moins chargé (en octets) ; le résultat ne dépend que des noms et tailles.
+
+    Args:
+        region_files: Fichiers de région
+        count: Nombre de shards
+        region_size: Taille d'une région (défaut: taille du fichier ; voir ReaderBackend.region_stat)
+
+    Returns:
+        Liste de `count` listes de régions (triées par nom)
+    """
+    if region_size is None:
+        region_size = lambda region_file: region_file.stat().st_size
+    sizes = {region_file: region_size(region_file) for region_file in region_files}
+    shards: List[List[Path]] = [[] for _ in range(count)]
+    loads = [0] * count
+
+    for region_file in sorted(region_files, key=lambda f: (-sizes[f], f.name)):
+        target = min(range(count), key=lambda i: (loads[i], i))
+        shards[target].append(region_file)
+        loads[target] += sizes[region_file]
+
+    return [sorted(shard, key=lambda f: f.name) for shard in shards]
+
+
+def locations_to_arrays(locations: List[ResourceLocation]) -> Dict[str, np.ndarray]:
+    """
+    Convertit des emplacements en tableaux compacts pour np.savez.
+
+    Args:
+        locations: Emplacements trouvés
+
+    Returns:
+        Tableaux block_names, xyz, blocks (indice dans block_names) et exposed
+    """
+    block_names = sorted({loc.block_id for loc in locations})
+    block_index = {name: i for i, name in enumerate(block_names)}
+    return {
+        "block_names": np.array(block_names, dtype=str),
+        "xyz": np.array([(loc.x, loc.y, loc.z) for loc in locations], dtype=np.int32).reshape(-1, 3),
+        "blocks": np.array([block_index[loc.block_id] for loc in locations], dtype=np.int32),
+        "exposed": np.array([loc.exposed for loc in locations], dtype=bool)
+    }
+
+
+def locations_from_arrays(data, resource_type: str) -> List[ResourceLocation]:
+    """
+    Reconstruit les emplacements écrits avec locations_to_arrays().
+
+    Args:
+        data: Fichier .npz ouvert (ou dictionnaire de tableaux)
+        resource_type: Ressource des emplacements
+
+    Returns:
+        Emplacements
+    """
+    block_names = [str(name) for name in data["block_names"]]
+    return [
+        ResourceLocation(x=int(x), y=int(y), z=int(z), block_id=block_names[block],
+                         resource_type=resource_type, exposed=bool(exposed))
+        for (x, y, z), block, exposed in zip(data["xyz"], data["blocks"], data["exposed"])
+    ]
+
+
+@dataclass
+class ShardResult:
+    """
+    Résultat partiel d'un shard : emplacements trouvés dans ses régions.
+    """
+    resource_type: str
+    dimension: str
+    shard_index: int  # De 1 à shard_count
+    shard_count: int
+    y_range: Tuple[int, int]  # Plage Y recherchée
+    regions: List[str]  # Noms des fichiers de région scannés
+    locations: List[ResourceLocation]
+    exposure: bool = False  # Colonne "exposed" renseignée
+
+    def save(self, path: str) -> Path:
+        """
+        Écrit le résultat (.npz compressé), de façon atomique.
+
+        Args:
+            path: Fichier de sortie
+
+        Returns:
+            Chemin du fichier créé
+        """
+        output_file = Path(path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            np.savez_compressed(
+                f,
+                version=np.int32(SHARD_VERSION),
+                resource=np.array(self.resource_type),
+                dimension=np.array(self.dimension),
+                shard=np.array([self.shard_index, self.shard_count], dtype=np.int32),
+                y_range=np.array(self.y_range, dtype=np.int32),
+                regions=np.array(self.regions, dtype=str),
+                exposure=np.bool_(self.exposure),
+                **locations_to_arrays(self.locations)
+            )
+        tmp_file.replace(output_file)
+        return output_file
+
+    @classmethod
+    def load(cls, path: str) -> "ShardResult":
+        """
+        Relit un résultat écrit par save().
+
+        Args:
+            path: Fichier du shard
+
+        Returns:
+            Résultat du shard
+
+        Raises:
+            ValueError: Si le fichier est illisible ou d'une autre version
+        """
+        try:
+            with np.load(path) as data:
+                if int(data["version"]) != SHARD_VERSION:
+                    raise ValueError(f"Version de shard non supportée: {path}")
+                resource = str(data["resource"])
+                locations = locations_from_arrays(data, resource)
+                index, count = (int(v) for v in data["shard"])
+                return cls(
+                    resource_type=resource,
+                    dimension=str(data["dimension"]),
+                    shard_index=index,
+                    shard_count=count,
+                    y_range=tuple(int(v) for v in data["y_range"]),
+                    regions=[str(name) for name in data["regions"]],
+                    locations=locations,
+                    exposure=bool(data["exposure"])
+                )
+        except (OSError, KeyError) as e:
+            raise ValueError(f"Fichier de shard illisible: {path} ({e})")
+
+
+def check_shards(results: List[ShardResult], region_names: Optional[List[str]] = None):
+    """
+    Vérifie que des résultats partiels forment un scan complet et cohérent.
+
+    Args:
+        results: Résultats partiels
+        region_names: Régions du monde (None = ne pas vérifier la couverture)
+
+    Raises:
+        ValueError: Si un shard manque, est en double, porte sur une autre recherche,
+            si deux shards ont scanné la même région ou si une région n'a pas été scannée
+    """
+    if not results:
+        raise ValueError("Aucun shard à fusionner")
+
+    first = results[0]
+    for result in results[1:]:
+        same = (result.resource_type, result.dimension, result.shard_count, result.y_range,
+                result.exposure)
+        if same != (first.resource_type, first.dimension, first.shard_count, first.y_range,
+                    first.exposure):
+            raise ValueError(f"Shards incompatibles: {first.resource_type}/{first.dimension} "
+                             f"et {result.resource_type}/{result.dimension} (ou N, plage Y, exposition)")
+
+    indices = sorted(result.shard_index for result in results)
+    expected = list(range(1, first.shard_count + 1))
+    if indices != expected:
+        missing = sorted(set(expected) - set(indices))
+        duplicates = sorted({i for i in indices if indices.count(i) > 1})
+        raise ValueError(f"Shards manquants: {missing or 'aucun'}, en double: {duplicates or 'aucun'}")
+
+    if first.exposure:
+        # Chaque shard ne voit pas les chunks voisins des autres shards :
+        # les blocs au bord de ses régions seraient mal marqués
+        raise ValueError("Shards scannés avec --exposure : exposition incomplète aux bords des régions")
+
+    # Chaque région doit avoir été scannée par exactement un shard
+    owners: Dict[str, int] = {}
+    for result in results:
+        for name in result.regions:
+            if name in owners:
+                raise ValueError(f"Région {name} scannée par les shards {owners[name]} "
+                                 f"et {result.shard_index}")
+            owners[name] = result.shard_index
+    if region_names is not None:
+        missing_regions = sorted(set(region_names) - set(owners))
+        extra_regions = sorted(set(owners) - set(region_names))
+        if missing_regions or extra_regions:
+            raise ValueError(f"Les shards ne couvrent pas les régions du monde "
+                             f"(non scannées: {', '.join(missing_regions) or 'aucune'}, "
+                             f"inconnues: {', '.join(extra_regions) or 'aucune'})")
+
+
+def merge_shards(
+    paths: List[str],
+    world_path: str,
+    hotspot_method: str = None,
+    veins: bool = False
+) -> ResourceStats:
+    """
+    Fusionne les résultats partiels de tous les shards en une seule ResourceStats.
+
+    Args:
+        paths: Fichiers de shard (un par shard, de 1 à N)
+        world_path: Chemin vers le monde Minecraft
+        hotspot_method: "grid" ou "dbscan" (défaut: APP_CONFIG["hotspot_method"])
+        veins: Regrouper les blocs en filons 3D (sur l'ensemble fusionné)
+
+    Returns:
+        Statistiques du scan complet
+
+    Raises:
+        ValueError: Si les shards ne forment pas un scan complet du monde
+    """
+    results = sorted((ShardResult.load(path) for path in paths), key=lambda r: r.shard_index)
+    check_shards(results)
+    first = results[0]
+
+    finder = ResourceFinder(world_path, hotspot_method=hotspot_method, write_summaries=False,
+                            dimension=first.dimension)
+    check_shards(results, [region_file.name for region_file in finder.reader.list_region_files()])
+    stats = finder.stats_from_locations(
+        first.resource_type,
+        [loc for result in results for loc in result.locations]
+    )
+    if first.exposure:
+        stats.exposed_count = sum(1 for loc in stats.locations if loc.exposed)
+    if veins:
+        stats.veins = find_veins(stats.locations)
+    return stats
+
+
+if __name__ == "__main__":
+    print("Module shards chargé avec succès ✓")
@@ -0,0 +1,242 @@
+"""
+Différence entre deux copies d'un monde (sauvegardes, dossiers ou archives) :
+minerais apparus (nouveaux chunks générés) et disparus (minés) par ressource.
+
+Seuls les chunks modifiés sont décompressés : un chunk au même timestamp et au
+même nombre de secteurs est considéré inchangé sans être lu, et un chunk dont le
+timestamp a changé n'est décodé que si l'empreinte de ses données compressées
+diffère.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from tqdm import tqdm
+
+from .config import DIMENSION_RESOURCES, DIMENSION_Y_RANGES, RESOURCE_GROUPS
+from .modern_region_reader import ModernRegionReader, payload_digest
+
+
+def _is_streamed(reader: ModernRegionReader) -> bool:
+    """Indique si une copie est une archive lue en flux (tar compressé)."""
+    return reader.archive is not None and reader.archive.kind == "tar-stream"
+
+
+@dataclass
+class SnapshotDiff:
+    """
+    Résultat de la comparaison de deux copies d'un monde.
+    """
+    old_path: str
+    new_path: str
+    dimension: str
+    chunks_compared: int = 0  # Chunks présents dans au moins une copie
+    chunks_unchanged: int = 0  # Même timestamp, ou même empreinte
+    chunks_resaved: int = 0  # Timestamp différent mais données identiques
+    chunks_modified: int = 0
+    chunks_generated: int = 0  # Absents de l'ancienne copie
+    chunks_deleted: int = 0  # Absents de la nouvelle copie
+    # Ressource -> blocs (x, y, z, block_id) apparus / disparus
+    added: Dict[str, List[Tuple[int, int, int, str]]] = field(default_factory=dict)
+    removed: Dict[str, List[Tuple[int, int, int, str]]] = field(default_factory=dict)
+
+    def to_report(self, include_locations: bool = True) -> Dict:
+        """
+        Convertit la différence en dictionnaire (export JSON).
+
+        Args:
+            include_locations: Inclure les positions des blocs apparus / disparus
+
+        Returns:
+            Dictionnaire de la différence
+        """
+        report = {
+            "ancien": self.old_path,
+            "nouveau": self.new_path,
+            "dimension": self.dimension,
+            "timestamp": datetime.now().isoformat(),
+            "chunks": {
+                "compares": self.chunks_compared,
+                "inchanges": self.chunks_unchanged,
+                "resauvegardes": self.chunks_resaved,
+                "modifies": self.chunks_modified,
+                "generes": self.chunks_generated,
+                "supprimes": self.chunks_deleted
+            },
+            "ressources": {}
+        }
+
+        for resource in self.added:
+            entry = {
+                "apparus": len(self.added[resource]),
+                "disparus": len(self.removed[resource]),
+                "variation": len(self.added[resource]) - len(self.removed[resource])
+            }
+            if include_locations:
+                entry["positions_apparues"] = [
+                    {"x": x, "y": y, "z": z, "block_id": block_id}
+                    for x, y, z, block_id in self.added[resource]
+                ]
+                entry["positions_disparues"] = [
+                    {"x": x, "y": y, "z": z, "block_id": block_id}
+                    for x, y, z, block_id in self.removed[resource]
+                ]
+            report["ressources"][resource] = entry
+
+        return report
+
+    def export_to_json(self, output_path: str, include_locations: bool = True) -> Path:
+        """
+        Exporte la différence en JSON.
+
+        Args:
+            output_path: Chemin du fichier de sortie
+            include_locations: Inclure les positions des blocs apparus / disparus
+
+        Returns:
+            Chemin du fichier créé
+        """
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(self.to_report(include_locations), f, indent=2, ensure_ascii=False)
+
+        return output_file
+
+
+class SnapshotDiffer:
+    """
+    Compare deux copies d'un monde région par région, chunk par chunk.
+    """
+
+    def __init__(self, old_path: str, new_path: str, dimension: str = "overworld"):
+        """
+        Initialise la comparaison.
+
+        Args:
+            old_path: Ancienne copie (dossier du monde ou archive)
+            new_path: Nouvelle copie (dossier du monde ou archive)
+            dimension: Dimension comparée
+        """
+        self.old = ModernRegionReader(old_path, dimension=dimension)
+        self.new = ModernRegionReader(new_path, dimension=dimension)
+        self.dimension = dimension
+        self.resources = DIMENSION_RESOURCES[dimension]
+        self._block_resource = {
+            block_id: resource for resource in self.resources for block_id in RESOURCE_GROUPS[resource]
+        }
+
+    def diff(self, show_progress: bool = True) -> SnapshotDiff:
+        """
+        Compare les deux copies.
+
+        Args:
+            show_progress: Afficher la progression
+
+        Returns:
+            Différence entre les copies
+        """
+        result = SnapshotDiff(
+            old_path=str(self.old.world_path),
+            new_path=str(self.new.world_path),
+            dimension=self.dimension,
+            added={resource: [] for resource in self.resources},
+            removed={resource: [] for resource in self.resources}
+        )
+
+        old_regions = {f.name: f for f in self.old.list_region_files()}
+        new_regions = {f.name: f for f in self.new.list_region_files()}
+        # Un tar compressé se lit en un seul flux : suivre l'ordre de ses régions
+        # (celui de list_region_files()) évite de le relire depuis le début
+        if _is_streamed(self.old) and not _is_streamed(self.new):
+            names = list(old_regions) + [name for name in new_regions if name not in old_regions]
+        else:
+            names = list(new_regions) + [name for name in old_regions if name not in new_regions]
+
+        for name in tqdm(names, desc="Régions comparées", disable=not show_progress, unit="régions"):
+            self._diff_region(old_regions.get(name), new_regions.get(name), result)
+
+        return result
+
+    def _diff_region(self, old_file: Optional[Path], new_file: Optional[Path], result: SnapshotDiff):
+        """Compare une région présente dans au moins une des deux copies."""
+        empty = ((0,) * 1024, (0,) * 1024)
+        old_locations, old_timestamps = self.old.read_header(old_file) if old_file else empty
+        new_locations, new_timestamps = self.new.read_header(new_file) if new_file else empty
+        region_x, region_z = self.new.get_region_coordinates(new_file or old_file)
+
+        old_f = self.old.open_region(old_file) if old_file else None
+        new_f = self.new.open_region(new_file) if new_file else None
+        try:
+            for slot in range(1024):
+                old_entry, new_entry = old_locations[slot], new_locations[slot]
+                if not old_entry and not new_entry:
+                    continue
+                result.chunks_compared += 1
+
+                # Même timestamp et même taille : inchangé, sans rien lire
+                if (old_entry and new_entry and old_timestamps[slot] == new_timestamps[slot]
+                        and (old_entry & 0xFF) == (new_entry & 0xFF)):
+                    result.chunks_unchanged += 1
+                    continue
+
+                old_payload = self.old.read_chunk_payload(old_f, old_entry) if old_entry else None
+                new_payload = self.new.read_chunk_payload(new_f, new_entry) if new_entry else None
+                if old_payload and new_payload and payload_digest(old_payload) == payload_digest(new_payload):
+                    result.chunks_unchanged += 1
+                    result.chunks_resaved += 1
+                    continue
+
+                if old_payload is None:
+                    result.chunks_generated += 1
+                elif new_payload is None:
+                    result.chunks_deleted += 1
+                else:
+                    result.chunks_modified += 1
+
+                chunk_x = region_x * 32 + slot % 32
+                chunk_z = region_z * 32 + slot // 32
+                old_hits = self._scan_payload(self.old, old_payload, chunk_x, chunk_z)
+                new_hits = self._scan_payload(self.new, new_payload, chunk_x, chunk_z)
+
+                for hit in sorted(new_hits - old_hits):
+                    result.added[self._block_resource[hit[3]]].append(hit)
+                for hit in sorted(old_hits - new_hits):
+                    result.removed[self._block_resource[hit[3]]].append(hit)
+        finally:
+            for f in (old_f, new_f):
+                if f is not None:
+                    f.close()
+
+    def _scan_payload(
+        self,
+        reader: ModernRegionReader,
+        payload: Optional[Tuple[int, bytes]],
+        chunk_x: int,
+        chunk_z: int
+    ) -> set:
+        """Décode un chunk modifié et retourne ses minerais en coordonnées absolues."""
+        if payload is None:
+            return set()
+        try:
+            nbt_data = reader.parse_chunk_payload(*payload)
+        except Exception:
+            return set()  # Chunk corrompu : comme un chunk vide
+        if nbt_data is None:
+            return set()
+
+        y_min, y_max = DIMENSION_Y_RANGES[self.dimension]
+        return {
+            (chunk_x * 16 + x, y, chunk_z * 16 + z, block_id)
+            for x, y, z, block_id in reader.scan_chunk_for_blocks(
+                nbt_data, list(self._block_resource), y_min, y_max
+            )
+        }
+
+
+if __name__ == "__main__":
+    print("Module snapshot_diff chargé avec succès ✓")
@@ -2,13 +2,15 @@
 Module de calcul de statistiques avancées sur les ressources.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 from collections import Counter
 import json
 from pathlib import Path
 from datetime import datetime
 
-from .resource_finder import ResourceStats, ResourceLocation
+from .resource_finder import HitBatch, ResourceStats, ResourceLocation
+from .region_summary import RegionSummary
+from .veins import vein_size_distribution
 
 
 class StatisticsCalculator:
@@ -103,6 +105,9 @@ class StatisticsCalculator:
                 "top_hotspots": []
             }
         
+        if stats.clusters is not None:
+            return self._cluster_hotspot_stats(stats)
+        
         top_hotspots = []
         for x, z, count, radius in stats.hotspots[:10]:  # Top 10
             top_hotspots.append({
@@ -119,6 +124,30 @@ class StatisticsCalculator:
             "hotspot_le_plus_riche": top_hotspots[0] if top_hotspots else None
         }
     
+    def _cluster_hotspot_stats(self, stats: ResourceStats) -> Dict:
+        """Statistiques des zones riches issues du regroupement par densité."""
+        top_hotspots = []
+        for cluster in stats.clusters[:10]:  # Top 10
+            x_min, z_min, x_max, z_max = cluster.bbox
+            area = (x_max - x_min + 1) * (z_max - z_min + 1)
+            top_hotspots.append({
+                "centre_x": round(cluster.centroid[0]),
+                "centre_z": round(cluster.centroid[2]),
+                "centre_y": cluster.centroid[1],
+                "nombre_blocs": cluster.count,
+                "rayon": cluster.radius,
+                "boite": list(cluster.bbox),
+                "densite": round(cluster.count / area, 4)
+            })
+        
+        return {
+            "methode": "dbscan",
+            "nombre_hotspots": len(stats.clusters),
+            "blocs_dans_zones": sum(c.count for c in stats.clusters),
+            "top_hotspots": top_hotspots,
+            "hotspot_le_plus_riche": top_hotspots[0] if top_hotspots else None
+        }
+    
     def calculate_spatial_stats(self, stats: ResourceStats) -> Dict:
         """
         Calcule des statistiques spatiales (dispersion, etc.).
@@ -163,6 +192,59 @@ class StatisticsCalculator:
             "densite_globale": round(density, 6)
         }
     
+    def calculate_exposure_stats(self, stats: ResourceStats) -> Dict:
+        """
+        Calcule les statistiques d'exposition (blocs visibles depuis une cave).
+        
+        Args:
+            stats: Statistiques des ressources (analysées avec exposure=True)
+        
+        Returns:
+            Dictionnaire avec les statistiques d'exposition
+        """
+        exposed = stats.exposed_count or 0
+        by_y = Counter(loc.y for loc in stats.locations if loc.exposed)
+        
+        return {
+            "blocs_exposes": exposed,
+            "blocs_enfouis": stats.total_count - exposed,
+            "pourcentage_exposes": round(exposed / stats.total_count * 100, 2) if stats.total_count else 0.0,
+            "exposes_par_hauteur": dict(sorted(by_y.items()))
+        }
+    
+    def calculate_vein_stats(self, stats: ResourceStats) -> Dict:
+        """
+        Calcule les statistiques des filons (blocs connexes en 3D).
+        
+        Args:
+            stats: Statistiques des ressources (analysées avec veins=True)
+        
+        Returns:
+            Dictionnaire avec les statistiques des filons
+        """
+        veins = stats.veins or []
+        sizes = [v.size for v in veins]
+        
+        top_veins = [
+            {
+                "taille": v.size,
+                "centre_x": v.centroid[0],
+                "centre_y": v.centroid[1],
+                "centre_z": v.centroid[2],
+                "boite": list(v.bbox)
+            }
+            for v in veins[:10]
+        ]
+        
+        return {
+            "nombre_filons": len(veins),
+            "taille_moyenne": round(sum(sizes) / len(sizes), 2) if sizes else 0,
+            "taille_max": max(sizes) if sizes else 0,
+            "blocs_isoles": sum(1 for size in sizes if size == 1),
+            "distribution_tailles": vein_size_distribution(veins),
+            "top_filons": top_veins
+        }
+    
     def generate_full_report(self, stats: ResourceStats) -> Dict:
         """
         Génère un rapport complet avec toutes les statistiques.
@@ -173,7 +255,7 @@ class StatisticsCalculator:
         Returns:
             Dictionnaire complet des statistiques
         """
-        return {
+        report = {
             "ressource": stats.resource_type,
             "total_blocs": stats.total_count,
             "timestamp": datetime.now().isoformat(),
@@ -181,6 +263,13 @@ class StatisticsCalculator:
             "zones_riches": self.calculate_hotspot_stats(stats),
             "statistiques_spatiales": self.calculate_spatial_stats(stats)
         }
+        
+        if stats.exposed_count is not None:
+            report["exposition"] = self.calculate_exposure_stats(stats)
+        if stats.veins is not None:
+            report["filons"] = self.calculate_vein_stats(stats)
+        
+        return report
     
     def export_to_json(
         self,
@@ -202,15 +291,64 @@ class StatisticsCalculator:
         report = self.generate_full_report(stats)
         
         if include_locations:
-            report["emplacements"] = [
-                {
-                    "x": loc.x,
-                    "y": loc.y,
-                    "z": loc.z,
-                    "block_id": loc.block_id
-                }
-                for loc in stats.locations
-            ]
+            report["emplacements"] = self._locations_report(stats)
+        
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        
+        return output_file
+    
+    def _locations_report(self, stats: ResourceStats) -> List[Dict]:
+        """Liste complète des emplacements pour l'export JSON."""
+        entries = [
+            {
+                "x": loc.x,
+                "y": loc.y,
+                "z": loc.z,
+                "block_id": loc.block_id
+            }
+            for loc in stats.locations
+        ]
+        
+        # Colonne "exposed" si l'analyse d'exposition a été faite
+        if stats.exposed_count is not None:
+            for entry, loc in zip(entries, stats.locations):
+                entry["exposed"] = loc.exposed
+        
+        return entries
+    
+    def export_dimensions_to_json(
+        self,
+        results: Dict[str, Dict[str, ResourceStats]],
+        output_path: str,
+        include_locations: bool = False
+    ) -> Path:
+        """
+        Exporte en JSON les statistiques de plusieurs dimensions (voir scan_dimensions).
+        
+        Args:
+            results: Dictionnaire dimension -> ressource -> statistiques
+            output_path: Chemin du fichier de sortie
+            include_locations: Inclure la liste complète des emplacements
+        
+        Returns:
+            Chemin du fichier créé
+        """
+        report = {
+            "timestamp": datetime.now().isoformat(),
+            "dimensions": {}
+        }
+        
+        for dimension, by_resource in results.items():
+            report["dimensions"][dimension] = {}
+            for resource_name, stats in by_resource.items():
+                entry = self.generate_full_report(stats)
+                if include_locations:
+                    entry["emplacements"] = self._locations_report(stats)
+                report["dimensions"][dimension][resource_name] = entry
         
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -220,6 +358,41 @@ class StatisticsCalculator:
         
         return output_file
     
+    def export_hits_to_jsonl(
+        self,
+        batches: Iterable[HitBatch],
+        output_path: str
+    ) -> Tuple[Path, int]:
+        """
+        Exporte les blocs trouvés au fil du scan, une ligne JSON par bloc (JSON Lines).
+        
+        Chaque lot est écrit dès qu'il arrive : le fichier est lisible pendant le scan
+        et rien n'est gardé en mémoire.
+        
+        Args:
+            batches: Lots de blocs (voir ResourceFinder.iter_hit_batches())
+            output_path: Chemin du fichier de sortie
+        
+        Returns:
+            Tuple (chemin du fichier créé, nombre de blocs exportés)
+        """
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for batch in batches:
+                distances = batch.distance.tolist() if batch.distance is not None else None
+                for i, ((x, y, z), block_id) in enumerate(zip(batch.coords.tolist(), batch.block_ids)):
+                    entry = {"x": x, "y": y, "z": z, "block_id": block_id}
+                    if distances is not None:
+                        entry["distance"] = round(distances[i], 2)
+                    f.write(json.dumps(entry) + "\n")
+                count += len(batch)
+                f.flush()
+        
+        return output_file, count
+    
     def print_summary(self, stats: ResourceStats):
         """
         Affiche un résumé des statistiques dans la console.
@@ -235,6 +408,22 @@ class StatisticsCalculator:
         
         print(f"💎 Total trouvé: {stats.total_count} blocs\n")
         
+        # Exposition
+        if "exposition" in report:
+            exposure = report["exposition"]
+            print(f"🕳️  Exposés (visibles depuis une cave): {exposure['blocs_exposes']} blocs "
+                  f"({exposure['pourcentage_exposes']}%)\n")
+        
+        # Filons
+        if "filons" in report:
+            vein_stats = report["filons"]
+            print(f"⛓️  Filons: {vein_stats['nombre_filons']} "
+                  f"(taille moyenne {vein_stats['taille_moyenne']}, max {vein_stats['taille_max']})")
+            for i, vein in enumerate(vein_stats["top_filons"][:3], 1):
+                print(f"   {i}. {vein['taille']} blocs autour de X={vein['centre_x']}, "
+                      f"Y={vein['centre_y']}, Z={vein['centre_z']}")
+            print()
+        
         # Distribution en hauteur
         if "distribution_hauteur" in report:
             y_stats = report["distribution_hauteur"]
@@ -286,6 +475,83 @@ class StatisticsCalculator:
                 print(f"   • Densité: {spatial['densite_globale']:.6f} blocs/bloc²\n")
         
         print(f"{'='*60}\n")
+    
+    def generate_overview_report(self, summaries: List[RegionSummary]) -> Dict:
+        """
+        Génère un rapport de toutes les ressources à partir des résumés par région.
+        
+        Args:
+            summaries: Résumés par région (voir RegionSummaryStore)
+        
+        Returns:
+            Dictionnaire ressource -> statistiques globales
+        """
+        resources = summaries[0].resources if summaries else []
+        report = {
+            "timestamp": datetime.now().isoformat(),
+            "regions": len(summaries),
+            "chunks": sum(int(s.chunks_present.sum()) for s in summaries),
+            "ressources": {}
+        }
+        
+        for resource in resources:
+            totals = {(s.region_x, s.region_z): s.total(resource) for s in summaries}
+            ranges = [r for r in (s.y_range(resource) for s in summaries) if r]
+            best_region = max(totals, key=totals.get) if totals else None
+            
+            report["ressources"][resource] = {
+                "total_blocs": sum(totals.values()),
+                "chunks_avec_ressource": sum(
+                    int((s.counts[s.resource_index(resource)] > 0).sum()) for s in summaries
+                ),
+                "y_min": min(r[0] for r in ranges) if ranges else None,
+                "y_max": max(r[1] for r in ranges) if ranges else None,
+                "meilleure_region": list(best_region) if best_region and totals[best_region] else None
+            }
+        
+        return report
+    
+    def export_overview_to_json(self, summaries: List[RegionSummary], output_path: str) -> Path:
+        """
+        Exporte la vue d'ensemble en JSON.
+        
+        Args:
+            summaries: Résumés par région
+            output_path: Chemin du fichier de sortie
+        
+        Returns:
+            Chemin du fichier créé
+        """
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(self.generate_overview_report(summaries), f, indent=2, ensure_ascii=False)
+        
+        return output_file
+    
+    def print_overview(self, summaries: List[RegionSummary]):
+        """
+        Affiche la vue d'ensemble des ressources du monde dans la console.
+        
+        Args:
+            summaries: Résumés par région
+        """
+        report = self.generate_overview_report(summaries)
+        
+        print(f"\n{'='*60}")
+        print(f"  VUE D'ENSEMBLE - {report['regions']} régions, {report['chunks']} chunks")
+        print(f"{'='*60}\n")
+        
+        for resource, info in sorted(
+            report["ressources"].items(), key=lambda item: item[1]["total_blocs"], reverse=True
+        ):
+            line = f"   • {resource}: {info['total_blocs']} blocs dans {info['chunks_avec_ressource']} chunks"
+            if info["y_min"] is not None:
+                line += f" (Y {info['y_min']} à {info['y_max']})"
+            print(line)
+        
+        print(f"\n{'='*60}\n")
 
 
 if __name__ == "__main__":
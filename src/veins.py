@@ -0,0 +1,206 @@
+"""
+Détection des filons : composantes connexes 3D (26-connexité) des blocs trouvés.
+
+Les blocs sont étiquetés chunk par chunk (recherche vectorisée des voisins parmi
+les blocs triés), puis les composantes qui traversent une bordure de chunk sont
+fusionnées par union-find. Aucune grille dense à l'échelle du monde n'est construite.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+# Décalages (dx, dy, dz) des 26 voisins
+_NEIGHBOUR_OFFSETS = np.array(
+    [(dx, dy, dz)
+     for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+     if (dx, dy, dz) != (0, 0, 0)],
+    dtype=np.int64
+)
+
+# Empaquetage d'un bloc en clé int64 : (chunk X, chunk Z, position locale dans le chunk)
+_CHUNK_OFFSET = 1 << 21
+_Y_OFFSET = 512
+_LOCAL_BITS = 18
+
+
+@dataclass
+class Vein:
+    """
+    Filon : ensemble de blocs connexes (26-connexité).
+    """
+    size: int  # Nombre de blocs
+    centroid: Tuple[float, float, float]  # Centre (x, y, z) en coordonnées absolues
+    bbox: Tuple[int, int, int, int, int, int]  # (x_min, y_min, z_min, x_max, y_max, z_max)
+
+
+def _block_keys(xs: np.ndarray, ys: np.ndarray, zs: np.ndarray) -> np.ndarray:
+    """Clé triable (chunk, position locale) de chaque bloc."""
+    chunk_key = ((xs >> 4) + _CHUNK_OFFSET) * (2 * _CHUNK_OFFSET) + ((zs >> 4) + _CHUNK_OFFSET)
+    local_key = (xs & 15) + (zs & 15) * 16 + (ys + _Y_OFFSET) * 256
+    return (chunk_key << _LOCAL_BITS) | local_key
+
+
+def _propagate_labels(count: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Étiquette minimale par composante (propagation + saut de pointeurs)."""
+    labels = np.arange(count)
+    while len(a):
+        smallest = np.minimum(labels[a], labels[b])
+        updated = labels.copy()
+        np.minimum.at(updated, a, smallest)
+        np.minimum.at(updated, b, smallest)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    return labels
+
+
+class _UnionFind:
+    """Union-find sur des identifiants entiers (compression de chemin)."""
+
+    def __init__(self, count: int):
+        self.parent = list(range(count))
+
+    def find(self, item: int) -> int:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def find_veins_xyz(
+    xs: Sequence[int],
+    ys: Sequence[int],
+    zs: Sequence[int]
+) -> List[Vein]:
+    """
+    Regroupe des blocs (coordonnées absolues, sans doublons) en filons.
+
+    1. Composantes connexes dans chaque chunk : voisins cherchés par searchsorted
+       sur les clés triées, tous chunks traités en une seule opération vectorisée.
+    2. Les composantes reliées à travers une bordure de chunk sont fusionnées
+       par union-find.
+
+    Args:
+        xs: Coordonnées X absolues
+        ys: Coordonnées Y absolues
+        zs: Coordonnées Z absolues
+
+    Returns:
+        Liste des filons, du plus gros au plus petit
+    """
+    xs = np.asarray(xs, dtype=np.int64)
+    ys = np.asarray(ys, dtype=np.int64)
+    zs = np.asarray(zs, dtype=np.int64)
+    count = xs.size
+    if count == 0:
+        return []
+
+    keys = _block_keys(xs, ys, zs)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    # Arêtes vers les 26 voisins : dans le chunk ou à travers une bordure
+    inner_a, inner_b, cross_a, cross_b = [], [], [], []
+    local_x, local_z = xs & 15, zs & 15
+    for dx, dy, dz in _NEIGHBOUR_OFFSETS:
+        neighbour_keys = _block_keys(xs + dx, ys + dy, zs + dz)
+        pos = np.minimum(np.searchsorted(sorted_keys, neighbour_keys), count - 1)
+        found = sorted_keys[pos] == neighbour_keys
+        same_chunk = (
+            (local_x + dx >= 0) & (local_x + dx < 16) &
+            (local_z + dz >= 0) & (local_z + dz < 16)
+        )
+        inner = found & same_chunk
+        cross = found & ~same_chunk
+        inner_a.append(np.nonzero(inner)[0])
+        inner_b.append(order[pos[inner]])
+        cross_a.append(np.nonzero(cross)[0])
+        cross_b.append(order[pos[cross]])
+
+    # 1. Composantes par chunk
+    labels = _propagate_labels(count, np.concatenate(inner_a), np.concatenate(inner_b))
+    _, components = np.unique(labels, return_inverse=True)
+    components = components.reshape(-1)
+    component_count = int(components.max()) + 1
+
+    # 2. Fusion à travers les bordures de chunks
+    union = _UnionFind(component_count)
+    pairs = np.unique(np.stack([
+        components[np.concatenate(cross_a)],
+        components[np.concatenate(cross_b)]
+    ], axis=1), axis=0)
+    for a, b in pairs.tolist():
+        union.union(a, b)
+
+    roots = np.array([union.find(i) for i in range(component_count)], dtype=np.int64)
+    _, vein_of_component = np.unique(roots, return_inverse=True)
+    vein_ids = vein_of_component.reshape(-1)[components]
+    vein_count = int(vein_ids.max()) + 1
+
+    # Agrégats par filon (vectorisés)
+    sizes = np.bincount(vein_ids, minlength=vein_count)
+    centroids = np.round(np.stack([
+        np.bincount(vein_ids, weights=values, minlength=vein_count) / sizes
+        for values in (xs, ys, zs)
+    ], axis=1), 2)
+    bounds = np.empty((vein_count, 6), dtype=np.int64)
+    bounds[:, :3] = np.iinfo(np.int64).max
+    bounds[:, 3:] = np.iinfo(np.int64).min
+    for axis, values in enumerate((xs, ys, zs)):
+        np.minimum.at(bounds[:, axis], vein_ids, values)
+        np.maximum.at(bounds[:, axis + 3], vein_ids, values)
+
+    # Du plus gros au plus petit
+    order = np.argsort(-sizes, kind="stable")
+    return [
+        Vein(size=size, centroid=tuple(centroid), bbox=tuple(bbox))
+        for size, centroid, bbox in zip(
+            sizes[order].tolist(), centroids[order].tolist(), bounds[order].tolist()
+        )
+    ]
+
+
+def find_veins(locations) -> List[Vein]:
+    """
+    Regroupe des emplacements en filons.
+
+    Args:
+        locations: Emplacements (objets avec x, y, z en coordonnées absolues)
+
+    Returns:
+        Liste des filons, du plus gros au plus petit
+    """
+    unique = {(loc.x, loc.y, loc.z) for loc in locations}
+    if not unique:
+        return []
+    xs, ys, zs = zip(*unique)
+    return find_veins_xyz(xs, ys, zs)
+
+
+def vein_size_distribution(veins: List[Vein]) -> Dict[int, int]:
+    """
+    Distribution des tailles de filons.
+
+    Args:
+        veins: Liste des filons
+
+    Returns:
+        Dictionnaire taille -> nombre de filons, trié par taille
+    """
+    sizes = np.bincount([v.size for v in veins]) if veins else np.zeros(0, dtype=np.int64)
+    return {size: int(count) for size, count in enumerate(sizes.tolist()) if count}
+
+
+if __name__ == "__main__":
+    print("Module veins chargé avec succès ✓")
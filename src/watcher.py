@@ -0,0 +1,246 @@
+"""
+Mode watch : surveille les fichiers de région et ne re-décode que les chunks modifiés.
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .modern_region_reader import ModernRegionReader, read_region_header
+from .ore_index import OreIndex
+
+
+@dataclass
+class RegionState:
+    """
+    État connu d'un fichier de région : mtime et tables d'en-tête.
+    """
+    mtime_ns: int
+    locations: Tuple[int, ...]  # 1024 entrées de l'offset table
+    timestamps: Tuple[int, ...]  # 1024 timestamps de dernière sauvegarde
+
+
+@dataclass
+class WatchUpdate:
+    """
+    Résultat d'un passage de surveillance.
+    """
+    regions_checked: int = 0
+    regions_changed: int = 0
+    chunks_updated: List[Tuple[int, int]] = field(default_factory=list)
+    chunks_removed: List[Tuple[int, int]] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def changed(self) -> bool:
+        """Indique si l'index a été modifié."""
+        return bool(self.chunks_updated or self.chunks_removed)
+
+
+class RegionWatcher:
+    """
+    Surveille le dossier region et met à jour un OreIndex de façon incrémentale.
+    """
+
+    def __init__(self, reader: ModernRegionReader, index: OreIndex):
+        """
+        Initialise la surveillance.
+
+        Args:
+            reader: Lecteur de région du monde surveillé
+            index: Index des minerais à maintenir à jour
+        """
+        self.reader = reader
+        self.index = index
+        self.regions: Dict[str, RegionState] = {}
+
+    def poll(self) -> WatchUpdate:
+        """
+        Compare l'état des fichiers de région avec le dernier passage
+        et re-décode uniquement les chunks modifiés.
+
+        Returns:
+            Résumé des changements appliqués à l'index
+        """
+        start = time.perf_counter()
+        update = WatchUpdate()
+        seen = set()
+
+        for region_file in self.reader.list_region_files():
+            name = region_file.name
+            seen.add(name)
+            update.regions_checked += 1
+
+            try:
+                mtime_ns = region_file.stat().st_mtime_ns
+            except OSError:
+                continue
+
+            previous = self.regions.get(name)
+            if previous and previous.mtime_ns == mtime_ns:
+                continue  # Fichier inchangé : rien à lire
+
+            try:
+                locations, timestamps = read_region_header(region_file)
+            except OSError:
+                continue
+
+            # Slots dont l'emplacement ou le timestamp a changé
+            if previous:
+                changed_slots = [
+                    i for i in range(1024)
+                    if locations[i] != previous.locations[i]
+                    or timestamps[i] != previous.timestamps[i]
+                ]
+            else:
+                changed_slots = [i for i in range(1024) if locations[i] != 0]
+
+            self.regions[name] = RegionState(mtime_ns, locations, timestamps)
+
+            if not changed_slots:
+                continue
+
+            update.regions_changed += 1
+            self._apply_changes(region_file, locations, changed_slots, update)
+
+        # Régions supprimées : vider leurs chunks
+        for name in [n for n in self.regions if n not in seen]:
+            state = self.regions.pop(name)
+            region_x, region_z = self.reader.get_region_coordinates(Path(name))
+            for i in range(1024):
+                if state.locations[i] != 0:
+                    chunk = (region_x * 32 + i % 32, region_z * 32 + i // 32)
+                    self.index.update_chunk(chunk[0], chunk[1], None)
+                    update.chunks_removed.append(chunk)
+
+        self.index.mark_all_loaded()
+        update.duration = time.perf_counter() - start
+        return update
+
+    def _apply_changes(
+        self,
+        region_file: Path,
+        locations: Tuple[int, ...],
+        changed_slots: List[int],
+        update: WatchUpdate
+    ):
+        """Re-décode les slots modifiés d'une région et met à jour l'index."""
+        region_x, region_z = self.reader.get_region_coordinates(region_file)
+
+        present = [(i % 32, i // 32) for i in changed_slots if locations[i] != 0]
+        removed = [(i % 32, i // 32) for i in changed_slots if locations[i] == 0]
+        decoded = set()
+        failed: List[Tuple[int, int]] = []
+
+        try:
+            for nbt_data, local_x, local_z in self.reader.read_chunks(region_file, present, failed):
+                chunk_x = region_x * 32 + local_x
+                chunk_z = region_z * 32 + local_z
+                self.index.update_chunk(chunk_x, chunk_z, nbt_data)
+                update.chunks_updated.append((chunk_x, chunk_z))
+                decoded.add((local_x, local_z))
+        except OSError:
+            # Fichier illisible : forcer une relecture au prochain passage
+            self.regions.pop(region_file.name, None)
+            return
+
+        if failed:
+            # Chunks illisibles (en cours d'écriture) : oubliés de l'état connu,
+            # ils seront relus dès que le fichier changera à nouveau
+            state = self.regions[region_file.name]
+            known = list(state.locations)
+            for local_x, local_z in failed:
+                known[local_x + local_z * 32] = 0
+            state.locations = tuple(known)
+
+        # Chunks supprimés ou devenus illisibles
+        for local_x, local_z in removed + [s for s in present if s not in decoded]:
+            chunk_x = region_x * 32 + local_x
+            chunk_z = region_z * 32 + local_z
+            self.index.update_chunk(chunk_x, chunk_z, None)
+            update.chunks_removed.append((chunk_x, chunk_z))
+
+    def save_state(self, path: str) -> Path:
+        """
+        Sauvegarde l'état des régions (pour reprendre la surveillance sans tout relire).
+
+        Args:
+            path: Chemin du fichier d'état (JSON)
+
+        Returns:
+            Chemin du fichier créé
+        """
+        payload = {
+            name: {
+                "mtime_ns": state.mtime_ns,
+                "locations": list(state.locations),
+                "timestamps": list(state.timestamps)
+            }
+            for name, state in self.regions.items()
+        }
+
+        output_file = Path(path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+        tmp_file.replace(output_file)
+
+        return output_file
+
+    def load_state(self, path: str) -> bool:
+        """
+        Recharge un état sauvegardé par save_state().
+
+        Args:
+            path: Chemin du fichier d'état
+
+        Returns:
+            True si l'état a été chargé, False si le fichier n'existe pas
+        """
+        input_file = Path(path)
+        if not input_file.exists():
+            return False
+
+        with open(input_file, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+
+        self.regions = {
+            name: RegionState(
+                mtime_ns=entry["mtime_ns"],
+                locations=tuple(entry["locations"]),
+                timestamps=tuple(entry["timestamps"])
+            )
+            for name, entry in payload.items()
+        }
+        return True
+
+    def watch(
+        self,
+        interval: float = 300,
+        on_update: Optional[Callable[[WatchUpdate], None]] = None,
+        max_polls: Optional[int] = None
+    ):
+        """
+        Boucle de surveillance (bloquante).
+
+        Args:
+            interval: Délai entre deux passages (en secondes)
+            on_update: Fonction appelée après chaque passage
+            max_polls: Nombre maximal de passages (None = infini)
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            update = self.poll()
+            polls += 1
+            if on_update:
+                on_update(update)
+            if max_polls is not None and polls >= max_polls:
+                break
+            time.sleep(interval)
+
+
+if __name__ == "__main__":
+    print("Module watcher chargé avec succès ✓")
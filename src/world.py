@@ -0,0 +1,259 @@
+"""
+Accès aléatoire aux blocs d'un monde Minecraft (coordonnées absolues).
+S'appuie sur les sections décodées et mises en cache par ModernRegionReader.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .modern_region_reader import ModernRegionReader, decode_section_indices, iter_chunk_sections
+from .radius_query import group_chunks_by_region
+from .section_cache import SectionCache
+
+
+# Décalages pour empaqueter (chunk_x, chunk_z, section_y) dans un int64 positif
+_CHUNK_OFFSET = 1 << 21
+_SECTION_OFFSET = 1 << 9
+
+# Bloc utilisé pour les chunks/sections non générés (indice 0 de la palette globale)
+VOID_BLOCK = "minecraft:air"
+
+
+@dataclass
+class BlockVolume:
+    """
+    Volume de blocs extrait du monde.
+    """
+    blocks: np.ndarray  # Indices dans la palette globale (uint16), axes (y, z, x)
+    palette: List[str]  # Palette globale (indice -> nom du bloc)
+    origin: Tuple[int, int, int]  # Coin minimal (x, y, z) en coordonnées absolues
+
+    @property
+    def size(self) -> Tuple[int, int, int]:
+        """Dimensions (x, y, z) du volume."""
+        size_y, size_z, size_x = self.blocks.shape
+        return size_x, size_y, size_z
+
+    def block_at(self, x: int, y: int, z: int) -> str:
+        """
+        Retourne le nom du bloc à une position absolue du volume.
+
+        Args:
+            x: Coordonnée X absolue
+            y: Coordonnée Y absolue
+            z: Coordonnée Z absolue
+
+        Returns:
+            ID du bloc (ex: "minecraft:stone")
+        """
+        x0, y0, z0 = self.origin
+        return self.palette[self.blocks[y - y0, z - z0, x - x0]]
+
+
+class World:
+    """
+    Vue d'un monde Minecraft permettant de lire n'importe quel bloc.
+    """
+
+    def __init__(self, world_path: str, section_cache: Optional[SectionCache] = None):
+        """
+        Initialise l'accès au monde.
+
+        Args:
+            world_path: Chemin vers le monde Minecraft
+            section_cache: Cache de sections partagé (défaut: un cache propre au monde)
+        """
+        self.reader = ModernRegionReader(world_path, section_cache=section_cache)
+
+    def get_block(self, x: int, y: int, z: int) -> Optional[str]:
+        """
+        Retourne l'ID exact du bloc à une position absolue.
+
+        Args:
+            x: Coordonnée X absolue
+            y: Coordonnée Y absolue
+            z: Coordonnée Z absolue
+
+        Returns:
+            ID du bloc (ex: "minecraft:diamond_ore") ou None si le chunk/la section n'existe pas
+        """
+        section = self.reader.get_section(x >> 4, z >> 4, y >> 4)
+        if section is None:
+            return None
+        return section.block_at(x & 15, y & 15, z & 15)
+
+    def get_blocks(
+        self,
+        xs: Sequence[int],
+        ys: Sequence[int],
+        zs: Sequence[int]
+    ) -> List[Optional[str]]:
+        """
+        Retourne les IDs des blocs à plusieurs positions absolues.
+
+        Les positions sont regroupées par chunk et par section : chaque section
+        n'est décodée qu'une fois, puis les blocs sont lus en une opération vectorisée.
+
+        Args:
+            xs: Coordonnées X absolues
+            ys: Coordonnées Y absolues
+            zs: Coordonnées Z absolues
+
+        Returns:
+            Liste des IDs de blocs (None pour les positions hors du monde), dans l'ordre d'entrée
+        """
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        zs = np.asarray(zs, dtype=np.int64)
+
+        if not (xs.shape == ys.shape == zs.shape):
+            raise ValueError("xs, ys et zs doivent avoir la même taille")
+
+        result: List[Optional[str]] = [None] * xs.size
+        if xs.size == 0:
+            return result
+
+        # Clé (chunk_x, chunk_z, section_y) de chaque position, empaquetée en un entier
+        chunk_xs = xs >> 4
+        chunk_zs = zs >> 4
+        section_ys = ys >> 4
+        keys = (
+            ((chunk_xs + _CHUNK_OFFSET) << 32)
+            | ((chunk_zs + _CHUNK_OFFSET) << 10)
+            | (section_ys + _SECTION_OFFSET)
+        )
+        unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        # Indice linéaire dans la section (x + z*16 + y*256)
+        linear = (xs & 15) + (zs & 15) * 16 + (ys & 15) * 256
+
+        # Regrouper les positions par section (tri stable par groupe)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique_keys) + 1))
+        sections = zip(chunk_xs[first].tolist(), chunk_zs[first].tolist(), section_ys[first].tolist())
+
+        for group, (chunk_x, chunk_z, section_y) in enumerate(sections):
+            section = self.reader.get_section(chunk_x, chunk_z, section_y)
+            if section is None:
+                continue
+
+            positions = order[bounds[group]:bounds[group + 1]]
+            palette = np.asarray(section.palette, dtype=object)
+            names = palette[section.indices[linear[positions]]]
+
+            for position, name in zip(positions.tolist(), names.tolist()):
+                result[position] = name
+
+        return result
+
+    def extract_volume(
+        self,
+        x0: int,
+        y0: int,
+        z0: int,
+        x1: int,
+        y1: int,
+        z1: int,
+        out_path: Optional[str] = None
+    ) -> BlockVolume:
+        """
+        Extrait tous les blocs d'une boîte (bornes incluses) dans un tableau dense.
+
+        Seules les sections qui recoupent la boîte sont décodées ; chaque section est
+        convertie vers la palette globale puis copiée d'un bloc dans le tableau.
+        Les chunks et sections non générés sont remplis avec VOID_BLOCK (indice 0).
+
+        Args:
+            x0, y0, z0: Premier coin de la boîte (coordonnées absolues)
+            x1, y1, z1: Coin opposé de la boîte (coordonnées absolues)
+            out_path: Fichier .npy à écrire en memmap (pour les volumes plus grands
+                que la RAM) ; la palette est écrite à côté (<fichier>.palette.json)
+
+        Returns:
+            Volume extrait (tableau uint16 d'axes (y, z, x) + palette globale)
+        """
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+        z0, z1 = min(z0, z1), max(z0, z1)
+        shape = (y1 - y0 + 1, z1 - z0 + 1, x1 - x0 + 1)
+
+        if out_path:
+            output_file = Path(out_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            # Le fichier est créé creux : les zones non écrites valent 0 (VOID_BLOCK)
+            blocks = np.lib.format.open_memmap(output_file, mode="w+", dtype=np.uint16, shape=shape)
+        else:
+            blocks = np.zeros(shape, dtype=np.uint16)
+
+        palette: List[str] = [VOID_BLOCK]
+        palette_index: Dict[str, int] = {VOID_BLOCK: 0}
+
+        chunks = [
+            (chunk_x, chunk_z)
+            for chunk_x in range(x0 >> 4, (x1 >> 4) + 1)
+            for chunk_z in range(z0 >> 4, (z1 >> 4) + 1)
+        ]
+
+        for (region_x, region_z), slots in group_chunks_by_region(chunks).items():
+            region_file = self.reader.get_region_file(region_x, region_z)
+            if not self.reader.has_region(region_file):
+                continue
+
+            for nbt_data, local_x, local_z in self.reader.read_chunks(region_file, slots):
+                chunk_x = region_x * 32 + local_x
+                chunk_z = region_z * 32 + local_z
+
+                # Intersection de la boîte avec la colonne du chunk (coordonnées locales)
+                lx0, lx1 = max(x0 - chunk_x * 16, 0), min(x1 - chunk_x * 16, 15)
+                lz0, lz1 = max(z0 - chunk_z * 16, 0), min(z1 - chunk_z * 16, 15)
+                dest_x = chunk_x * 16 + lx0 - x0
+                dest_z = chunk_z * 16 + lz0 - z0
+
+                # Format 1.18+ (sections) ou 1.13-1.17 (Level/Sections)
+                for section_y, names, data_array, spanning in iter_chunk_sections(nbt_data):
+                    base_y = section_y * 16
+                    if base_y + 15 < y0 or base_y > y1:
+                        continue
+
+                    ly0, ly1 = max(y0 - base_y, 0), min(y1 - base_y, 15)
+                    dest_y = base_y + ly0 - y0
+                    target = blocks[
+                        dest_y:dest_y + ly1 - ly0 + 1,
+                        dest_z:dest_z + lz1 - lz0 + 1,
+                        dest_x:dest_x + lx1 - lx0 + 1
+                    ]
+
+                    # Palette locale -> palette globale
+                    remap = np.empty(len(names), dtype=np.uint16)
+                    for i, name in enumerate(names):
+                        if name not in palette_index:
+                            palette_index[name] = len(palette)
+                            palette.append(name)
+                        remap[i] = palette_index[name]
+
+                    if len(names) == 1:
+                        target[...] = remap[0]
+                        continue
+
+                    indices = decode_section_indices(data_array, len(names), spanning)
+                    cube = indices.reshape(16, 16, 16)
+                    target[...] = remap[cube[ly0:ly1 + 1, lz0:lz1 + 1, lx0:lx1 + 1]]
+
+        volume = BlockVolume(blocks=blocks, palette=palette, origin=(x0, y0, z0))
+
+        if out_path:
+            blocks.flush()
+            palette_file = output_file.with_name(output_file.name + ".palette.json")
+            with open(palette_file, 'w', encoding='utf-8') as f:
+                json.dump({"origine": [x0, y0, z0], "palette": palette}, f, indent=2)
+
+        return volume
+
+
+if __name__ == "__main__":
+    print("Module world chargé avec succès ✓")
@@ -4,7 +4,6 @@ Débogue ce qui se trouve à une position spécifique
 """
 
 from src.modern_region_reader import ModernRegionReader
-import math
 
 # Position à vérifier
 TEST_X = -72
@@ -37,93 +36,65 @@ ALL_ORES = [
     'minecraft:emerald_ore', 'minecraft:deepslate_emerald_ore',
 ]
 
-for nbt_data, cx, cz in reader.iterate_chunks(show_progress=False):
-    if cx != chunk_x or cz != chunk_z:
-        continue
+# Lecture directe de la section (décodée une fois puis servie par le cache)
+section = reader.get_section(chunk_x, chunk_z, section_y)
+
+if section is None:
+    print(f"❌ Section Y={section_y} introuvable dans le chunk ({chunk_x}, {chunk_z})")
+else:
+    print(f"✓ Section Y={section_y} trouvée\n")
     
-    print(f"✓ Chunk trouvé\n")
+    print(f"🎨 Palette ({len(section.palette)} blocs):")
+    for idx, name in enumerate(section.palette):
+        print(f"   [{idx:2}] {name}")
+    print()
     
-    sections = nbt_data.get('sections')
-    for section in sections:
-        if section.get('Y').value != section_y:
-            continue
-        
-        print(f"✓ Section Y={section_y} trouvée\n")
-        
-        block_states = section.get('block_states')
-        if not block_states:
-            print("❌ Pas de block_states")
-            break
-        
-        palette = block_states.get('palette')
-        if not palette:
-            print("❌ Pas de palette")
-            break
-        
-        print(f"🎨 Palette ({len(palette)} blocs):")
-        for idx, block in enumerate(palette):
-            name = block.get('Name').value
-            print(f"   [{idx:2}] {name}")
-        print()
-        
-        # Décoder
-        data = block_states.get('data')
-        if not data:
-            print("⚠️  Palette unique (1 seul type de bloc)")
-            if len(palette) == 1:
-                print(f"   Bloc unique: {palette[0].get('Name').value}")
-            break
-        
-        if hasattr(data[0], 'value'):
-            data_array = [v.value for v in data]
-        else:
-            data_array = list(data)
-        
-        indices = reader._decode_block_states(data_array, len(palette))
-        
-        # Calculer l'indice linéaire de la position
-        linear_idx = local_x + local_z*16 + local_y*256
-        
-        print(f"🎯 À la position locale ({local_x}, {local_y}, {local_z}):")
-        print(f"   Indice linéaire: {linear_idx}")
-        print(f"   Palette index: {indices[linear_idx]}")
-        print(f"   ✅ BLOC TROUVÉ: {palette[indices[linear_idx]].get('Name').value}")
-        print()
-        
-        # Chercher tous les minerais dans un rayon de 3 blocs
-        print("🔍 Minerais dans un rayon de 3 blocs:")
-        found_nearby = []
-        
-        for i, pal_idx in enumerate(indices):
-            block_name = palette[pal_idx].get('Name').value
-            if block_name in ALL_ORES:
-                x_loc = i % 16
-                z_loc = (i // 16) % 16
-                y_loc = i // 256
-                
-                abs_x = chunk_x * 16 + x_loc
-                abs_y = section_y * 16 + y_loc
-                abs_z = chunk_z * 16 + z_loc
-                
+    if len(section.palette) == 1:
+        print("⚠️  Palette unique (1 seul type de bloc)")
+        print(f"   Bloc unique: {section.palette[0]}")
+    
+    # Calculer l'indice linéaire de la position
+    linear_idx = local_x + local_z*16 + local_y*256
+    
+    print(f"🎯 À la position locale ({local_x}, {local_y}, {local_z}):")
+    print(f"   Indice linéaire: {linear_idx}")
+    print(f"   Palette index: {section.indices[linear_idx]}")
+    print(f"   ✅ BLOC TROUVÉ: {section.block_at(local_x, local_y, local_z)}")
+    print()
+    
+    # Chercher tous les minerais dans un rayon de 3 blocs (sections voisines incluses)
+    print("🔍 Minerais dans un rayon de 3 blocs:")
+    found_nearby = []
+    
+    for abs_x in range(TEST_X - 3, TEST_X + 4):
+        for abs_y in range(TEST_Y - 3, TEST_Y + 4):
+            for abs_z in range(TEST_Z - 3, TEST_Z + 4):
                 dist = ((abs_x - TEST_X)**2 + (abs_y - TEST_Y)**2 + (abs_z - TEST_Z)**2)**0.5
+                if dist > 3:
+                    continue
+                
+                neighbour = reader.get_section(abs_x // 16, abs_z // 16, abs_y // 16)
+                if neighbour is None:
+                    continue
                 
-                if dist <= 3:
+                block_name = neighbour.block_at(abs_x % 16, abs_y % 16, abs_z % 16)
+                if block_name in ALL_ORES:
                     found_nearby.append({
                         'x': abs_x, 'y': abs_y, 'z': abs_z,
                         'dist': dist, 'type': block_name
                     })
-        
-        found_nearby.sort(key=lambda b: b['dist'])
-        
-        if found_nearby:
-            for ore in found_nearby:
-                ore_type = ore['type'].replace('minecraft:', '').replace('_ore', '')
-                print(f"   • {ore_type:20} à X={ore['x']:4}, Y={ore['y']:3}, Z={ore['z']:4} "
-                      f"(dist={ore['dist']:.1f}m)")
-        else:
-            print("   Aucun minerai trouvé à proximité")
-        
-        break
-    break
+    
+    found_nearby.sort(key=lambda b: b['dist'])
+    
+    if found_nearby:
+        for ore in found_nearby:
+            ore_type = ore['type'].replace('minecraft:', '').replace('_ore', '')
+            print(f"   • {ore_type:20} à X={ore['x']:4}, Y={ore['y']:3}, Z={ore['z']:4} "
+                  f"(dist={ore['dist']:.1f}m)")
+    else:
+        print("   Aucun minerai trouvé à proximité")
+
+cache_stats = reader.section_cache.stats()
+print(f"\n🧠 Cache de sections: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
 
 print("\n✓ Terminé")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Vérifier que les scans concurrents d'une archive (.zip, .tar, .tar.gz) trouvent
+exactement les mêmes blocs qu'un scan séquentiel du dossier du monde
+"""
+
+import asyncio
+import sys
+import tarfile
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.backend_benchmark import write_synthetic_world
+from src.resource_finder import ResourceFinder
+
+RESOURCE = "coal"
+RUNS = 3
+
+
+def build_world(root: Path) -> Path:
+    """Monde synthétique de trois régions (r.0.0, r.1.0, r.0.1)."""
+    world = root / "world"
+    for seed, name in enumerate(["r.0.0.mca", "r.1.0.mca", "r.0.1.mca"]):
+        region_file = write_synthetic_world(str(root / f"tmp{seed}"), chunks=48, seed=seed)
+        target = world / "region" / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        region_file.replace(target)
+    return world
+
+
+def build_archives(root: Path, world: Path) -> dict:
+    """Copies du monde en .zip, .tar et .tar.gz."""
+    archives = {"dossier": world}
+    with zipfile.ZipFile(root / "world.zip", "w", zipfile.ZIP_DEFLATED) as zf:
+        for region_file in sorted((world / "region").glob("*.mca")):
+            zf.write(region_file, f"world/region/{region_file.name}")
+    archives["zip"] = root / "world.zip"
+    for suffix, mode in ((".tar", "w"), (".tar.gz", "w:gz")):
+        with tarfile.open(root / f"world{suffix}", mode) as tf:
+            tf.add(world, arcname="world")
+        archives[suffix] = root / f"world{suffix}"
+    return archives
+
+
+def key(locations) -> list:
+    return sorted((loc.x, loc.y, loc.z, loc.block_id) for loc in locations)
+
+
+async def scan_async(path: Path, executor: ThreadPoolExecutor) -> list:
+    finder = ResourceFinder(str(path), write_summaries=False)
+    return key([loc async for loc in finder.iter_locations_async(RESOURCE, executor=executor, max_pending=3)])
+
+
+def main() -> int:
+    print("🔍 Scans concurrents des archives\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        world = build_world(root)
+        reference = key(ResourceFinder(str(world), write_summaries=False)
+                        .collect_locations(RESOURCE, show_progress=False))
+        print(f"Référence (dossier, séquentiel): {len(reference)} blocs\n")
+
+        failures = 0
+        executor = ThreadPoolExecutor(4)
+        for label, path in build_archives(root, world).items():
+            sequential = key(ResourceFinder(str(path), write_summaries=False)
+                             .collect_locations(RESOURCE, show_progress=False))
+            concurrent = [asyncio.run(scan_async(path, executor)) for _ in range(RUNS)]
+            ok = sequential == reference and all(result == reference for result in concurrent)
+            failures += not ok
+            print(f"{'✓' if ok else '❌'} {label:8} séquentiel: {len(sequential)}, "
+                  f"concurrent: {', '.join(str(len(result)) for result in concurrent)}")
+        executor.shutdown()
+
+    print("\n✓ Vérification terminée" if not failures else f"\n❌ {failures} copie(s) incohérente(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Vérifier que World.extract_volume() donne les mêmes blocs que World.get_block(),
+pour les chunks 1.18+ (sections) comme 1.13-1.17 (Level/Sections)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.backend_benchmark import write_synthetic_world
+from src.world import VOID_BLOCK, World
+
+# DataVersion -> format
+CASES = {
+    2975: "1.18.2 (sections)",
+    2586: "1.16.5 (Level/Sections)",
+    2230: "1.15.2 (Level/Sections, indices chevauchants)",
+}
+
+# Boîte à cheval sur plusieurs chunks et sections
+BOX = (5, 0, 7, 40, 130, 40)
+
+
+def check(world_path: str) -> tuple:
+    """Compare le volume extrait à get_block() sur une grille de positions."""
+    world = World(world_path)
+    x0, y0, z0, x1, y1, z1 = BOX
+    volume = world.extract_volume(*BOX)
+    checked = mismatches = 0
+    for y in range(y0, y1 + 1, 5):
+        for z in range(z0, z1 + 1, 3):
+            for x in range(x0, x1 + 1, 3):
+                expected = world.get_block(x, y, z) or VOID_BLOCK
+                checked += 1
+                mismatches += volume.block_at(x, y, z) != expected
+    return volume, checked, mismatches
+
+
+def main() -> int:
+    print("🔍 Extraction de volumes\n")
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for data_version, label in CASES.items():
+            world_path = Path(tmp) / f"world_{data_version}"
+            write_synthetic_world(str(world_path), chunks=1024, data_version=data_version, seed=1)
+            volume, checked, mismatches = check(str(world_path))
+            filled = int((volume.blocks != 0).sum())
+            ok = mismatches == 0 and filled > 0
+            failures += not ok
+            print(f"{'✓' if ok else '❌'} {label}: {len(volume.palette)} blocs dans la palette, "
+                  f"{filled} cellules non vides, {mismatches}/{checked} différence(s)")
+
+    print("\n✓ Vérification terminée" if not failures else f"\n❌ {failures} format(s) incorrect(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())